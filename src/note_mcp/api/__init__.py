@@ -7,6 +7,7 @@ from note_mcp.api.articles import (
     create_draft,
     delete_all_drafts,
     delete_draft,
+    iter_articles,
     list_articles,
     publish_article,
     update_article,
@@ -19,6 +20,7 @@ __all__ = [
     "create_draft",
     "delete_all_drafts",
     "delete_draft",
+    "iter_articles",
     "list_articles",
     "publish_article",
     "update_article",
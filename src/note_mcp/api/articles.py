@@ -5,15 +5,24 @@ Provides functions for creating, updating, and managing articles.
 
 from __future__ import annotations
 
+import asyncio
 import html
 import logging
-import uuid
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import aclosing
 from typing import TYPE_CHECKING, Any
 
+import httpx
+
 from note_mcp.api.client import NoteAPIClient
-from note_mcp.api.embeds import resolve_embed_keys
+from note_mcp.api.element_ids import new_element_id
+from note_mcp.api.embeds import has_unresolved_embeds, resolve_embed_keys, seed_embed_key_cache
+from note_mcp.api.id_cache import get_note_id_cache, remember_note_id
 from note_mcp.api.images import _resolve_numeric_note_id
+from note_mcp.api.markdown_cache import get_converted_markdown_cache
+from note_mcp.api.mirror import forget_mirrored_article, get_article_mirror
+from note_mcp.api.save_cache import content_digest, get_saved_content_cache
+from note_mcp.api.search_index import index_article, remove_indexed_article, update_indexed_status
 from note_mcp.models import (
     Article,
     ArticleInput,
@@ -24,11 +33,14 @@ from note_mcp.models import (
     DeletePreview,
     DeleteResult,
     ErrorCode,
+    MirrorSyncResult,
     NoteAPIError,
     Session,
     from_api_response,
 )
 from note_mcp.utils import markdown_to_html
+from note_mcp.utils.conversion_pool import run_conversion
+from note_mcp.utils.html_to_markdown import html_to_markdown
 
 if TYPE_CHECKING:
     pass
@@ -74,6 +86,7 @@ async def _execute_post[T](
     response_parser: Callable[[dict[str, Any]], T],
     *,
     payload: dict[str, Any] | None = None,
+    retry: bool | None = None,
 ) -> T:
     """Execute POST request and parse response.
 
@@ -87,6 +100,8 @@ async def _execute_post[T](
         endpoint: API endpoint path
         response_parser: Function to parse response dict into result type
         payload: JSON payload for request (optional, defaults to None)
+        retry: Retry transient failures (only for requests that are safe
+            to repeat, e.g. draft_save)
 
     Returns:
         Parsed result of type T
@@ -95,7 +110,7 @@ async def _execute_post[T](
         NoteAPIError: If API request fails (401, 403, 404, 429, 5xx)
     """
     async with NoteAPIClient(session) as client:
-        response = await client.post(endpoint, json=payload)
+        response = await client.post(endpoint, json=payload, retry=retry)
     return response_parser(response)
 
 
@@ -142,6 +157,16 @@ DELETE_ALL_DRAFTS_MAX_PAGES: int = 100
 # Number of articles to show in preview when confirm=False
 DELETE_ALL_DRAFTS_PREVIEW_LIMIT: int = 10
 
+# Maximum number of DELETE requests in flight at once
+# (requests are additionally throttled by the per-account rate limiter)
+DELETE_ALL_DRAFTS_CONCURRENCY: int = 4
+
+# Progress callback for delete_all_drafts: awaited with (completed, total)
+DeleteProgressCallback = Callable[[int, int], Awaitable[None]]
+
+# Maximum number of article fetches in flight during a mirror sync
+MIRROR_SYNC_CONCURRENCY: int = 4
+
 
 def generate_image_html(
     image_url: str,
@@ -163,7 +188,7 @@ def generate_image_html(
     Returns:
         HTML string: <figure name="..." id="..."><img ...><figcaption>...</figcaption></figure>
     """
-    element_id = str(uuid.uuid4())
+    element_id = new_element_id()
     # Escape caption and URL to prevent XSS attacks
     escaped_caption = html.escape(caption)
     escaped_url = html.escape(image_url)
@@ -272,6 +297,8 @@ async def update_article_raw_html(
     """
     # Resolve to numeric ID (API requirement)
     numeric_id = await _resolve_numeric_note_id(session, article_id)
+    forget_mirrored_article(session.user_id, article_id)
+    get_saved_content_cache().forget(article_id)
 
     # Build payload with raw HTML body (no conversion)
     payload: dict[str, Any] = {
@@ -287,13 +314,42 @@ async def update_article_raw_html(
     if hashtags:
         payload["hashtags"] = hashtags
 
-    return await _execute_post(
+    article = await _execute_post(
         session,
         f"/v1/text_notes/draft_save?id={numeric_id}&is_temp_saved=true",
         _create_draft_save_parser(article_id, numeric_id, title, html_body),
         payload=payload,
+        retry=True,
     )
 
+    # No Markdown is at hand: keep the indexed body until the next fetch or sync
+    index_article(
+        session.user_id,
+        article.key or get_note_id_cache().get_key(numeric_id),
+        title,
+        tags or [],
+        None,
+    )
+    return article
+
+
+def _article_from_api(data: dict[str, Any]) -> Article:
+    """Create an Article from note.com API data and record its key/ID pair.
+
+    Args:
+        data: Raw article dictionary from an API response
+
+    Returns:
+        Article instance
+
+    Raises:
+        NoteAPIError: If required fields (id, key, status) are missing or invalid
+    """
+    article = from_api_response(data)
+    # Record the key/ID pair for _resolve_numeric_note_id
+    remember_note_id(article.key, article.id)
+    return article
+
 
 def _parse_article_response(response: dict[str, Any]) -> Article:
     """Parse API response and convert to Article.
@@ -317,7 +373,7 @@ def _parse_article_response(response: dict[str, Any]) -> Article:
             message="Invalid API response: missing 'data' key",
             details={"response": response},
         )
-    return from_api_response(article_data)
+    return _article_from_api(article_data)
 
 
 def _normalize_tags(tags: list[str] | None) -> list[dict[str, Any]] | None:
@@ -495,9 +551,66 @@ def _parse_create_response(response: dict[str, Any]) -> tuple[str, str, dict[str
             details={"article_id": article_id, "response": response},
         )
 
+    remember_note_id(article_key, article_id)
     return str(article_id), str(article_key), article_data
 
 
+def _draft_from_create_response(article_data: dict[str, Any]) -> Article:
+    """Build the Article returned for a newly created draft.
+
+    Note: POST /v1/text_notes returns empty 'status' field for newly created articles.
+    Since the entry is always created as a draft, we set status to 'draft' explicitly.
+    This is Article 6 compliant: we know the expected state from the function's semantics.
+
+    Args:
+        article_data: "data" object from the /v1/text_notes response
+
+    Returns:
+        Article object for the created draft
+    """
+    status_str = article_data.get("status")
+    if not status_str:
+        logger.warning(
+            "create_draft API returned empty status, setting to 'draft'. Response: %s",
+            article_data,
+        )
+        article_data["status"] = ArticleStatus.DRAFT.value
+
+    return _article_from_api(article_data)
+
+
+async def create_article_entry(
+    session: Session,
+    article_input: ArticleInput,
+) -> Article:
+    """Create an empty draft article entry (POST /v1/text_notes only).
+
+    The body is not sent. Use this when the body has to be prepared with the
+    article ID or key (image uploads, embed registration) and then saved once
+    with update_article().
+
+    Args:
+        session: Authenticated session
+        article_input: Article content and metadata (body is ignored)
+
+    Returns:
+        Created Article object (without body)
+
+    Raises:
+        NoteAPIError: If API request fails
+    """
+    _, _, article_data = await _execute_post(
+        session,
+        "/v1/text_notes",
+        _parse_create_response,
+        payload=_build_article_payload(article_input, include_body=False),
+    )
+    forget_mirrored_article(session.user_id)
+    article = _draft_from_create_response(article_data)
+    index_article(session.user_id, article.key, article_input.title, article_input.tags, "", ArticleStatus.DRAFT)
+    return article
+
+
 async def create_draft(
     session: Session,
     article_input: ArticleInput,
@@ -527,7 +640,7 @@ async def create_draft(
         NoteAPIError: If API request fails
     """
     # Convert Markdown to HTML for API (embeds get random keys initially)
-    html_body = markdown_to_html(article_input.body)
+    html_body = await run_conversion(markdown_to_html, article_input.body)
 
     # Step 1 payload: without body to avoid sanitization
     create_payload = _build_article_payload(article_input, include_body=False)
@@ -553,27 +666,25 @@ async def create_draft(
         await client.post(
             f"/v1/text_notes/draft_save?id={article_id}&is_temp_saved=true",
             json=save_payload,
+            # draft_save overwrites the whole draft, so repeating it is safe
+            retry=True,
         )
 
-    # Parse response
-    # Note: POST /v1/text_notes returns empty 'status' field for newly created articles.
-    # Since this function specifically creates drafts, we set status to 'draft' explicitly.
-    # This is Article 6 compliant: we know the expected state from the function's semantics.
-    status_str = article_data.get("status")
-    if not status_str:
-        logger.warning(
-            "create_draft API returned empty status, setting to 'draft'. Response: %s",
-            article_data,
-        )
-        article_data["status"] = ArticleStatus.DRAFT.value
-
-    return from_api_response(article_data)
+    forget_mirrored_article(session.user_id)
+    index_article(
+        session.user_id, article_key, article_input.title, article_input.tags, article_input.body, ArticleStatus.DRAFT
+    )
+    article = _draft_from_create_response(article_data)
+    get_saved_content_cache().put(article_key, content_digest(article_input), article)
+    return article
 
 
 async def update_article(
     session: Session,
     article_id: str,
     article_input: ArticleInput,
+    *,
+    force: bool = False,
 ) -> Article:
     """Update an existing article.
 
@@ -582,24 +693,41 @@ async def update_article(
     Embed URLs (YouTube, Twitter, note.com) are processed to obtain
     server-registered keys required for iframe rendering.
 
+    If the title, tags and body are identical to what this process last
+    saved for the article, the save is skipped and the previous result is
+    returned without any API call, with unchanged set to True. Saves that
+    left embeds with placeholder keys are not skipped, so the embed
+    registration is retried.
+
     Args:
         session: Authenticated session
         article_id: ID of the article to update (numeric or key format)
         article_input: New article content and metadata
+        force: Save even if the content is unchanged
 
     Returns:
-        Updated Article object
+        Updated Article object (unchanged is True if the save was skipped)
 
     Raises:
         NoteAPIError: If API request fails
     """
     from note_mcp.api.embeds import _EMBED_FIGURE_PATTERN
 
+    # Skip the save when the content matches the last save of this article
+    saved_content_cache = get_saved_content_cache()
+    digest = content_digest(article_input)
+    if not force:
+        saved = saved_content_cache.get(article_id, digest)
+        if saved is not None:
+            logger.debug(f"Article {article_id} is unchanged since the last save, skipping draft_save")
+            return saved.model_copy(update={"unchanged": True})
+
     # Resolve to numeric ID (API requirement)
     numeric_id = await _resolve_numeric_note_id(session, article_id)
+    forget_mirrored_article(session.user_id, article_id)
 
     # Convert Markdown to HTML for API (embeds get random keys initially)
-    html_body = markdown_to_html(article_input.body)
+    html_body = await run_conversion(markdown_to_html, article_input.body)
 
     # Check if HTML contains embeds that need key resolution
     # Issue #146: Only fetch article key when embeds are present
@@ -613,10 +741,15 @@ async def update_article(
         # Resolve article key for embed resolution
         article_key = article_id if _is_article_key_format(article_id) else ""
 
+        if not article_key:
+            # Numeric ID: use the cached key if this article was seen before
+            article_key = get_note_id_cache().get_key(str(numeric_id)) or ""
+            article_key_for_result = article_key
+
         if not article_key:
             # Numeric ID: fetch article to get key since draft_save doesn't return it
             # Issue #155: draft_save returns {result, note_days_count, updated_at}, not article data
-            fetched_article = await get_article_via_api(session, str(numeric_id))
+            fetched_article = await get_article_via_api(session, str(numeric_id), include_body=False)
             article_key = fetched_article.key
             # Preserve fetched key in result (Issue #155 review feedback)
             article_key_for_result = article_key
@@ -636,7 +769,7 @@ async def update_article(
     # Build payload and save via draft_save endpoint
     payload = _build_article_payload(article_input, final_html)
 
-    return await _execute_post(
+    article = await _execute_post(
         session,
         f"/v1/text_notes/draft_save?id={numeric_id}&is_temp_saved=true",
         _create_draft_save_parser(
@@ -647,23 +780,46 @@ async def update_article(
             article_key_for_result,
         ),
         payload=payload,
+        retry=True,
+    )
+    index_article(
+        session.user_id,
+        article.key or get_note_id_cache().get_key(numeric_id),
+        article_input.title,
+        article_input.tags,
+        article_input.body,
     )
+    # Keep retrying the save while embeds are left unregistered
+    if not has_unresolved_embeds(final_html):
+        saved_content_cache.put(article_id, digest, article)
+    return article
 
 
 async def get_article_via_api(
     session: Session,
     article_id: str,
+    *,
+    include_body: bool = True,
 ) -> Article:
     """Get article content by ID via API.
 
     Retrieves article content directly from the note.com API.
     Faster and more reliable than browser-based retrieval.
+    The result is recorded in the local article mirror when it is enabled.
+
+    The Markdown of each article version is cached by key and updated_at
+    (see api.markdown_cache), so reading an unchanged article again skips the
+    HTML to Markdown conversion.
 
     Args:
         session: Authenticated session
         article_id: Article key (e.g., "n1234567890ab").
             Note: Key format is required due to note.com API limitations.
             The /v3/notes/ endpoint does not support numeric IDs.
+        include_body: Convert the body to Markdown. With False only the
+            metadata (ID, key, title, status, tags, dates, URL) is returned,
+            the body is empty and the article is not mirrored. Only its status
+            is refreshed in the search index.
 
     Returns:
         Article object with title, body (as Markdown), and status
@@ -671,43 +827,30 @@ async def get_article_via_api(
     Raises:
         NoteAPIError: If API request fails or numeric ID is provided
     """
-    # Issue #154: /v3/notes/ endpoint does not support numeric IDs
-    if article_id.isdigit():
-        raise NoteAPIError(
-            code=ErrorCode.INVALID_INPUT,
-            message=(
-                f"Numeric article ID '{article_id}' is not supported. "
-                "Please use the article key format (e.g., 'n1234567890ab'). "
-                "You can get the article key from create_draft() or list_articles()."
-            ),
-            details={"article_id": article_id},
-        )
-
-    from note_mcp.utils.html_to_markdown import html_to_markdown
+    # Issue #154: numeric IDs are rejected by get_article_raw_html()
+    article = await get_article_raw_html(session, article_id)
 
-    article = await _execute_get(
-        session,
-        f"/v3/notes/{article_id}",
-        _parse_article_response,
-    )
+    # Remember the embed keys already registered for this article
+    seed_embed_key_cache(article.key, article.body)
 
-    # Issue #209: Check if article was deleted
-    # note.com API returns status='deleted' instead of 404 for deleted articles.
-    # We treat this as ARTICLE_NOT_FOUND because the content is no longer accessible.
-    if article.status == ArticleStatus.DELETED:
-        raise NoteAPIError(
-            code=ErrorCode.ARTICLE_NOT_FOUND,
-            message="Article has been deleted (status='deleted')",
-            details={"article_id": article_id},
-        )
+    if not include_body:
+        update_indexed_status(session.user_id, article.key, article.status)
+        return article.model_copy(update={"body": ""})
 
     # Convert HTML body to Markdown for consistent output
+    markdown = await _body_markdown(article)
+
+    mirror = get_article_mirror(session.user_id)
+    if mirror is not None:
+        mirror.store(article, markdown)
+    index_article(session.user_id, article.key, article.title, article.tags, markdown, article.status)
+
     if article.body:
         article = Article(
             id=article.id,
             key=article.key,
             title=article.title,
-            body=html_to_markdown(article.body),
+            body=markdown,
             status=article.status,
             tags=article.tags,
             eyecatch_image_key=article.eyecatch_image_key,
@@ -721,13 +864,38 @@ async def get_article_via_api(
     return article
 
 
+async def _body_markdown(article: Article) -> str:
+    """Convert an article's HTML body to Markdown, reusing cached conversions.
+
+    Large bodies are converted in the conversion pool (see utils.conversion_pool).
+
+    Args:
+        article: Article with raw HTML body
+
+    Returns:
+        Markdown body ("" for an empty body)
+    """
+    if not article.body:
+        return ""
+    if not article.key or not article.updated_at:
+        return await run_conversion(html_to_markdown, article.body)
+
+    cache = get_converted_markdown_cache()
+    markdown = cache.get(article.key, article.updated_at, article.body)
+    if markdown is None:
+        markdown = await run_conversion(html_to_markdown, article.body)
+        cache.put(article.key, article.updated_at, article.body, markdown)
+    return markdown
+
+
 async def get_article(
     session: Session,
     article_id: str,
 ) -> Article:
     """Get article content by ID.
 
-    Retrieves article content via API.
+    Retrieves article content via API, or from the local article mirror
+    when it is enabled and holds the article.
     Use this to retrieve existing content before editing.
 
     Recommended workflow:
@@ -745,9 +913,128 @@ async def get_article(
     Raises:
         NoteAPIError: If API request fails
     """
+    mirror = get_article_mirror(session.user_id)
+    if mirror is not None:
+        mirrored = mirror.get_article(article_id)
+        if mirrored is not None:
+            index_article(session.user_id, mirrored.key, mirrored.title, mirrored.tags, mirrored.body, mirrored.status)
+            return mirrored
     return await get_article_via_api(session, article_id)
 
 
+# Endpoint listing the authenticated user's drafts and published articles
+NOTE_LIST_PATH = "/v2/note_list/contents"
+
+
+async def _fetch_note_list_page(
+    client: NoteAPIClient,
+    status: ArticleStatus | None,
+    page: int,
+) -> dict[str, Any]:
+    """Fetch one page of the note_list endpoint.
+
+    Args:
+        client: Open API client
+        status: Filter by article status (None for all)
+        page: Page number (1-indexed)
+
+    Returns:
+        The "data" object of the response (notes, totalCount, isLastPage)
+    """
+    params: dict[str, Any] = {
+        "page": page,
+    }
+
+    # Note: The note_list endpoint uses "publish_status" parameter
+    if status is not None:
+        params["publish_status"] = status.value
+
+    response = await client.get(NOTE_LIST_PATH, params=params)
+    data: dict[str, Any] = response.get("data", {})
+    return data
+
+
+async def _iter_note_list_pages(
+    session: Session,
+    status: ArticleStatus | None = None,
+    *,
+    max_pages: int | None = None,
+) -> AsyncGenerator[list[dict[str, Any]]]:
+    """Iterate over the raw notes of the note_list endpoint, page by page.
+
+    The request for the next page is started before the current page is
+    yielded, so fetching overlaps with the caller's processing.
+
+    Pagination stops on a page flagged isLastPage, on an empty page, or
+    after max_pages pages.
+
+    Args:
+        session: Authenticated session
+        status: Filter by article status (None for all)
+        max_pages: Maximum number of pages to fetch (None for no limit)
+
+    Yields:
+        Raw note dictionaries of each page
+    """
+    async with NoteAPIClient(session) as client:
+        page = 1
+        pending: asyncio.Task[dict[str, Any]] | None = asyncio.ensure_future(
+            _fetch_note_list_page(client, status, page)
+        )
+        try:
+            while pending is not None:
+                data = await pending
+                pending = None
+
+                notes: list[dict[str, Any]] = data.get("notes", [])
+                if not notes:
+                    return
+
+                # Prefetch the next page while the caller works on this one
+                if data.get("isLastPage") is not True and (max_pages is None or page < max_pages):
+                    page += 1
+                    pending = asyncio.ensure_future(_fetch_note_list_page(client, status, page))
+
+                yield notes
+        finally:
+            # Caller stopped early or a request failed: drop the prefetch
+            if pending is not None and not pending.cancel() and not pending.cancelled():
+                pending.exception()
+
+
+async def iter_articles(
+    session: Session,
+    status: ArticleStatus | None = None,
+    *,
+    max_pages: int | None = None,
+) -> AsyncGenerator[Article]:
+    """Iterate over all articles of the authenticated user.
+
+    Pages of the note_list endpoint are fetched one ahead of the caller, so
+    bulk operations can process articles while the next page loads instead
+    of collecting every page first.
+
+    Args:
+        session: Authenticated session
+        status: Filter by article status (draft, published, or None for all)
+        max_pages: Maximum number of pages to fetch (None for no limit)
+
+    Yields:
+        Articles in listing order
+
+    Raises:
+        NoteAPIError: If API request fails or a note lacks required fields
+    """
+    # aclosing: stopping this iterator also cancels the page prefetch
+    async with aclosing(_iter_note_list_pages(session, status, max_pages=max_pages)) as pages:
+        async for notes in pages:
+            # One write of the persisted key/ID cache per page
+            with get_note_id_cache().batch():
+                articles = [_article_from_api(item) for item in notes]
+            for article in articles:
+                yield article
+
+
 async def list_articles(
     session: Session,
     status: ArticleStatus | None = None,
@@ -757,7 +1044,9 @@ async def list_articles(
     """List articles for the authenticated user.
 
     Uses the note_list/contents endpoint which returns both drafts and
-    published articles for the authenticated user.
+    published articles for the authenticated user. Use iter_articles() to
+    walk every page. After a complete sync_article_mirror(), the list is
+    served from the local article mirror.
 
     Args:
         session: Authenticated session
@@ -771,38 +1060,21 @@ async def list_articles(
     Raises:
         NoteAPIError: If API request fails
     """
-    # Build query parameters for note_list endpoint
-    # This endpoint returns both drafts and published articles
-    params: dict[str, Any] = {
-        "page": page,
-    }
-
-    # Add status filter if specified
-    # Note: The note_list endpoint uses "publish_status" parameter
-    if status is not None:
-        params["publish_status"] = status.value
+    mirror = get_article_mirror(session.user_id)
+    if mirror is not None and mirror.has_complete_listing():
+        return mirror.list_articles(status, page, limit)
 
-    # Use note_list/contents endpoint for authenticated user's articles
-    # This endpoint requires authentication and returns both drafts and published
     async with NoteAPIClient(session) as client:
-        response = await client.get("/v2/note_list/contents", params=params)
-
-    # Parse response
-    data = response.get("data", {})
+        data = await _fetch_note_list_page(client, status, page)
 
     # The endpoint returns notes (not contents) in data
     contents = data.get("notes", [])
     total_count = data.get("totalCount", len(contents))
     is_last_page = data.get("isLastPage", True)
 
-    # Convert each article
-    articles: list[Article] = []
-    for item in contents:
-        article = from_api_response(item)
-        articles.append(article)
-
-    # Apply limit client-side if needed
-    articles = articles[:limit]
+    # Only convert the articles that are returned
+    with get_note_id_cache().batch():
+        articles = [_article_from_api(item) for item in contents[:limit]]
 
     return ArticleListResult(
         articles=articles,
@@ -812,6 +1084,41 @@ async def list_articles(
     )
 
 
+def _published_article(
+    session: Session,
+    snapshot: Article,
+    title: str,
+    data: dict[str, Any],
+    tags: list[str] | None,
+) -> Article:
+    """Build the Article returned by publishing an existing draft.
+
+    Args:
+        session: Authenticated session (its username forms the article URL)
+        snapshot: Article fetched before publishing
+        title: Title sent with the publish request
+        data: "data" of the PUT /v1/text_notes/{id} response
+        tags: Tags sent with the publish request, if any
+
+    Returns:
+        Published Article without body (metadata only, like
+        get_article_via_api(include_body=False))
+    """
+    hashtags = _normalize_tags_for_publish(tags)
+    url = data.get("noteUrl") or snapshot.url or f"https://note.com/{session.username}/n/{snapshot.key}"
+    published_at = data.get("publish_at") or snapshot.published_at
+    return snapshot.model_copy(
+        update={
+            "title": title,
+            "body": "",
+            "status": ArticleStatus.PUBLISHED,
+            "tags": [tag.lstrip("#") for tag in hashtags] if hashtags else snapshot.tags,
+            "url": str(url),
+            "published_at": str(published_at) if published_at else None,
+        }
+    )
+
+
 async def publish_article(
     session: Session,
     article_id: str | None = None,
@@ -821,6 +1128,9 @@ async def publish_article(
     """Publish an article.
 
     Either publishes an existing draft or creates and publishes a new article.
+    Publishing a draft takes two requests: one fetch whose snapshot supplies
+    the numeric ID, title and body, and the publish PUT itself. The returned
+    Article is built from that snapshot and the PUT response.
 
     Args:
         session: Authenticated session
@@ -856,14 +1166,17 @@ async def publish_article(
                 details={"article_id": article_id},
             )
 
-        # Issue #250: Use PUT /v1/text_notes/{numeric_id} instead of
-        # non-existent POST /v3/notes/{id}/publish endpoint
-        numeric_id = await _resolve_numeric_note_id(session, article_id)
-
         async with NoteAPIClient(session) as client:
-            # Fetch article title (required for both draft_save and PUT)
+            # A single snapshot supplies the numeric ID, title, body and key
             article_response = await client.get(f"/v3/notes/{article_id}")
-            article_data = article_response.get("data", {})
+            snapshot = _parse_article_response(article_response)
+            if snapshot.status == ArticleStatus.DELETED:
+                raise NoteAPIError(
+                    code=ErrorCode.ARTICLE_NOT_FOUND,
+                    message="Article has been deleted (status='deleted')",
+                    details={"article_id": article_id},
+                )
+            article_data = article_response["data"]
             # For drafts, title is in note_draft.name; for published, it's in name
             article_title = article_data.get("name", "")
             if not article_title:
@@ -896,7 +1209,9 @@ async def publish_article(
                 if hashtags:
                     payload["hashtags"] = hashtags
 
-            response = await client.put(f"/v1/text_notes/{numeric_id}", json=payload)
+            # Issue #250: Use PUT /v1/text_notes/{numeric_id} instead of
+            # non-existent POST /v3/notes/{id}/publish endpoint
+            response = await client.put(f"/v1/text_notes/{snapshot.id}", json=payload)
 
         # Validate API response for logical failure
         data = response.get("data", {})
@@ -907,11 +1222,14 @@ async def publish_article(
                 details={"article_id": article_id, "response": response},
             )
 
-        return await get_article_via_api(session, article_id)
+        forget_mirrored_article(session.user_id, article_id)
+        get_saved_content_cache().forget(article_id)
+        update_indexed_status(session.user_id, snapshot.key, ArticleStatus.PUBLISHED)
+        return _published_article(session, snapshot, article_title, data, tags)
 
     # Create and publish new article
     assert article_input is not None  # Type narrowing
-    html_body = markdown_to_html(article_input.body)
+    html_body = await run_conversion(markdown_to_html, article_input.body)
 
     new_article_payload: dict[str, Any] = {
         "name": article_input.title,
@@ -924,12 +1242,22 @@ async def publish_article(
     if new_article_hashtags:
         new_article_payload["hashtags"] = new_article_hashtags
 
-    return await _execute_post(
+    published = await _execute_post(
         session,
         "/v3/notes",
         _parse_article_response,
         payload=new_article_payload,
     )
+    forget_mirrored_article(session.user_id)
+    index_article(
+        session.user_id,
+        published.key,
+        article_input.title,
+        article_input.tags,
+        article_input.body,
+        ArticleStatus.PUBLISHED,
+    )
+    return published
 
 
 # =============================================================================
@@ -1052,11 +1380,15 @@ async def delete_draft(
     )
 
     # Step 1: Fetch article info to validate and get details
-    article = await _execute_get(
-        session,
-        f"/v3/notes/{article_key}",
-        _parse_article_response,
-    )
+    # (the preview may use the local article mirror; deletion always checks the API)
+    mirror = get_article_mirror(session.user_id)
+    article = mirror.get_raw_article(article_key) if mirror is not None and not confirm else None
+    if article is None:
+        article = await _execute_get(
+            session,
+            f"/v3/notes/{article_key}",
+            _parse_article_response,
+        )
 
     # Check if article is published (cannot delete published articles)
     if article.status == ArticleStatus.PUBLISHED:
@@ -1090,6 +1422,9 @@ async def delete_draft(
     # Step 2: Execute deletion (confirm=True)
     # Note: The delete endpoint requires /n/ prefix before the article key
     await _execute_delete(session, f"/v1/notes/n/{article_key}")
+    forget_mirrored_article(session.user_id, article_key)
+    remove_indexed_article(session.user_id, article_key)
+    get_saved_content_cache().forget(article_key)
 
     return DeleteResult(
         success=True,
@@ -1104,6 +1439,8 @@ async def delete_all_drafts(
     session: Session,
     *,
     confirm: bool = False,
+    max_concurrency: int = DELETE_ALL_DRAFTS_CONCURRENCY,
+    on_progress: DeleteProgressCallback | None = None,
 ) -> BulkDeleteResult | BulkDeletePreview:
     """Delete all draft articles.
 
@@ -1111,13 +1448,17 @@ async def delete_all_drafts(
     Implements a two-step confirmation flow for safety.
 
     This function:
-    1. Fetches all drafts using list_articles(status=DRAFT)
+    1. Fetches all drafts page by page (next page prefetched)
     2. When confirm=False: Returns a BulkDeletePreview listing all drafts
-    3. When confirm=True: Sequentially deletes each draft
+    3. When confirm=True: Deletes the drafts concurrently (up to max_concurrency
+       requests at once, within the client rate limit)
 
     Args:
         session: Authenticated session
         confirm: Confirmation flag (must be True to execute deletion)
+        max_concurrency: Maximum number of deletions in flight at once
+        on_progress: Optional callback awaited with (completed, total)
+            after each deletion attempt
 
     Returns:
         BulkDeletePreview when confirm=False (shows what will be deleted)
@@ -1131,7 +1472,13 @@ async def delete_all_drafts(
         # Step 2: Actually delete all
         result = await delete_all_drafts(session, confirm=True)
         print(f"Deleted: {result.deleted_count}, Failed: {result.failed_count}")
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
     """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
     from note_mcp.models import (
         ArticleSummary,
         BulkDeletePreview,
@@ -1141,50 +1488,34 @@ async def delete_all_drafts(
 
     # Step 1: Get all drafts (paginate through all pages)
     article_summaries: list[ArticleSummary] = []
-    page = 1
 
-    async with NoteAPIClient(session) as client:
-        while page <= DELETE_ALL_DRAFTS_MAX_PAGES:
-            response = await client.get(
-                "/v2/note_list/contents",
-                params={"publish_status": "draft", "page": page},
-            )
-
-            data = response.get("data", {})
-            notes = data.get("notes", [])
-
-            # No more notes, stop pagination
-            if not notes:
-                break
-
-            # Build article summaries for this page
-            # Article 6: Required fields (id, key) must be present, skip invalid notes
-            for note in notes:
-                note_id = note.get("id")
-                note_key = note.get("key")
-
-                # Skip notes with missing required fields (Article 6 compliance)
-                if not note_id or not note_key:
-                    logger.warning(
-                        "Skipping note with missing required field(s)",
-                        extra={
-                            "note_id": note_id,
-                            "note_key": note_key,
-                            "note_name": note.get("name"),
-                        },
-                    )
-                    continue
-
-                article_summaries.append(
-                    ArticleSummary(
-                        article_id=str(note_id),
-                        article_key=str(note_key),
-                        # title is display-only, empty string is valid
-                        title=str(note.get("name") or ""),
-                    )
+    async for notes in _iter_note_list_pages(session, ArticleStatus.DRAFT, max_pages=DELETE_ALL_DRAFTS_MAX_PAGES):
+        # Build article summaries for this page
+        # Article 6: Required fields (id, key) must be present, skip invalid notes
+        for note in notes:
+            note_id = note.get("id")
+            note_key = note.get("key")
+
+            # Skip notes with missing required fields (Article 6 compliance)
+            if not note_id or not note_key:
+                logger.warning(
+                    "Skipping note with missing required field(s)",
+                    extra={
+                        "note_id": note_id,
+                        "note_key": note_key,
+                        "note_name": note.get("name"),
+                    },
                 )
-
-            page += 1
+                continue
+
+            article_summaries.append(
+                ArticleSummary(
+                    article_id=str(note_id),
+                    article_key=str(note_key),
+                    # title is display-only, empty string is valid
+                    title=str(note.get("name") or ""),
+                )
+            )
 
     total_count = len(article_summaries)
 
@@ -1215,23 +1546,46 @@ async def delete_all_drafts(
         )
 
     # Step 2: Execute deletion (confirm=True)
-    deleted_articles: list[ArticleSummary] = []
-    failed_articles: list[FailedArticle] = []
+    semaphore = asyncio.Semaphore(max_concurrency)
+    completed = 0
 
-    async with NoteAPIClient(session) as client:
-        for summary in article_summaries:
+    async def delete_one(client: NoteAPIClient, summary: ArticleSummary) -> FailedArticle | None:
+        nonlocal completed
+        async with semaphore:
             try:
                 await client.delete(f"/v1/notes/n/{summary.article_key}")
-                deleted_articles.append(summary)
+                forget_mirrored_article(session.user_id, summary.article_key)
+                remove_indexed_article(session.user_id, summary.article_key)
+                get_saved_content_cache().forget(summary.article_key)
+                failure = None
             except NoteAPIError as e:
-                failed_articles.append(
-                    FailedArticle(
-                        article_id=summary.article_id,
-                        article_key=summary.article_key,
-                        title=summary.title,
-                        error=e.message,
-                    )
+                failure = FailedArticle(
+                    article_id=summary.article_id,
+                    article_key=summary.article_key,
+                    title=summary.title,
+                    error=e.message,
+                )
+            except httpx.TransportError as e:
+                # Raised once the client's retries are exhausted; other deletions continue
+                failure = FailedArticle(
+                    article_id=summary.article_id,
+                    article_key=summary.article_key,
+                    title=summary.title,
+                    error=f"通信エラー: {type(e).__name__}: {e}",
                 )
+        completed += 1
+        if on_progress is not None:
+            await on_progress(completed, total_count)
+        return failure
+
+    async with NoteAPIClient(session) as client:
+        failures = await asyncio.gather(*(delete_one(client, summary) for summary in article_summaries))
+
+    # Keep both lists in listing order
+    deleted_articles = [
+        summary for summary, failure in zip(article_summaries, failures, strict=True) if failure is None
+    ]
+    failed_articles = [failure for failure in failures if failure is not None]
 
     deleted_count = len(deleted_articles)
     failed_count = len(failed_articles)
@@ -1254,3 +1608,89 @@ async def delete_all_drafts(
         failed_articles=failed_articles,
         message=message,
     )
+
+
+# =============================================================================
+# Local Article Mirror Sync
+# =============================================================================
+
+
+async def sync_article_mirror(
+    session: Session,
+    *,
+    max_concurrency: int = MIRROR_SYNC_CONCURRENCY,
+) -> MirrorSyncResult:
+    """Synchronize the local article mirror with note.com.
+
+    Walks the note list and re-fetches (GET /v3/notes/{key}) only the articles
+    that are new or whose updated_at differs from the mirrored copy. Mirrored
+    articles that are no longer listed are removed. After a sync without
+    failures, list_articles() is served from the mirror.
+
+    Args:
+        session: Authenticated session
+        max_concurrency: Maximum number of article fetches in flight at once
+
+    Returns:
+        MirrorSyncResult with fetched/unchanged/removed counts
+
+    Raises:
+        NoteAPIError: If the mirror is disabled or listing fails
+        ValueError: If max_concurrency is less than 1
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    from note_mcp.api.mirror import MIRROR_ENV_VAR
+
+    mirror = get_article_mirror(session.user_id)
+    if mirror is None:
+        raise NoteAPIError(
+            code=ErrorCode.INVALID_INPUT,
+            message=f"Article mirror is disabled. Set {MIRROR_ENV_VAR}=1 to enable it.",
+        )
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    listed_keys: list[str] = []
+    failed_keys: list[str] = []
+    fetches: list[asyncio.Task[None]] = []
+    unchanged = 0
+    previous_keys = mirror.keys()
+
+    async def fetch(article_key: str) -> None:
+        async with semaphore:
+            try:
+                # Records the article in the mirror
+                await get_article_via_api(session, article_key)
+            except NoteAPIError as e:
+                logger.warning(f"Failed to mirror article {article_key}: {e}")
+                failed_keys.append(article_key)
+
+    # Fetches of changed articles overlap with paging through the list
+    try:
+        async for listed in iter_articles(session):
+            listed_keys.append(listed.key)
+            if listed.updated_at is not None and listed.updated_at == mirror.updated_at(listed.key):
+                unchanged += 1
+            else:
+                fetches.append(asyncio.create_task(fetch(listed.key)))
+    except BaseException:
+        # Listing failed or the sync was cancelled: stop the started fetches
+        for task in fetches:
+            task.cancel()
+        await asyncio.gather(*fetches, return_exceptions=True)
+        raise
+    await asyncio.gather(*fetches)
+
+    if failed_keys:
+        mirror.mark_listing_stale()
+    else:
+        mirror.complete_listing(listed_keys)
+
+    return MirrorSyncResult(
+        listed=len(listed_keys),
+        fetched=len(fetches) - len(failed_keys),
+        unchanged=unchanged,
+        removed=len(previous_keys - set(listed_keys)) if not failed_keys else 0,
+        failed_keys=sorted(failed_keys),
+    )
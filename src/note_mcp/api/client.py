@@ -2,21 +2,30 @@
 
 Provides authenticated access to note.com API endpoints
 with rate limiting and error handling.
+
+Connections are pooled per account: every ``NoteAPIClient`` context borrows
+a long-lived ``httpx.AsyncClient`` so that multi-step operations (create_draft
+with embeds, bulk deletion, image upload) reuse warm TCP/TLS connections
+instead of paying a fresh handshake per call. Call ``close_pooled_clients()``
+on shutdown (wired into the FastMCP server lifespan).
 """
 
 from __future__ import annotations
 
-import time
+import asyncio
+import logging
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Self
+from typing import Any, Self
 
 import httpx
 
+from note_mcp.api.rate_limit import TokenBucket, get_rate_limiter
 from note_mcp.models import ErrorCode, NoteAPIError, Session
 
-if TYPE_CHECKING:
-    pass
-
+logger = logging.getLogger(__name__)
 
 # API base URL
 NOTE_API_BASE = "https://note.com/api"
@@ -28,19 +37,157 @@ NOTE_EDITOR_REFERER = "https://editor.note.com/"
 # Common User-Agent string for API requests
 USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
 
-# Rate limiting configuration
-RATE_LIMIT_REQUESTS = 10  # Maximum requests per minute
-RATE_LIMIT_WINDOW = 60  # Window size in seconds
-
 # Default timeout for requests (seconds)
 DEFAULT_TIMEOUT = 30
 
+# Retry configuration for transient errors (exponential backoff with full jitter)
+MAX_RETRIES = 3  # Maximum retries after the initial attempt
+RETRY_BASE_DELAY = 0.5  # Initial backoff delay in seconds
+RETRY_MAX_DELAY = 8.0  # Maximum backoff delay in seconds
+RETRY_MAX_RETRY_AFTER = 60.0  # Upper bound for a server-provided Retry-After delay
+RETRY_STATUS_CODES: frozenset[int] = frozenset({429, 502, 503, 504})
+
+# Methods that are safe to retry by default
+IDEMPOTENT_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Connection pool configuration (shared httpx.AsyncClient per account)
+POOL_MAX_CONNECTIONS = 10  # Maximum concurrent connections to note.com
+POOL_MAX_KEEPALIVE_CONNECTIONS = 5  # Idle connections kept open for reuse
+POOL_KEEPALIVE_EXPIRY = 30.0  # Seconds an idle connection is kept alive
+
+# Pooled httpx clients keyed by account, with the event loop they belong to.
+# httpx connections are bound to the loop that opened them, so a client created
+# on another (e.g. already closed) loop is replaced rather than reused.
+_pooled_clients: dict[str, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def _account_key(session: Session | None) -> str:
+    """Get the pool key for a session.
+
+    Args:
+        session: User session (None for anonymous access)
+
+    Returns:
+        Account identifier, or empty string for anonymous access
+    """
+    return session.user_id if session is not None else ""
+
+
+def _get_pooled_client(session: Session | None) -> httpx.AsyncClient:
+    """Get (or create) the pooled httpx client for the session's account.
+
+    Args:
+        session: User session (None for anonymous access)
+
+    Returns:
+        Long-lived httpx.AsyncClient with keep-alive connection limits
+    """
+    key = _account_key(session)
+    loop = asyncio.get_running_loop()
+
+    entry = _pooled_clients.get(key)
+    if entry is not None:
+        client_loop, client = entry
+        if client_loop is loop and not client.is_closed:
+            return client
+
+    client = httpx.AsyncClient(
+        base_url=NOTE_API_BASE,
+        timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=POOL_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+        ),
+    )
+    _pooled_clients[key] = (loop, client)
+    return client
+
+
+async def close_pooled_clients() -> None:
+    """Close all pooled httpx clients.
+
+    Should be called when the server shuts down. Clients that belong to a
+    different event loop cannot be closed from here and are simply dropped.
+    """
+    entries = list(_pooled_clients.values())
+    _pooled_clients.clear()
+
+    loop = asyncio.get_running_loop()
+    for client_loop, client in entries:
+        if client_loop is loop and not client.is_closed:
+            await client.aclose()
+
+
+def _parse_retry_after(response: httpx.Response) -> float | None:
+    """Parse the Retry-After header of a response.
+
+    Supports both delay-seconds and HTTP-date formats.
+
+    Args:
+        response: HTTP response object
+
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    value = response.headers.get("Retry-After")
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def _is_retryable_request(method: str) -> bool:
+    """Check whether a request may be retried by default.
+
+    Only idempotent methods are retried by default. Callers opt in for
+    other requests that are safe to repeat (e.g. draft_save) with retry=True.
+
+    Args:
+        method: HTTP method
+
+    Returns:
+        True if the request can be safely repeated
+    """
+    return method.upper() in IDEMPOTENT_METHODS
+
+
+def _compute_retry_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Compute the delay before the next retry.
+
+    Uses exponential backoff with full jitter. A server-provided Retry-After
+    is honored as a lower bound (capped at RETRY_MAX_RETRY_AFTER).
+
+    Args:
+        attempt: Zero-based retry attempt number
+        retry_after: Retry-After delay in seconds from the response (optional)
+
+    Returns:
+        Delay in seconds
+    """
+    backoff = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2**attempt)))
+    if retry_after is not None:
+        return max(backoff, min(retry_after, RETRY_MAX_RETRY_AFTER))
+    return backoff
+
 
 class NoteAPIClient:
     """HTTP client for note.com API.
 
     Provides authenticated requests with rate limiting and error handling.
     Use as async context manager for proper resource management.
+    The underlying connection pool and the rate limiter (token bucket) are
+    shared by all clients of the same account and outlive the context manager.
 
     Attributes:
         session: User session with authentication cookies
@@ -54,14 +201,12 @@ class NoteAPIClient:
         """
         self.session = session
         self._client: httpx.AsyncClient | None = None
-        self._request_times: list[float] = []
+        self._rate_limiter: TokenBucket | None = None
 
     async def __aenter__(self) -> Self:
-        """Enter async context manager."""
-        self._client = httpx.AsyncClient(
-            base_url=NOTE_API_BASE,
-            timeout=httpx.Timeout(DEFAULT_TIMEOUT),
-        )
+        """Enter async context manager (borrows the pooled httpx client)."""
+        self._client = _get_pooled_client(self.session)
+        self._rate_limiter = get_rate_limiter(_account_key(self.session))
         return self
 
     async def __aexit__(
@@ -70,10 +215,13 @@ class NoteAPIClient:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Exit async context manager."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Exit async context manager.
+
+        The pooled httpx client is released, not closed, so its keep-alive
+        connections can be reused by the next client of the same account.
+        """
+        self._client = None
+        self._rate_limiter = None
 
     def _build_headers(self, include_xsrf: bool = False) -> dict[str, str]:
         """Build request headers with authentication.
@@ -110,23 +258,28 @@ class NoteAPIClient:
         return headers
 
     async def _check_rate_limit(self) -> None:
-        """Check and enforce rate limiting.
+        """Wait for the account's rate limiter to grant a request.
 
-        Cleans up old timestamps and checks if we've exceeded the limit.
+        Callers are queued in FIFO order when the token bucket is empty.
         """
-        now = time.time()
-        window_start = now - RATE_LIMIT_WINDOW
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
 
-        # Clean up old timestamps
-        self._request_times = [t for t in self._request_times if t > window_start]
+    def _track_response(self, response: httpx.Response) -> None:
+        """Feed the response status back into the rate limiter.
 
-        # Note: We don't actively wait here, we just track
-        # The actual rate limit error will come from the server
-        # This is mainly for client-side tracking
+        A 429 slows the limiter down (honoring Retry-After);
+        successful responses let it recover gradually.
 
-    def _track_request(self) -> None:
-        """Track a request for rate limiting."""
-        self._request_times.append(time.time())
+        Args:
+            response: HTTP response object
+        """
+        if self._rate_limiter is None:
+            return
+        if response.status_code == 429:
+            self._rate_limiter.on_rate_limited(_parse_retry_after(response))
+        elif response.is_success:
+            self._rate_limiter.on_success()
 
     async def _request(
         self,
@@ -138,10 +291,15 @@ class NoteAPIClient:
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
         include_xsrf: bool = False,
+        retry: bool | None = None,
     ) -> dict[str, Any]:
         """Make an HTTP request to the API.
 
-        Centralizes: init check, rate limit, tracking, headers, error handling.
+        Centralizes: init check, rate limit, tracking, headers, retry, error handling.
+
+        Transient failures (429, 502, 503, 504 and transport errors) are retried
+        up to MAX_RETRIES times with exponential backoff and jitter, honoring
+        Retry-After. By default only idempotent methods are retried.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
@@ -151,6 +309,8 @@ class NoteAPIClient:
             data: Form data
             files: Files to upload
             include_xsrf: Whether to include X-XSRF-TOKEN header
+            retry: Force retries on (True) or off (False).
+                None retries idempotent methods only.
 
         Returns:
             JSON response as dictionary
@@ -162,9 +322,6 @@ class NoteAPIClient:
         if self._client is None:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
 
-        await self._check_rate_limit()
-        self._track_request()
-
         headers = self._build_headers(include_xsrf=include_xsrf)
 
         # Set Content-Type for JSON requests (not multipart)
@@ -185,7 +342,49 @@ class NoteAPIClient:
             if files is not None:
                 kwargs["files"] = files
 
-        response = await request_method(path, **kwargs)
+        max_retries = MAX_RETRIES if (retry if retry is not None else _is_retryable_request(method)) else 0
+        attempt = 0
+
+        while True:
+            await self._check_rate_limit()
+
+            try:
+                response = await request_method(path, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= max_retries:
+                    raise
+                delay = _compute_retry_delay(attempt)
+                logger.warning(
+                    "%s %s failed with %s, retrying in %.1fs (%d/%d)",
+                    method.upper(),
+                    path,
+                    type(e).__name__,
+                    delay,
+                    attempt + 1,
+                    max_retries,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            self._track_response(response)
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < max_retries:
+                delay = _compute_retry_delay(attempt, _parse_retry_after(response))
+                logger.warning(
+                    "%s %s got transient error %d, retrying in %.1fs (%d/%d)",
+                    method.upper(),
+                    path,
+                    response.status_code,
+                    delay,
+                    attempt + 1,
+                    max_retries,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            break
 
         if not response.is_success:
             self._handle_error_response(response)
@@ -246,12 +445,15 @@ class NoteAPIClient:
         self,
         path: str,
         params: dict[str, Any] | None = None,
+        *,
+        retry: bool | None = None,
     ) -> dict[str, Any]:
         """Make a GET request to the API.
 
         Args:
             path: API endpoint path (e.g., "/v1/articles")
             params: Query parameters
+            retry: Override the default retry policy (retried by default)
 
         Returns:
             JSON response as dictionary
@@ -259,7 +461,7 @@ class NoteAPIClient:
         Raises:
             NoteAPIError: If request fails
         """
-        return await self._request("GET", path, params=params)
+        return await self._request("GET", path, params=params, retry=retry)
 
     async def post(
         self,
@@ -267,6 +469,8 @@ class NoteAPIClient:
         json: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
+        *,
+        retry: bool | None = None,
     ) -> dict[str, Any]:
         """Make a POST request to the API.
 
@@ -275,6 +479,8 @@ class NoteAPIClient:
             json: JSON body
             data: Form data
             files: Files to upload
+            retry: Opt in to retries (True) for requests that are safe to
+                repeat, such as draft_save. POST is not retried by default.
 
         Returns:
             JSON response as dictionary
@@ -282,18 +488,21 @@ class NoteAPIClient:
         Raises:
             NoteAPIError: If request fails
         """
-        return await self._request("POST", path, json=json, data=data, files=files, include_xsrf=True)
+        return await self._request("POST", path, json=json, data=data, files=files, include_xsrf=True, retry=retry)
 
     async def put(
         self,
         path: str,
         json: dict[str, Any] | None = None,
+        *,
+        retry: bool | None = None,
     ) -> dict[str, Any]:
         """Make a PUT request to the API.
 
         Args:
             path: API endpoint path
             json: JSON body
+            retry: Override the default retry policy (retried by default)
 
         Returns:
             JSON response as dictionary
@@ -301,13 +510,14 @@ class NoteAPIClient:
         Raises:
             NoteAPIError: If request fails
         """
-        return await self._request("PUT", path, json=json, include_xsrf=True)
+        return await self._request("PUT", path, json=json, include_xsrf=True, retry=retry)
 
-    async def delete(self, path: str) -> dict[str, Any]:
+    async def delete(self, path: str, *, retry: bool | None = None) -> dict[str, Any]:
         """Make a DELETE request to the API.
 
         Args:
             path: API endpoint path
+            retry: Override the default retry policy (retried by default)
 
         Returns:
             JSON response as dictionary
@@ -315,4 +525,4 @@ class NoteAPIClient:
         Raises:
             NoteAPIError: If request fails
         """
-        return await self._request("DELETE", path, include_xsrf=True)
+        return await self._request("DELETE", path, include_xsrf=True, retry=retry)
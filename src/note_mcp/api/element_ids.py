@@ -0,0 +1,69 @@
+"""Element IDs for note.com HTML.
+
+note.com requires block elements to carry a unique name/id attribute. By
+default every generated element gets a random UUID, so two conversions of the
+same content never produce the same HTML.
+
+Inside stable_element_ids(seed), IDs are derived from the seed and the order
+in which they are requested instead. Converting the same content with the
+same seed then yields identical HTML, which lets callers compare, diff and
+cache converted bodies.
+"""
+
+from __future__ import annotations
+
+import itertools
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Namespace for name-based (UUIDv5) element IDs
+_ELEMENT_ID_NAMESPACE = uuid.UUID("8f0d5d0c-3a4b-5e6f-9a1b-2c3d4e5f6a7b")
+
+# Seed, counter and generated IDs of the active stable_element_ids() block
+_stable_id_source: ContextVar[tuple[str, Iterator[int], list[str]] | None] = ContextVar(
+    "_stable_id_source", default=None
+)
+
+
+def new_element_id() -> str:
+    """Generate an ID for a note.com element.
+
+    Returns:
+        UUID string; random, or derived from the active seed inside
+        stable_element_ids()
+    """
+    source = _stable_id_source.get()
+    if source is None:
+        return str(uuid.uuid4())
+    seed, counter, generated = source
+    element_id = str(uuid.uuid5(_ELEMENT_ID_NAMESPACE, f"{seed}:{next(counter)}"))
+    generated.append(element_id)
+    return element_id
+
+
+@contextmanager
+def stable_element_ids(seed: str) -> Iterator[list[str]]:
+    """Derive element IDs from a seed instead of generating random ones.
+
+    The n-th ID requested inside the block depends only on the seed and n.
+    Seeds must differ between parts of a document that are converted
+    separately, otherwise their IDs collide.
+
+    Args:
+        seed: Seed identifying the converted content (e.g., a hash of it)
+
+    Yields:
+        The IDs generated inside the block so far, in order
+
+    Example:
+        with stable_element_ids(digest) as element_ids:
+            html = generate_image_html(url)
+    """
+    generated: list[str] = []
+    token = _stable_id_source.set((seed, itertools.count(), generated))
+    try:
+        yield generated
+    finally:
+        _stable_id_source.reset(token)
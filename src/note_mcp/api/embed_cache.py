@@ -0,0 +1,142 @@
+"""Server-registered embed key cache for note.com articles.
+
+An embed must be registered for each article it appears in (Issue #116), and
+the registration for a given (url, article_key) pair stays valid. Keys are
+recorded here from fetch_embed_key() responses and from the
+embedded-content-key/data-src pairs of stored article HTML, so that
+resolve_embed_keys() only calls the API for URLs that are new to an article.
+
+The cache is kept in memory. Set NOTE_MCP_PERSIST_EMBED_CACHE=1 to also store
+it as JSON in the data directory (NOTE_MCP_DATA_DIR, see note_mcp.storage) so
+that it survives server restarts.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from note_mcp.storage import JsonFileStore, data_file, load_json_object
+
+# Environment variable enabling the on-disk store
+PERSIST_ENV_VAR = "NOTE_MCP_PERSIST_EMBED_CACHE"
+
+# Filename of the on-disk store inside the data directory
+EMBED_CACHE_FILENAME = "embed_keys.json"
+
+
+class EmbedKeyCache(JsonFileStore):
+    """Cache of (url, article_key) -> (embed_key, html_for_embed).
+
+    ``html_for_embed`` is None for entries seeded from stored article HTML,
+    which only carries the key.
+
+    Attributes:
+        path: JSON file used as on-disk store (None for memory only)
+    """
+
+    description = "embed key cache"
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: JSON file to load from and save to (optional)
+        """
+        super().__init__(path)
+        self._entries: dict[str, dict[str, tuple[str, str | None]]] = {}
+        if path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        """Number of cached (url, article_key) entries."""
+        return sum(len(urls) for urls in self._entries.values())
+
+    def get(self, url: str, article_key: str) -> tuple[str, str | None] | None:
+        """Get the cached embed registration for a URL in an article.
+
+        Args:
+            url: Embed URL
+            article_key: Article key the embed belongs to
+
+        Returns:
+            Tuple of (embed_key, html_for_embed), or None if not cached
+        """
+        return self._entries.get(article_key, {}).get(url)
+
+    def put(self, url: str, article_key: str, embed_key: str, html_for_embed: str | None = None) -> None:
+        """Record an embed registration.
+
+        Args:
+            url: Embed URL
+            article_key: Article key the embed belongs to
+            embed_key: Server-registered embed key
+            html_for_embed: HTML snippet returned by the API (optional)
+        """
+        entry = (embed_key, html_for_embed)
+        urls = self._entries.setdefault(article_key, {})
+        if urls.get(url) == entry:
+            return
+        urls[url] = entry
+        self._changed()
+
+    def seed(self, article_key: str, pairs: list[tuple[str, str]]) -> None:
+        """Record (url, embed_key) pairs found in stored article HTML.
+
+        Existing entries are kept, since they come from API responses.
+
+        Args:
+            article_key: Article key the HTML belongs to
+            pairs: (url, embed_key) pairs
+        """
+        urls = self._entries.setdefault(article_key, {})
+        changed = False
+        for url, embed_key in pairs:
+            if url not in urls:
+                urls[url] = (embed_key, None)
+                changed = True
+        if changed:
+            self._changed()
+
+    def clear(self) -> None:
+        """Remove all cached entries (including the on-disk store)."""
+        self._entries.clear()
+        self._changed()
+
+    def _load(self) -> None:
+        """Load entries from the on-disk store, ignoring unreadable files."""
+        assert self.path is not None
+        data = load_json_object(self.path, self.description)
+        if data is None:
+            return
+        for article_key, urls in data.items():
+            if not isinstance(urls, dict):
+                continue
+            for url, entry in urls.items():
+                if (
+                    isinstance(entry, list)
+                    and len(entry) == 2
+                    and isinstance(entry[0], str)
+                    and (entry[1] is None or isinstance(entry[1], str))
+                ):
+                    self._entries.setdefault(article_key, {})[url] = (entry[0], entry[1])
+
+    def _to_json(self) -> dict[str, dict[str, tuple[str, str | None]]]:
+        """Get the entries to write to the on-disk store."""
+        return self._entries
+
+
+_embed_key_cache: EmbedKeyCache | None = None
+
+
+def get_embed_key_cache() -> EmbedKeyCache:
+    """Get the process-wide embed key cache.
+
+    Created on first use; persisted to disk when NOTE_MCP_PERSIST_EMBED_CACHE=1.
+
+    Returns:
+        Shared EmbedKeyCache instance
+    """
+    global _embed_key_cache
+    if _embed_key_cache is None:
+        _embed_key_cache = EmbedKeyCache(data_file(PERSIST_ENV_VAR, EMBED_CACHE_FILENAME))
+    return _embed_key_cache
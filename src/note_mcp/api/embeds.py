@@ -31,13 +31,15 @@ service type (same as Zenn.dev and Qiita) via the same /v2/embed_by_external_api
 
 from __future__ import annotations
 
+import asyncio
 import html
 import logging
 import re
-import uuid
 from typing import TYPE_CHECKING, Any
 
 from note_mcp.api.client import NoteAPIClient
+from note_mcp.api.element_ids import new_element_id
+from note_mcp.api.embed_cache import get_embed_key_cache
 from note_mcp.models import ErrorCode, NoteAPIError
 
 logger = logging.getLogger(__name__)
@@ -111,11 +113,101 @@ EMBED_PATTERNS: list[tuple[re.Pattern[str], str]] = [
     (CONNPASS_PATTERN, "external-article"),  # connpass.com events (Issue #254)
 ]
 
+# Hostnames each pattern can match, so that get_embed_service() only tries the
+# pattern(s) registered for a URL's host instead of scanning EMBED_PATTERNS.
+# "*.example.com" matches exactly one subdomain label (e.g., connpass groups).
+# Patterns without an entry here are tried for every URL, so a new service
+# still works before its hosts are registered.
+EMBED_PATTERN_HOSTS: dict[re.Pattern[str], tuple[str, ...]] = {
+    YOUTUBE_PATTERN: ("youtube.com", "www.youtube.com", "youtu.be", "www.youtu.be"),
+    TWITTER_PATTERN: ("twitter.com", "www.twitter.com", "x.com", "www.x.com"),
+    NOTE_PATTERN: ("note.com",),
+    GIST_PATTERN: ("gist.github.com",),
+    GITHUB_REPO_PATTERN: ("github.com", "www.github.com"),
+    GOOGLE_SLIDES_PATTERN: ("docs.google.com",),
+    SPEAKERDECK_PATTERN: ("speakerdeck.com",),
+    MONEY_PATTERN: ("money.note.com",),
+    ZENN_PATTERN: ("zenn.dev",),
+    QIITA_PATTERN: ("qiita.com",),
+    CONNPASS_PATTERN: ("*.connpass.com",),
+}
+
+# Authority part of an http(s) URL (case preserved, as the patterns are case-sensitive)
+_URL_HOST_PATTERN = re.compile(r"^https?://([^/?#]*)")
+
+
+def _build_host_dispatch() -> tuple[
+    dict[str, list[tuple[re.Pattern[str], str]]],
+    dict[str, list[tuple[re.Pattern[str], str]]],
+    list[tuple[re.Pattern[str], str]],
+]:
+    """Build host -> candidate patterns tables from EMBED_PATTERNS.
+
+    Each candidate list keeps EMBED_PATTERNS order and includes patterns
+    without registered hosts, so dispatch gives the same result as a full scan.
+
+    Returns:
+        Tuple of (exact host table, wildcard parent-domain table, patterns
+        tried for any other host).
+    """
+    unregistered = [(p, s) for p, s in EMBED_PATTERNS if p not in EMBED_PATTERN_HOSTS]
+    exact: dict[str, list[tuple[re.Pattern[str], str]]] = {}
+    wildcard: dict[str, list[tuple[re.Pattern[str], str]]] = {}
+
+    for host in {host for hosts in EMBED_PATTERN_HOSTS.values() for host in hosts}:
+        table, name = (wildcard, host[2:]) if host.startswith("*.") else (exact, host)
+        table[name] = [
+            (p, s) for p, s in EMBED_PATTERNS if p not in EMBED_PATTERN_HOSTS or host in EMBED_PATTERN_HOSTS[p]
+        ]
+
+    return exact, wildcard, unregistered
+
+
+_EMBED_HOST_PATTERNS, _EMBED_WILDCARD_HOST_PATTERNS, _EMBED_UNREGISTERED_PATTERNS = _build_host_dispatch()
+
+
+# Placeholder keys generated locally carry this prefix followed by hex digits.
+# Server-registered keys (e.g., "emb0076d44f4f7f") never contain "tmp", so
+# unresolved placeholders are recognized by the marker rather than by length
+# and kept out of the embed key cache.
+PLACEHOLDER_KEY_PREFIX = "embtmp"
+PLACEHOLDER_KEY_HEX_LENGTH = 12
+# Placeholders of earlier versions ("emb" + 13 hex digits) may still be
+# stored in articles whose embed resolution failed
+_LEGACY_PLACEHOLDER_KEY_PATTERN = re.compile(r"^emb[0-9a-f]{13}$")
+
+
+def placeholder_embed_key(element_id: str) -> str:
+    """Derive a placeholder embed key from an element ID.
+
+    Args:
+        element_id: UUID string from new_element_id()
+
+    Returns:
+        Placeholder key (PLACEHOLDER_KEY_PREFIX followed by hex digits)
+    """
+    return PLACEHOLDER_KEY_PREFIX + element_id.replace("-", "")[:PLACEHOLDER_KEY_HEX_LENGTH]
+
+
+def is_placeholder_embed_key(embed_key: str) -> bool:
+    """Check whether an embed key is a locally generated placeholder.
+
+    Args:
+        embed_key: Key from an embedded-content-key attribute
+
+    Returns:
+        True for placeholder keys, including the legacy "emb" + 13 hex format
+    """
+    return embed_key.startswith(PLACEHOLDER_KEY_PREFIX) or bool(_LEGACY_PLACEHOLDER_KEY_PATTERN.match(embed_key))
+
 
 def get_embed_service(url: str) -> str | None:
     """Get embed service type from URL.
 
     Uses data-driven pattern matching from EMBED_PATTERNS (Issue #235: DRY principle).
+    The URL's host is extracted once and only the patterns registered for it
+    in EMBED_PATTERN_HOSTS are tried, with the same result as scanning
+    EMBED_PATTERNS in order.
 
     Args:
         url: The URL to check.
@@ -124,7 +216,17 @@ def get_embed_service(url: str) -> str | None:
         Service type ('youtube', 'twitter', 'note', 'gist', 'githubRepository',
         'googlepresentation', 'speakerdeck', 'oembed', 'external-article') or None if unsupported.
     """
-    for pattern, service in EMBED_PATTERNS:
+    candidates = _EMBED_UNREGISTERED_PATTERNS
+    host_match = _URL_HOST_PATTERN.match(url)
+    if host_match is not None:
+        host = host_match.group(1)
+        exact = _EMBED_HOST_PATTERNS.get(host)
+        if exact is not None:
+            candidates = exact
+        else:
+            candidates = _EMBED_WILDCARD_HOST_PATTERNS.get(host.partition(".")[2], candidates)
+
+    for pattern, service in candidates:
         if pattern.match(url):
             return service
     return None
@@ -162,7 +264,7 @@ def _build_embed_figure_html(
     Returns:
         HTML figure element string.
     """
-    element_id = str(uuid.uuid4())
+    element_id = new_element_id()
     escaped_url = html.escape(url, quote=True)
 
     return (
@@ -190,8 +292,9 @@ def generate_embed_html(
         service: Service type ('youtube', 'twitter', 'note', 'gist', 'githubRepository',
                  'googlepresentation', 'speakerdeck', 'oembed', 'external-article').
                  If None, auto-detected from URL.
-        embed_key: Server-registered embed key. If None, generates a random
-                   placeholder key (for markdown-to-html conversion, replaced later via API).
+        embed_key: Server-registered embed key. If None, generates a placeholder key
+                   (for markdown-to-html conversion, replaced later via API). Like the
+                   element ID, it is random unless generated inside stable_element_ids().
 
     Returns:
         HTML figure element string.
@@ -206,7 +309,7 @@ def generate_embed_html(
         raise ValueError(f"Unsupported embed URL: {url}")
 
     if embed_key is None:
-        embed_key = f"emb{uuid.uuid4().hex[:13]}"
+        embed_key = placeholder_embed_key(new_element_id())
 
     return _build_embed_figure_html(url, embed_key, service)
 
@@ -317,6 +420,9 @@ async def fetch_embed_key(
     The server-registered key is required for note.com's frontend to
     render the iframe. Random keys generated locally will not work.
 
+    The registration is recorded in the embed key cache so that later
+    resolve_embed_keys() calls for the same article can reuse it.
+
     Issue #121: Different endpoints are used for different services:
     - note.com articles: POST /v1/embed
     - Other services (YouTube/Twitter/Gist/etc.): GET /v2/embed_by_external_api
@@ -343,27 +449,30 @@ async def fetch_embed_key(
 
     # Issue #121: note.com articles use a different API endpoint
     if service == "note":
-        return await _fetch_note_embed_key(session, url, article_key)
-
-    # External services: use /v2/embed_by_external_api endpoint
-    params = {
-        "url": url,
-        "service": service,
-        "embeddable_key": article_key,
-        "embeddable_type": "Note",
-    }
+        embed_key, html_for_embed = await _fetch_note_embed_key(session, url, article_key)
+    else:
+        # External services: use /v2/embed_by_external_api endpoint
+        params = {
+            "url": url,
+            "service": service,
+            "embeddable_key": article_key,
+            "embeddable_type": "Note",
+        }
+
+        async with NoteAPIClient(session) as client:
+            response = await client.get("/v2/embed_by_external_api", params=params)
+
+        # Response structure: {"data": {"key": ..., "html_for_embed": ...}}
+        embed_key, html_for_embed = _extract_and_validate_embed_response(
+            response,
+            path=["data"],
+            url=url,
+            article_key=article_key,
+            service=service,
+        )
 
-    async with NoteAPIClient(session) as client:
-        response = await client.get("/v2/embed_by_external_api", params=params)
-
-    # Response structure: {"data": {"key": ..., "html_for_embed": ...}}
-    return _extract_and_validate_embed_response(
-        response,
-        path=["data"],
-        url=url,
-        article_key=article_key,
-        service=service,
-    )
+    get_embed_key_cache().put(url, article_key, embed_key, html_for_embed)
+    return embed_key, html_for_embed
 
 
 def generate_embed_html_with_key(
@@ -411,10 +520,113 @@ _EMBED_FIGURE_PATTERN = re.compile(
 )
 
 
+def has_unresolved_embeds(html_body: str) -> bool:
+    """Check whether any embed figure still carries a placeholder key.
+
+    Args:
+        html_body: HTML body, e.g. after resolve_embed_keys()
+
+    Returns:
+        True if an embed registration failed or was skipped
+    """
+    return any(is_placeholder_embed_key(match.group(2)) for match in _EMBED_FIGURE_PATTERN.finditer(html_body))
+
+
+# Maximum number of embed key requests in flight at once
+# (requests are additionally throttled by the per-account rate limiter)
+EMBED_KEY_CONCURRENCY = 5
+
+
+async def _fetch_embed_keys_concurrently(
+    session: Session,
+    urls: list[str],
+    article_key: str,
+    max_concurrency: int,
+) -> dict[str, str]:
+    """Fetch server-registered keys for unique embed URLs concurrently.
+
+    Args:
+        session: Authenticated session with valid cookies.
+        urls: Unique embed URLs to register.
+        article_key: Article key where embeds will be inserted.
+        max_concurrency: Maximum number of requests in flight at once.
+
+    Returns:
+        Mapping of URL to server-registered key. URLs whose lookup failed
+        with NoteAPIError are logged and omitted.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_one(url: str) -> str | None:
+        async with semaphore:
+            try:
+                server_key, _ = await fetch_embed_key(session, url, article_key)
+            except NoteAPIError as e:
+                # Log warning and continue processing other embeds (Issue #121)
+                logger.warning("Embed key fetch failed for %s: %s", url, e.message)
+                return None
+            return server_key
+
+    # Registered keys are written to the persisted cache once, after all fetches
+    with get_embed_key_cache().batch():
+        results = await asyncio.gather(*(fetch_one(url) for url in urls))
+    return {url: key for url, key in zip(urls, results, strict=True) if key is not None}
+
+
+async def prefetch_embed_keys(
+    session: Session,
+    urls: list[str],
+    article_key: str,
+    *,
+    max_concurrency: int = EMBED_KEY_CONCURRENCY,
+) -> None:
+    """Register embed URLs for an article ahead of resolve_embed_keys().
+
+    Registrations are stored in the embed key cache, so a later
+    resolve_embed_keys() for the same article needs no further requests.
+    URLs that are unsupported or already cached are skipped, and failures are
+    logged (resolve_embed_keys() retries them).
+
+    Args:
+        session: Authenticated session with valid cookies.
+        urls: Embed URLs (e.g., from markdown_to_html.find_embed_urls()).
+        article_key: Article key where embeds will be inserted.
+        max_concurrency: Maximum number of embed key requests in flight at once.
+    """
+    new_urls = [
+        url
+        for url in dict.fromkeys(urls)
+        if get_embed_service(url) is not None and _cached_embed_key(url, article_key) is None
+    ]
+    if new_urls:
+        await _fetch_embed_keys_concurrently(session, new_urls, article_key, max_concurrency)
+
+
+def _cached_embed_key(url: str, article_key: str) -> str | None:
+    """Get the cached server-registered key of an embed.
+
+    Placeholder keys seeded by earlier versions (and possibly persisted)
+    are treated as missing, so the embed is registered again.
+
+    Args:
+        url: Embed URL
+        article_key: Article key the embed belongs to
+
+    Returns:
+        Server-registered embed key, or None if not cached
+    """
+    cached = get_embed_key_cache().get(url, article_key)
+    if cached is None or is_placeholder_embed_key(cached[0]):
+        return None
+    return cached[0]
+
+
 async def resolve_embed_keys(
     session: Session,
     html_body: str,
     article_key: str,
+    *,
+    max_concurrency: int = EMBED_KEY_CONCURRENCY,
 ) -> str:
     """Replace random embed keys with server-registered keys.
 
@@ -424,6 +636,11 @@ async def resolve_embed_keys(
     This function should be called after markdown_to_html() conversion
     and before saving the article body to note.com.
 
+    Keys are fetched concurrently (up to ``max_concurrency`` requests at once),
+    and a URL that appears in several figures is registered only once.
+    URLs already registered for the article (see embed_cache) are not
+    requested again.
+
     Issue #121: API errors for individual embeds are logged and skipped,
     allowing other embeds to be processed successfully.
 
@@ -432,11 +649,18 @@ async def resolve_embed_keys(
         html_body: HTML body containing figure elements with random embed keys.
         article_key: Article key where embeds will be inserted
                      (e.g., "n1234567890ab").
+        max_concurrency: Maximum number of embed key requests in flight at once.
 
     Returns:
         HTML body with embed keys replaced by server-registered keys.
         Embeds that fail to resolve keep their original placeholder keys.
+
+    Raises:
+        ValueError: If max_concurrency is less than 1.
     """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
     # Find all embed figures in the HTML
     matches = list(_EMBED_FIGURE_PATTERN.finditer(html_body))
 
@@ -444,32 +668,88 @@ async def resolve_embed_keys(
         # No embeds found, return unchanged
         return html_body
 
-    result = html_body
-
-    # Process each embed figure
+    # Collect supported embeds with their figure matches, in document order
+    embeds: list[tuple[str, re.Match[str]]] = []
     for match in matches:
-        data_src = match.group(1)
-        old_key = match.group(2)
-
         # Unescape the URL (it was escaped when generating HTML)
-        url = html.unescape(data_src)
+        url = html.unescape(match.group(1))
 
         # Skip if URL is not a supported embed URL
         if get_embed_service(url) is None:
             continue
 
-        # Fetch server-registered key with error handling (Issue #121)
-        try:
-            server_key, _ = await fetch_embed_key(session, url, article_key)
-
-            # Replace the old key with the server key
-            result = result.replace(
-                f'embedded-content-key="{old_key}"',
-                f'embedded-content-key="{server_key}"',
-            )
-        except NoteAPIError as e:
-            # Log warning and continue processing other embeds
-            logger.warning("Embed key fetch failed for %s: %s", url, e.message)
-            # Original placeholder key is preserved
-
-    return result
+        embeds.append((url, match))
+
+    # Register each distinct URL once (dict preserves first-seen order),
+    # reusing keys already registered for this article
+    server_keys: dict[str, str] = {}
+    new_urls: list[str] = []
+    for url in dict.fromkeys(url for url, _ in embeds):
+        cached = _cached_embed_key(url, article_key)
+        if cached is None:
+            new_urls.append(url)
+        else:
+            server_keys[url] = cached
+
+    if new_urls:
+        server_keys.update(await _fetch_embed_keys_concurrently(session, new_urls, article_key, max_concurrency))
+
+    # Embeds whose lookup failed keep their original placeholder key
+    replacements = [(match, server_keys[url]) for url, match in embeds if url in server_keys]
+    return _replace_embed_keys(html_body, replacements)
+
+
+def _replace_embed_keys(
+    html_body: str,
+    replacements: list[tuple[re.Match[str], str]],
+) -> str:
+    """Write new embed keys into the HTML body in a single pass.
+
+    Uses the span of each figure's embedded-content-key value (group 2 of
+    _EMBED_FIGURE_PATTERN) so the body is copied once, regardless of the
+    number of embeds.
+
+    Args:
+        html_body: HTML body the matches were found in.
+        replacements: (figure match, new key) pairs in document order.
+
+    Returns:
+        HTML body with each matched key replaced by its new key.
+    """
+    if not replacements:
+        return html_body
+
+    parts: list[str] = []
+    position = 0
+    for match, new_key in replacements:
+        key_start, key_end = match.span(2)
+        parts.append(html_body[position:key_start])
+        parts.append(new_key)
+        position = key_end
+    parts.append(html_body[position:])
+
+    return "".join(parts)
+
+
+def seed_embed_key_cache(article_key: str, html_body: str) -> None:
+    """Record the embed keys found in an article's stored HTML.
+
+    Stored figures carry the server-registered key for their URL, so later
+    updates of the article can reuse them without calling the API.
+    Locally generated placeholder keys (left by failed resolutions) are ignored.
+
+    Args:
+        article_key: Article key the HTML belongs to.
+        html_body: Article body HTML as stored on note.com.
+    """
+    pairs: list[tuple[str, str]] = []
+    for match in _EMBED_FIGURE_PATTERN.finditer(html_body):
+        embed_key = match.group(2)
+        if is_placeholder_embed_key(embed_key):
+            continue
+        url = html.unescape(match.group(1))
+        if get_embed_service(url) is not None:
+            pairs.append((url, embed_key))
+
+    if pairs:
+        get_embed_key_cache().seed(article_key, pairs)
@@ -0,0 +1,140 @@
+"""Key to numeric ID resolution cache for note.com articles.
+
+note.com identifies an article both by its key (e.g., "n1234567890ab", used
+in URLs and /v3/notes/) and by its numeric ID (required by draft_save, image
+upload and publish). The pair never changes, so every API response carrying
+both values is recorded here and _resolve_numeric_note_id() can skip the
+GET /v3/notes/{key} round trip on repeated edits.
+
+The cache is kept in memory. Set NOTE_MCP_PERSIST_ID_CACHE=1 to also store it
+as JSON in the data directory (NOTE_MCP_DATA_DIR, see note_mcp.storage) so
+that it survives server restarts.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from note_mcp.storage import JsonFileStore, data_file, load_json_object
+
+# Environment variable enabling the on-disk store
+PERSIST_ENV_VAR = "NOTE_MCP_PERSIST_ID_CACHE"
+
+# Filename of the on-disk store inside the data directory
+ID_CACHE_FILENAME = "note_ids.json"
+
+
+class NoteIdCache(JsonFileStore):
+    """Bidirectional article key <-> numeric ID cache.
+
+    Use batch() when recording many pairs, e.g. all articles of a listing.
+
+    Attributes:
+        path: JSON file used as on-disk store (None for memory only)
+    """
+
+    description = "note ID cache"
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: JSON file to load from and save to (optional)
+        """
+        super().__init__(path)
+        self._key_to_id: dict[str, str] = {}
+        self._id_to_key: dict[str, str] = {}
+        if path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        """Number of cached key/ID pairs."""
+        return len(self._key_to_id)
+
+    def get_id(self, key: str) -> str | None:
+        """Get the numeric ID for an article key.
+
+        Args:
+            key: Article key (e.g., "n1234567890ab")
+
+        Returns:
+            Numeric ID as string, or None if not cached
+        """
+        return self._key_to_id.get(key)
+
+    def get_key(self, note_id: str) -> str | None:
+        """Get the article key for a numeric ID.
+
+        Args:
+            note_id: Numeric article ID
+
+        Returns:
+            Article key, or None if not cached
+        """
+        return self._id_to_key.get(note_id)
+
+    def put(self, key: str, note_id: str) -> None:
+        """Record a key/ID pair.
+
+        Args:
+            key: Article key
+            note_id: Numeric article ID
+        """
+        if self._key_to_id.get(key) == note_id:
+            return
+        self._key_to_id[key] = note_id
+        self._id_to_key[note_id] = key
+        self._changed()
+
+    def clear(self) -> None:
+        """Remove all cached pairs (including the on-disk store)."""
+        self._key_to_id.clear()
+        self._id_to_key.clear()
+        self._changed()
+
+    def _load(self) -> None:
+        """Load pairs from the on-disk store, ignoring unreadable files."""
+        assert self.path is not None
+        data = load_json_object(self.path, self.description)
+        if data is None:
+            return
+        for key, note_id in data.items():
+            if isinstance(key, str) and isinstance(note_id, str):
+                self._key_to_id[key] = note_id
+                self._id_to_key[note_id] = key
+
+    def _to_json(self) -> dict[str, str]:
+        """Get the pairs to write to the on-disk store."""
+        return self._key_to_id
+
+
+_note_id_cache: NoteIdCache | None = None
+
+
+def get_note_id_cache() -> NoteIdCache:
+    """Get the process-wide key/ID cache.
+
+    Created on first use; persisted to disk when NOTE_MCP_PERSIST_ID_CACHE=1.
+
+    Returns:
+        Shared NoteIdCache instance
+    """
+    global _note_id_cache
+    if _note_id_cache is None:
+        _note_id_cache = NoteIdCache(data_file(PERSIST_ENV_VAR, ID_CACHE_FILENAME))
+    return _note_id_cache
+
+
+def remember_note_id(key: object, note_id: object) -> None:
+    """Record a key/ID pair from an API response, if both values are present.
+
+    Args:
+        key: Article key from the response (ignored unless a non-empty string)
+        note_id: Numeric ID from the response (str or int)
+    """
+    if not key or not note_id or not isinstance(key, str):
+        return
+    note_id_str = str(note_id)
+    if not note_id_str.isdigit():
+        return
+    get_note_id_cache().put(key, note_id_str)
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from note_mcp.api.client import NoteAPIClient
+from note_mcp.api.id_cache import get_note_id_cache, remember_note_id
 from note_mcp.models import ErrorCode, Image, ImageType, NoteAPIError, Session
 
 if TYPE_CHECKING:
@@ -26,6 +27,8 @@ async def _resolve_numeric_note_id(session: Session, note_id: str) -> str:
 
     The image upload API requires numeric note IDs.
     This function converts key format IDs (e.g., "ne1c111d2073c") to numeric IDs.
+    Resolved pairs are cached (see api.id_cache), so only the first
+    resolution of a key costs a GET /v3/notes/{key} request.
 
     Args:
         session: Authenticated session
@@ -49,6 +52,10 @@ async def _resolve_numeric_note_id(session: Session, note_id: str) -> str:
             details={"note_id": note_id},
         )
 
+    cached_id = get_note_id_cache().get_id(note_id)
+    if cached_id is not None:
+        return cached_id
+
     # Fetch article details to get numeric ID
     async with NoteAPIClient(session) as client:
         response = await client.get(f"/v3/notes/{note_id}")
@@ -64,6 +71,7 @@ async def _resolve_numeric_note_id(session: Session, note_id: str) -> str:
             details={"note_id": note_id, "response": response},
         )
 
+    remember_note_id(note_id, numeric_id)
     return str(numeric_id)
 
 
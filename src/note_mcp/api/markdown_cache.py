@@ -0,0 +1,104 @@
+"""Converted Markdown cache for get_article_via_api().
+
+get_article_via_api() converts the note.com HTML body of every fetched
+article to Markdown. An article's body only changes when it is saved, which
+also changes its updated_at, so the Markdown is cached per article key and
+updated_at. Reading an unchanged article again (get_article, mirror syncs,
+update round trips) then skips the conversion entirely.
+
+Entries also record a hash of the HTML they were converted from and are only
+used when the fetched body still matches, so a body changed without a new
+updated_at is converted again rather than served stale. The cache is kept in
+memory and bounded to the most recently used articles.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+
+# Number of articles whose converted Markdown is kept
+MARKDOWN_CACHE_SIZE = 256
+
+
+def _html_digest(html: str) -> str:
+    """Hash an HTML body."""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+class ConvertedMarkdownCache:
+    """LRU cache of article key -> (updated_at, HTML digest, Markdown).
+
+    Only the latest converted version of each article is kept.
+
+    Attributes:
+        max_entries: Maximum number of cached articles
+    """
+
+    def __init__(self, max_entries: int = MARKDOWN_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached articles
+
+        Raises:
+            ValueError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, str, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of cached articles."""
+        return len(self._entries)
+
+    def get(self, article_key: str, updated_at: str, html: str) -> str | None:
+        """Get the Markdown of an article body and mark it as recently used.
+
+        Args:
+            article_key: Article key
+            updated_at: Last update time reported by the API
+            html: HTML body that is about to be converted
+
+        Returns:
+            Converted Markdown, or None if not cached for this version and body
+        """
+        entry = self._entries.get(article_key)
+        if entry is None or entry[0] != updated_at or entry[1] != _html_digest(html):
+            return None
+        self._entries.move_to_end(article_key)
+        return entry[2]
+
+    def put(self, article_key: str, updated_at: str, html: str, markdown: str) -> None:
+        """Record converted Markdown, replacing any older version of the article.
+
+        Args:
+            article_key: Article key
+            updated_at: Last update time reported by the API
+            html: HTML body that was converted
+            markdown: Converted Markdown
+        """
+        self._entries[article_key] = (updated_at, _html_digest(html), markdown)
+        self._entries.move_to_end(article_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+_converted_markdown_cache: ConvertedMarkdownCache | None = None
+
+
+def get_converted_markdown_cache() -> ConvertedMarkdownCache:
+    """Get the process-wide converted Markdown cache.
+
+    Returns:
+        Shared ConvertedMarkdownCache instance
+    """
+    global _converted_markdown_cache
+    if _converted_markdown_cache is None:
+        _converted_markdown_cache = ConvertedMarkdownCache()
+    return _converted_markdown_cache
@@ -0,0 +1,358 @@
+"""Local SQLite mirror of the authenticated account's articles.
+
+The mirror stores article metadata together with the raw HTML body returned
+by GET /v3/notes/{key} and its Markdown conversion. sync_article_mirror()
+(see api.articles) walks the note list and only re-fetches articles whose
+updated_at changed, after which note_get_article, note_list_articles and the
+note_delete_draft preview are served from the local database.
+
+Articles modified through this server are dropped from the mirror (and the
+listing is marked stale) so that reads fall back to the API until the next
+sync. Changes made elsewhere (e.g. in the note.com editor) are picked up by
+the next sync.
+
+Each mirror belongs to one account: it is stored as articles-<user_id>.db in
+the data directory (NOTE_MCP_DATA_DIR, see note_mcp.storage), records the
+account it was filled for, and is only served to a session of that account.
+note_logout closes it.
+
+The mirror is disabled by default. Set NOTE_MCP_ARTICLE_MIRROR=1 to enable it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+
+from note_mcp.models import Article, ArticleListResult, ArticleStatus
+from note_mcp.storage import account_data_file
+
+logger = logging.getLogger(__name__)
+
+# Environment variable enabling the mirror
+MIRROR_ENV_VAR = "NOTE_MCP_ARTICLE_MIRROR"
+
+# Filename of the database inside the data directory (the account is appended)
+MIRROR_FILENAME = "articles.db"
+
+# Number of articles per page of the note_list endpoint
+NOTE_LIST_PAGE_SIZE = 10
+
+# mirror_state flag set after a complete sync of all articles
+_LISTING_COMPLETE = "listing_complete"
+
+# mirror_state entry holding the account the mirror was filled for
+_ACCOUNT = "account"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    key TEXT PRIMARY KEY,
+    id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    status TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    eyecatch_image_key TEXT,
+    prev_access_key TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    published_at TEXT,
+    url TEXT,
+    body_html TEXT NOT NULL,
+    body_markdown TEXT NOT NULL,
+    position INTEGER
+);
+CREATE INDEX IF NOT EXISTS articles_id ON articles (id);
+CREATE TABLE IF NOT EXISTS mirror_state (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_ARTICLE_COLUMNS = (
+    "key, id, title, status, tags, eyecatch_image_key, prev_access_key, "
+    "created_at, updated_at, published_at, url, body_html, body_markdown"
+)
+
+
+class ArticleMirror:
+    """SQLite store of articles (metadata, raw HTML and Markdown).
+
+    Attributes:
+        path: Database file, or ":memory:" for an in-memory database
+        account: Account (user ID) the mirrored articles belong to
+    """
+
+    def __init__(self, path: Path | str = ":memory:", account: str | None = None) -> None:
+        """Open (and create if needed) the mirror database.
+
+        A database filled for a different account is emptied first.
+
+        Args:
+            path: Database file, or ":memory:" for an in-memory database
+            account: Account (user ID) the mirrored articles belong to
+        """
+        self.path = path
+        self.account = account
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            row = self._conn.execute("SELECT value FROM mirror_state WHERE name = ?", (_ACCOUNT,)).fetchone()
+            stored_account = row["value"] if row is not None else None
+            if stored_account != account:
+                if stored_account is not None:
+                    logger.warning(f"Discarding article mirror of another account: {path}")
+                self._conn.execute("DELETE FROM articles")
+                self._conn.execute("DELETE FROM mirror_state")
+                if account is not None:
+                    self._conn.execute(
+                        "INSERT INTO mirror_state (name, value) VALUES (?, ?)",
+                        (_ACCOUNT, account),
+                    )
+
+    def __len__(self) -> int:
+        """Number of mirrored articles."""
+        row = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def store(self, article: Article, markdown: str) -> None:
+        """Insert or replace an article.
+
+        Args:
+            article: Article with its raw HTML body
+            markdown: Markdown conversion of the body
+        """
+        with self._conn:
+            self._conn.execute(
+                f"INSERT INTO articles ({_ARTICLE_COLUMNS}, position) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, "
+                "(SELECT position FROM articles WHERE key = ?)) "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "id = excluded.id, title = excluded.title, status = excluded.status, "
+                "tags = excluded.tags, eyecatch_image_key = excluded.eyecatch_image_key, "
+                "prev_access_key = excluded.prev_access_key, created_at = excluded.created_at, "
+                "updated_at = excluded.updated_at, published_at = excluded.published_at, "
+                "url = excluded.url, body_html = excluded.body_html, "
+                "body_markdown = excluded.body_markdown",
+                (
+                    article.key,
+                    article.id,
+                    article.title,
+                    article.status.value,
+                    json.dumps(article.tags, ensure_ascii=False),
+                    article.eyecatch_image_key,
+                    article.prev_access_key,
+                    article.created_at,
+                    article.updated_at,
+                    article.published_at,
+                    article.url,
+                    article.body,
+                    markdown,
+                    article.key,
+                ),
+            )
+
+    def get_article(self, article_id: str) -> Article | None:
+        """Get a mirrored article with its Markdown body.
+
+        Args:
+            article_id: Article key or numeric ID
+
+        Returns:
+            Article with Markdown body, or None if not mirrored
+        """
+        row = self._find(article_id)
+        return _row_to_article(row, row["body_markdown"]) if row is not None else None
+
+    def get_raw_article(self, article_id: str) -> Article | None:
+        """Get a mirrored article with its raw HTML body.
+
+        Args:
+            article_id: Article key or numeric ID
+
+        Returns:
+            Article with HTML body, or None if not mirrored
+        """
+        row = self._find(article_id)
+        return _row_to_article(row, row["body_html"]) if row is not None else None
+
+    def updated_at(self, article_key: str) -> str | None:
+        """Get the stored updated_at of an article.
+
+        Args:
+            article_key: Article key
+
+        Returns:
+            Stored updated_at, or None if not mirrored (or unknown)
+        """
+        row = self._conn.execute("SELECT updated_at FROM articles WHERE key = ?", (article_key,)).fetchone()
+        return row["updated_at"] if row is not None else None
+
+    def keys(self) -> set[str]:
+        """Get the keys of all mirrored articles."""
+        return {row["key"] for row in self._conn.execute("SELECT key FROM articles")}
+
+    def forget(self, article_id: str) -> None:
+        """Drop an article modified through the API and mark the listing stale.
+
+        Args:
+            article_id: Article key or numeric ID
+        """
+        with self._conn:
+            self._conn.execute("DELETE FROM articles WHERE key = ? OR id = ?", (article_id, article_id))
+            self._conn.execute("DELETE FROM mirror_state WHERE name = ?", (_LISTING_COMPLETE,))
+
+    def mark_listing_stale(self) -> None:
+        """Stop serving the article list locally until the next complete sync."""
+        with self._conn:
+            self._conn.execute("DELETE FROM mirror_state WHERE name = ?", (_LISTING_COMPLETE,))
+
+    def complete_listing(self, keys_in_order: list[str]) -> None:
+        """Record the result of a complete sync.
+
+        Articles not in keys_in_order no longer exist and are removed; the
+        others keep the position they have in the note list.
+
+        Args:
+            keys_in_order: Keys of all listed articles, in listing order
+        """
+        with self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS listed (key TEXT PRIMARY KEY, position INTEGER)")
+            self._conn.execute("DELETE FROM listed")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO listed (key, position) VALUES (?, ?)",
+                [(key, position) for position, key in enumerate(keys_in_order)],
+            )
+            self._conn.execute("DELETE FROM articles WHERE key NOT IN (SELECT key FROM listed)")
+            self._conn.execute(
+                "UPDATE articles SET position = (SELECT position FROM listed WHERE listed.key = articles.key)"
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mirror_state (name, value) VALUES (?, ?)",
+                (_LISTING_COMPLETE, "1"),
+            )
+
+    def has_complete_listing(self) -> bool:
+        """Whether the article list can be served locally."""
+        row = self._conn.execute("SELECT 1 FROM mirror_state WHERE name = ?", (_LISTING_COMPLETE,)).fetchone()
+        return row is not None
+
+    def list_articles(
+        self,
+        status: ArticleStatus | None = None,
+        page: int = 1,
+        limit: int = NOTE_LIST_PAGE_SIZE,
+    ) -> ArticleListResult:
+        """List mirrored articles the way list_articles() pages the API.
+
+        Args:
+            status: Filter by article status (None for all)
+            page: Page number (1-indexed, NOTE_LIST_PAGE_SIZE articles per page)
+            limit: Number of articles to return from the page
+
+        Returns:
+            ArticleListResult with Markdown bodies
+        """
+        where = "WHERE status = ?" if status is not None else ""
+        params: tuple[str, ...] = (status.value,) if status is not None else ()
+        total = int(self._conn.execute(f"SELECT COUNT(*) FROM articles {where}", params).fetchone()[0])
+        offset = (max(page, 1) - 1) * NOTE_LIST_PAGE_SIZE
+        rows = self._conn.execute(
+            f"SELECT {_ARTICLE_COLUMNS} FROM articles {where} ORDER BY position LIMIT ? OFFSET ?",
+            (*params, min(limit, NOTE_LIST_PAGE_SIZE), offset),
+        ).fetchall()
+        return ArticleListResult(
+            articles=[_row_to_article(row, row["body_markdown"]) for row in rows],
+            total=total,
+            page=page,
+            has_more=offset + NOTE_LIST_PAGE_SIZE < total,
+        )
+
+    def _find(self, article_id: str) -> sqlite3.Row | None:
+        """Find an article row by key or numeric ID."""
+        column = "id" if article_id.isdigit() else "key"
+        row: sqlite3.Row | None = self._conn.execute(
+            f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE {column} = ?", (article_id,)
+        ).fetchone()
+        return row
+
+
+def _row_to_article(row: sqlite3.Row, body: str) -> Article:
+    """Build an Article from a database row."""
+    return Article(
+        id=row["id"],
+        key=row["key"],
+        title=row["title"],
+        body=body,
+        status=ArticleStatus(row["status"]),
+        tags=json.loads(row["tags"]),
+        eyecatch_image_key=row["eyecatch_image_key"],
+        prev_access_key=row["prev_access_key"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+        published_at=row["published_at"],
+        url=row["url"],
+    )
+
+
+_article_mirror: ArticleMirror | None = None
+
+
+def get_article_mirror(account: str) -> ArticleMirror | None:
+    """Get the article mirror of an account.
+
+    Opened on first use when NOTE_MCP_ARTICLE_MIRROR=1. A mirror opened for
+    another account is closed first, so a session never sees the articles
+    of a previous login.
+
+    Args:
+        account: User ID of the current session
+
+    Returns:
+        ArticleMirror of the account, or None if the mirror is disabled
+    """
+    global _article_mirror
+    if _article_mirror is not None and _article_mirror.account != account:
+        close_article_mirror()
+    if _article_mirror is None:
+        path = account_data_file(MIRROR_ENV_VAR, MIRROR_FILENAME, account)
+        if path is not None:
+            _article_mirror = ArticleMirror(path, account)
+    return _article_mirror
+
+
+def close_article_mirror() -> None:
+    """Close the open article mirror (e.g., on logout).
+
+    The database file is kept; the next get_article_mirror() call for the
+    same account reopens it.
+    """
+    global _article_mirror
+    if _article_mirror is not None:
+        _article_mirror.close()
+        _article_mirror = None
+
+
+def forget_mirrored_article(account: str, article_id: str | None = None) -> None:
+    """Invalidate mirror entries after a change made through the API.
+
+    Args:
+        account: User ID of the session that made the change
+        article_id: Key or numeric ID of the changed article, or None when
+            only the listing changed (e.g. a new draft)
+    """
+    mirror = get_article_mirror(account)
+    if mirror is None:
+        return
+    if article_id:
+        mirror.forget(article_id)
+    else:
+        mirror.mark_listing_stale()
@@ -0,0 +1,198 @@
+"""Client-side rate limiting for note.com API requests.
+
+Provides an async token bucket shared by all API clients of the same account.
+Callers wait (in FIFO order) for a token before each request, and the bucket
+slows its refill rate further when the server answers with 429 Too Many
+Requests, recovering gradually as requests succeed again.
+
+By default up to 10 requests are sent back-to-back, then 10 requests per
+minute, the safe rate given in specs/001-note-mcp. The limits are configured
+by environment variables, read when an account's bucket is created:
+
+- NOTE_MCP_RATE_LIMIT_BURST: maximum requests sent back-to-back (default 10)
+- NOTE_MCP_RATE_LIMIT_PER_MINUTE: sustained requests per minute (default 10)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Environment variables configuring the limits
+BURST_ENV_VAR = "NOTE_MCP_RATE_LIMIT_BURST"
+PER_MINUTE_ENV_VAR = "NOTE_MCP_RATE_LIMIT_PER_MINUTE"
+
+# Safe rate (10 requests/minute, see specs/001-note-mcp)
+RATE_LIMIT_REQUESTS = 10  # Requests per window
+RATE_LIMIT_WINDOW = 60  # Window size in seconds
+
+# Rate limiting configuration
+RATE_LIMIT_BURST = 10  # Maximum requests that can be sent back-to-back
+RATE_LIMIT_REFILL_RATE = RATE_LIMIT_REQUESTS / RATE_LIMIT_WINDOW  # Sustained requests per second
+
+# Lower bound for the refill rate after 429 backoff, as a fraction of the configured rate
+RATE_LIMIT_MIN_REFILL_FRACTION = 0.25
+RATE_LIMIT_MIN_REFILL_RATE = RATE_LIMIT_REFILL_RATE * RATE_LIMIT_MIN_REFILL_FRACTION
+
+# Adaptive behavior on 429 responses
+RATE_LIMIT_BACKOFF_FACTOR = 0.5  # Refill rate multiplier applied on each 429
+RATE_LIMIT_RECOVERY_FRACTION = 0.05  # Share of the configured rate regained per successful request
+
+
+class TokenBucket:
+    """Async token bucket with fair queueing and 429 backoff.
+
+    Each request consumes one token. Tokens are refilled continuously at
+    ``refill_rate`` per second up to ``capacity``. When no token is available,
+    callers wait in FIFO order (asyncio.Lock is fair) until one is refilled.
+
+    Attributes:
+        capacity: Maximum number of tokens (burst size)
+        max_refill_rate: Configured refill rate in tokens per second
+        min_refill_rate: Lower bound for the refill rate after 429 backoff
+        refill_rate: Current refill rate in tokens per second
+    """
+
+    def __init__(
+        self,
+        capacity: float = RATE_LIMIT_BURST,
+        refill_rate: float = RATE_LIMIT_REFILL_RATE,
+        min_refill_rate: float = RATE_LIMIT_MIN_REFILL_RATE,
+    ) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Refill rate in tokens per second
+            min_refill_rate: Lower bound for the refill rate after 429 backoff
+
+        Raises:
+            ValueError: If capacity or rates are not positive
+        """
+        if capacity < 1 or refill_rate <= 0 or min_refill_rate <= 0:
+            raise ValueError("capacity must be >= 1 and refill rates must be positive")
+
+        self.capacity = capacity
+        self.max_refill_rate = refill_rate
+        self.min_refill_rate = min(min_refill_rate, refill_rate)
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it.
+
+        Waiting callers are served in arrival order.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """Slow down after the server answered with 429.
+
+        Halves the refill rate (down to ``min_refill_rate``), drains the
+        bucket, and blocks new requests for ``retry_after`` seconds if given.
+
+        Args:
+            retry_after: Server-provided Retry-After delay in seconds (optional)
+        """
+        self._refill()
+        self.refill_rate = max(self.min_refill_rate, self.refill_rate * RATE_LIMIT_BACKOFF_FACTOR)
+        self._tokens = 0.0
+        if retry_after is not None and retry_after > 0:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+    def on_success(self) -> None:
+        """Gradually restore the refill rate after a successful request."""
+        if self.refill_rate < self.max_refill_rate:
+            self._refill()
+            self.refill_rate = min(
+                self.max_refill_rate,
+                self.refill_rate + self.max_refill_rate * RATE_LIMIT_RECOVERY_FRACTION,
+            )
+
+
+# Token buckets keyed by account, with the event loop they belong to
+# (asyncio.Lock cannot be shared across event loops).
+_rate_limiters: dict[str, tuple[asyncio.AbstractEventLoop, TokenBucket]] = {}
+
+
+def _positive_float_from_env(name: str, default: float) -> float:
+    """Read a positive number from an environment variable.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+
+    Returns:
+        Configured value
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        number = float(value)
+    except ValueError:
+        number = 0.0
+    if not number > 0:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default:g}")
+        return default
+    return number
+
+
+def get_rate_limiter(account: str) -> TokenBucket:
+    """Get the shared token bucket for an account.
+
+    Created with the limits of NOTE_MCP_RATE_LIMIT_BURST and
+    NOTE_MCP_RATE_LIMIT_PER_MINUTE.
+
+    Args:
+        account: Account identifier (empty string for anonymous access)
+
+    Returns:
+        TokenBucket shared by all API clients of the same account
+    """
+    loop = asyncio.get_running_loop()
+
+    entry = _rate_limiters.get(account)
+    if entry is not None and entry[0] is loop:
+        return entry[1]
+
+    refill_rate = _positive_float_from_env(PER_MINUTE_ENV_VAR, RATE_LIMIT_REFILL_RATE * 60) / 60
+    limiter = TokenBucket(
+        capacity=max(1, int(_positive_float_from_env(BURST_ENV_VAR, RATE_LIMIT_BURST))),
+        refill_rate=refill_rate,
+        min_refill_rate=refill_rate * RATE_LIMIT_MIN_REFILL_FRACTION,
+    )
+    _rate_limiters[account] = (loop, limiter)
+    return limiter
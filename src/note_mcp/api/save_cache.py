@@ -0,0 +1,109 @@
+"""Last-saved content cache for update_article().
+
+update_article() costs a numeric ID lookup, embed key registration and a
+draft_save request even when the submitted title, tags and Markdown body are
+identical to what this process last saved. The cache records a hash of that
+content (together with the returned Article) per article, so an unchanged
+update returns immediately without network calls.
+
+Entries are recorded under both the article key and the numeric ID. They are
+dropped whenever the article is changed through another code path (raw HTML
+updates, image insertion, publishing, deletion). Edits made outside this
+process are not detected, so the cache is kept in memory only and callers can
+bypass it with force=True.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from note_mcp.models import Article, ArticleInput
+
+
+def content_digest(article_input: ArticleInput) -> str:
+    """Hash the saved content of an article.
+
+    Args:
+        article_input: Title, tags and Markdown body (the eyecatch is not
+            part of draft_save and is ignored)
+
+    Returns:
+        Hex SHA-256 digest of the title, normalized tags and body
+    """
+    tags = [tag.lstrip("#") for tag in article_input.tags]
+    payload = json.dumps([article_input.title, tags, article_input.body], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SavedContentCache:
+    """Cache of article ID/key -> (content digest, saved Article)."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: dict[str, tuple[str, Article]] = {}
+
+    def __len__(self) -> int:
+        """Number of cached articles."""
+        return len({id(entry) for entry in self._entries.values()})
+
+    def get(self, article_id: str, digest: str) -> Article | None:
+        """Get the saved Article if its content matches the digest.
+
+        Args:
+            article_id: Article key or numeric ID
+            digest: Digest of the content about to be saved
+
+        Returns:
+            Article returned by the last save, or None if the content differs
+            or was never saved by this process
+        """
+        entry = self._entries.get(article_id)
+        if entry is None or entry[0] != digest:
+            return None
+        return entry[1]
+
+    def put(self, article_id: str, digest: str, article: Article) -> None:
+        """Record saved content.
+
+        Args:
+            article_id: Article key or numeric ID used for the save
+            digest: Digest of the saved content
+            article: Article returned by the save
+        """
+        self.forget(article_id)
+        entry = (digest, article)
+        for alias in {article_id, article.id, article.key}:
+            if alias:
+                self._entries[alias] = entry
+
+    def forget(self, article_id: str) -> None:
+        """Drop the entry of an article (under all of its aliases).
+
+        Args:
+            article_id: Article key or numeric ID
+        """
+        entry = self._entries.get(article_id)
+        if entry is None:
+            return
+        for alias in [alias for alias, other in self._entries.items() if other is entry]:
+            del self._entries[alias]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+_saved_content_cache: SavedContentCache | None = None
+
+
+def get_saved_content_cache() -> SavedContentCache:
+    """Get the process-wide last-saved content cache.
+
+    Returns:
+        Shared SavedContentCache instance
+    """
+    global _saved_content_cache
+    if _saved_content_cache is None:
+        _saved_content_cache = SavedContentCache()
+    return _saved_content_cache
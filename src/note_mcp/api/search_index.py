@@ -0,0 +1,325 @@
+"""Local full-text search index over the account's articles.
+
+Titles, tags and Markdown bodies are indexed in an SQLite FTS5 table with the
+trigram tokenizer, which matches substrings and therefore works for Japanese
+text without word segmentation. Articles are (re-)indexed whenever they are
+created, updated or fetched through the API and removed when deleted, so
+note_search_articles answers queries without network access.
+
+Like the article mirror, each index belongs to one account and is only
+searched by a session of that account; note_logout closes it. The index is
+kept in memory and only covers articles seen by this process. When the
+article mirror is enabled (NOTE_MCP_ARTICLE_MIRROR=1, see api.mirror), it is
+stored as search_index-<user_id>.db in the data directory and
+note_sync_articles fills it with every article of the account.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from pathlib import Path
+
+from note_mcp.api.mirror import MIRROR_ENV_VAR
+from note_mcp.models import ArticleSearchHit, ArticleStatus
+from note_mcp.storage import account_data_file
+
+logger = logging.getLogger(__name__)
+
+# Filename of the index inside the data directory (the account is appended)
+SEARCH_INDEX_FILENAME = "search_index.db"
+
+# Query terms shorter than this cannot use the trigram index
+TRIGRAM_LENGTH = 3
+
+# bm25 column weights: key, status (unindexed), title, tags, body
+_BM25_WEIGHTS = "0.0, 0.0, 10.0, 5.0, 1.0"
+
+# Characters of context on each side of a match in snippets
+_SNIPPET_CONTEXT = 30
+
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS article_fts USING fts5(
+    key UNINDEXED,
+    status UNINDEXED,
+    title,
+    tags,
+    body,
+    tokenize = 'trigram'
+);
+CREATE TABLE IF NOT EXISTS index_state (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# index_state entry holding the account the index was filled for
+_ACCOUNT = "account"
+
+
+class ArticleSearchIndex:
+    """SQLite FTS5 index of article titles, tags and Markdown bodies.
+
+    Attributes:
+        path: Database file, or ":memory:" for an in-memory database
+        account: Account (user ID) the indexed articles belong to
+    """
+
+    def __init__(self, path: Path | str = ":memory:", account: str | None = None) -> None:
+        """Open (and create if needed) the index.
+
+        An index filled for a different account is emptied first.
+
+        Args:
+            path: Database file, or ":memory:" for an in-memory database
+            account: Account (user ID) the indexed articles belong to
+
+        Raises:
+            sqlite3.OperationalError: If SQLite lacks FTS5 or the trigram tokenizer
+        """
+        self.path = path
+        self.account = account
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            row = self._conn.execute("SELECT value FROM index_state WHERE name = ?", (_ACCOUNT,)).fetchone()
+            stored_account = row[0] if row is not None else None
+            if stored_account != account:
+                if stored_account is not None:
+                    logger.warning(f"Discarding search index of another account: {path}")
+                self._conn.execute("DELETE FROM article_fts")
+                self._conn.execute("DELETE FROM index_state")
+                if account is not None:
+                    self._conn.execute("INSERT INTO index_state (name, value) VALUES (?, ?)", (_ACCOUNT, account))
+
+    def __len__(self) -> int:
+        """Number of indexed articles."""
+        return int(self._conn.execute("SELECT COUNT(*) FROM article_fts").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def add(
+        self,
+        article_key: str,
+        title: str,
+        tags: list[str],
+        markdown: str | None,
+        status: ArticleStatus | None = None,
+    ) -> None:
+        """Index an article, replacing any previous entry for its key.
+
+        Args:
+            article_key: Article key
+            title: Article title
+            tags: Hashtags (without # prefix)
+            markdown: Markdown body (None keeps the indexed body, empty for
+                new entries)
+            status: Publication status (None keeps the indexed status, draft
+                for new entries)
+        """
+        with self._conn:
+            row = self._conn.execute("SELECT status, body FROM article_fts WHERE key = ?", (article_key,)).fetchone()
+            if status is None:
+                status = ArticleStatus(row[0]) if row is not None else ArticleStatus.DRAFT
+            if markdown is None:
+                markdown = row[1] if row is not None else ""
+            self._conn.execute("DELETE FROM article_fts WHERE key = ?", (article_key,))
+            self._conn.execute(
+                "INSERT INTO article_fts (key, status, title, tags, body) VALUES (?, ?, ?, ?, ?)",
+                (article_key, status.value, title, " ".join(tags), markdown),
+            )
+
+    def set_status(self, article_key: str, status: ArticleStatus) -> None:
+        """Change the publication status of an indexed article.
+
+        Args:
+            article_key: Article key (ignored if not indexed)
+            status: New publication status
+        """
+        with self._conn:
+            self._conn.execute("UPDATE article_fts SET status = ? WHERE key = ?", (status.value, article_key))
+
+    def remove(self, article_key: str) -> None:
+        """Remove an article from the index.
+
+        Args:
+            article_key: Article key
+        """
+        with self._conn:
+            self._conn.execute("DELETE FROM article_fts WHERE key = ?", (article_key,))
+
+    def search(self, query: str, limit: int = 10) -> list[ArticleSearchHit]:
+        """Search indexed articles.
+
+        Every whitespace-separated term must appear in the title, tags or
+        body (case-insensitive substring match). Results are ranked by BM25
+        with title matches weighted above tags and tags above body.
+
+        Args:
+            query: Search terms
+            limit: Maximum number of hits
+
+        Returns:
+            Hits ordered from most to least relevant
+        """
+        terms = query.split()
+        if not terms or limit < 1:
+            return []
+
+        long_terms = [term for term in terms if len(term) >= TRIGRAM_LENGTH]
+        short_terms = [term for term in terms if len(term) < TRIGRAM_LENGTH]
+
+        conditions: list[str] = []
+        params: list[str | int] = []
+        if long_terms:
+            conditions.append("article_fts MATCH ?")
+            params.append(" ".join('"' + term.replace('"', '""') + '"' for term in long_terms))
+        for term in short_terms:
+            # Too short for trigrams: scan the (already narrowed) rows
+            conditions.append("(instr(lower(title), ?) > 0 OR instr(lower(tags), ?) > 0 OR instr(lower(body), ?) > 0)")
+            params.extend([term.lower()] * 3)
+
+        score = f"bm25(article_fts, {_BM25_WEIGHTS})" if long_terms else "0.0"
+        rows = self._conn.execute(
+            f"SELECT key, status, title, body, {score} AS score FROM article_fts "
+            f"WHERE {' AND '.join(conditions)} ORDER BY score, rowid DESC LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+
+        return [
+            ArticleSearchHit(
+                key=key,
+                title=title,
+                status=ArticleStatus(status),
+                snippet=_excerpt(body, terms),
+                score=-float(rank),
+            )
+            for key, status, title, body, rank in rows
+        ]
+
+
+def _excerpt(body: str, terms: list[str]) -> str:
+    """Cut the part of the body around the first matching term.
+
+    Args:
+        body: Markdown body
+        terms: Search terms
+
+    Returns:
+        Single-line excerpt with the matched term in [brackets], or the start
+        of the body when no term occurs in it
+    """
+    lowered = body.lower()
+    positions = [(lowered.find(term.lower()), term) for term in terms]
+    found = [(pos, term) for pos, term in positions if pos >= 0]
+    if not found:
+        return " ".join(body[: _SNIPPET_CONTEXT * 2].split())
+
+    pos, term = min(found)
+    end = pos + len(term)
+    start = max(pos - _SNIPPET_CONTEXT, 0)
+    stop = min(end + _SNIPPET_CONTEXT, len(body))
+    excerpt = f"{body[start:pos]}[{body[pos:end]}]{body[end:stop]}"
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if stop < len(body) else ""
+    return prefix + " ".join(excerpt.split()) + suffix
+
+
+_search_index: ArticleSearchIndex | None = None
+_search_index_unavailable = False
+
+
+def get_article_search_index(account: str) -> ArticleSearchIndex | None:
+    """Get the article search index of an account.
+
+    Created on first use; stored in the data directory when
+    NOTE_MCP_ARTICLE_MIRROR=1. An index opened for another account is closed
+    first, so a session never searches the articles of a previous login.
+
+    Args:
+        account: User ID of the current session
+
+    Returns:
+        ArticleSearchIndex of the account, or None if SQLite lacks FTS5
+    """
+    global _search_index, _search_index_unavailable
+    if _search_index is not None and _search_index.account != account:
+        close_article_search_index()
+    if _search_index is None and not _search_index_unavailable:
+        path = account_data_file(MIRROR_ENV_VAR, SEARCH_INDEX_FILENAME, account)
+        try:
+            _search_index = ArticleSearchIndex(path or ":memory:", account)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search is unavailable (SQLite FTS5 trigram tokenizer required): {e}")
+            _search_index_unavailable = True
+    return _search_index
+
+
+def close_article_search_index() -> None:
+    """Close the open search index (e.g., on logout).
+
+    An in-memory index is discarded; a stored index is reopened by the next
+    get_article_search_index() call for the same account.
+    """
+    global _search_index
+    if _search_index is not None:
+        _search_index.close()
+        _search_index = None
+
+
+def index_article(
+    account: str,
+    article_key: str | None,
+    title: str,
+    tags: list[str],
+    markdown: str | None,
+    status: ArticleStatus | None = None,
+) -> None:
+    """Index an article in the account's search index.
+
+    Does nothing when the key is unknown or full-text search is unavailable.
+
+    Args:
+        account: User ID of the session the article belongs to
+        article_key: Article key (numeric IDs and empty keys are ignored)
+        title: Article title
+        tags: Hashtags (# prefix optional)
+        markdown: Markdown body (None keeps the indexed body)
+        status: Publication status (None keeps the indexed status)
+    """
+    if not article_key or article_key.isdigit():
+        return
+    index = get_article_search_index(account)
+    if index is not None:
+        index.add(article_key, title, [tag.lstrip("#") for tag in tags], markdown, status)
+
+
+def update_indexed_status(account: str, article_key: str | None, status: ArticleStatus) -> None:
+    """Update the status of an article in the account's search index.
+
+    Args:
+        account: User ID of the session the article belongs to
+        article_key: Article key (articles that are not indexed are ignored)
+        status: Publication status
+    """
+    if not article_key:
+        return
+    index = get_article_search_index(account)
+    if index is not None:
+        index.set_status(article_key, status)
+
+
+def remove_indexed_article(account: str, article_key: str) -> None:
+    """Remove a deleted article from the account's search index.
+
+    Args:
+        account: User ID of the session the article belonged to
+        article_key: Article key
+    """
+    index = get_article_search_index(account)
+    if index is not None:
+        index.remove(article_key)
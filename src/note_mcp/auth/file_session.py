@@ -9,10 +9,11 @@ from __future__ import annotations
 
 import json
 import logging
-import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from note_mcp.storage import get_data_dir
+
 if TYPE_CHECKING:
     from note_mcp.models import Session
 
@@ -22,29 +23,6 @@ logger = logging.getLogger(__name__)
 SESSION_FILENAME = "session.json"
 
 
-def _get_default_data_dir() -> Path:
-    """Get the default data directory for session storage.
-
-    Returns:
-        Path to data directory. Priority:
-        1. NOTE_MCP_DATA_DIR environment variable
-        2. /app/data (Docker)
-        3. ~/.note-mcp (local)
-    """
-    # Check for environment variable first (Important #4)
-    env_dir = os.environ.get("NOTE_MCP_DATA_DIR")
-    if env_dir:
-        return Path(env_dir)
-
-    # Check for Docker environment
-    if Path("/app/data").exists() and os.access("/app/data", os.W_OK):
-        return Path("/app/data")
-
-    # Fall back to home directory
-    home = Path.home()
-    return home / ".note-mcp"
-
-
 class FileBasedSessionManager:
     """File-based session management for Docker/headless environments.
 
@@ -63,7 +41,7 @@ class FileBasedSessionManager:
             data_dir: Session file storage directory.
                       Default: /app/data (Docker) or ~/.note-mcp (local)
         """
-        self.data_dir = data_dir or _get_default_data_dir()
+        self.data_dir = data_dir or get_data_dir()
         self.session_file = self.data_dir / SESSION_FILENAME
 
     def save(self, session: Session) -> None:
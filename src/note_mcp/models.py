@@ -81,6 +81,8 @@ class Article(BaseModel):
         updated_at: Last update timestamp (ISO 8601)
         published_at: Publication timestamp (ISO 8601)
         url: Full article URL
+        unchanged: True when update_article() skipped the save because the
+            content matched the last save
     """
 
     id: str
@@ -95,6 +97,7 @@ class Article(BaseModel):
     updated_at: str | None = None
     published_at: str | None = None
     url: str | None = None
+    unchanged: bool = False
 
 
 class ArticleInput(BaseModel):
@@ -171,6 +174,42 @@ class ArticleListResult(BaseModel):
     has_more: bool
 
 
+class MirrorSyncResult(BaseModel):
+    """Result of synchronizing the local article mirror.
+
+    Attributes:
+        listed: Number of articles in the note list
+        fetched: Number of articles (re-)fetched because they were new or changed
+        unchanged: Number of articles skipped because updated_at was unchanged
+        removed: Number of mirrored articles no longer in the note list
+        failed_keys: Keys of articles that could not be fetched
+    """
+
+    listed: int
+    fetched: int
+    unchanged: int
+    removed: int
+    failed_keys: list[str] = []
+
+
+class ArticleSearchHit(BaseModel):
+    """Article found by a full-text search.
+
+    Attributes:
+        key: Article key
+        title: Article title
+        status: Publication status
+        snippet: Excerpt around the first match (match in [brackets])
+        score: Relevance score (higher is more relevant)
+    """
+
+    key: str
+    title: str
+    status: ArticleStatus
+    snippet: str
+    score: float
+
+
 class BrowserArticleResult(BaseModel):
     """Result of browser-based article creation/update.
 
@@ -6,32 +6,57 @@ Supports investigator mode for API investigation via INVESTIGATOR_MODE=1.
 
 from __future__ import annotations
 
+import asyncio
 import os
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Annotated
 
 from fastmcp import FastMCP
+from fastmcp.server.dependencies import get_context
 
 from note_mcp.api.articles import (
+    create_article_entry,
     create_draft,
     delete_all_drafts,
     delete_draft,
     get_article,
     list_articles,
     publish_article,
+    sync_article_mirror,
     update_article,
 )
+from note_mcp.api.client import close_pooled_clients
+from note_mcp.api.embeds import prefetch_embed_keys
 from note_mcp.api.images import insert_image_via_api, upload_body_image, upload_eyecatch_image
+from note_mcp.api.mirror import close_article_mirror
 from note_mcp.api.preview import get_preview_html
+from note_mcp.api.search_index import close_article_search_index, get_article_search_index
 from note_mcp.auth.browser import login_with_browser
 from note_mcp.auth.session import SessionManager
 from note_mcp.browser.preview import show_preview
 from note_mcp.decorators import handle_api_error, require_session
 from note_mcp.investigator import register_investigator_tools
-from note_mcp.models import ArticleInput, ArticleStatus, NoteAPIError, Session
-from note_mcp.utils.file_parser import parse_markdown_file
+from note_mcp.models import ArticleInput, ArticleStatus, Image, NoteAPIError, Session
+from note_mcp.utils.conversion_pool import shutdown_conversion_pool
+from note_mcp.utils.file_parser import LocalImage, ParsedArticle, parse_markdown_file, replace_local_image_paths
+from note_mcp.utils.markdown_to_html import find_embed_urls
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP[None]) -> AsyncIterator[None]:
+    """Server lifespan: release pooled API connections and conversion workers on shutdown."""
+    try:
+        yield
+    finally:
+        await close_pooled_clients()
+        shutdown_conversion_pool()
+
 
 # Create MCP server instance
-mcp = FastMCP("note-mcp")
+mcp = FastMCP("note-mcp", lifespan=_lifespan)
 
 
 # Session manager instance
@@ -83,12 +108,15 @@ async def note_check_auth() -> str:
 async def note_logout() -> str:
     """note.comからログアウトします。
 
-    保存されているセッション情報を削除します。
+    保存されているセッション情報を削除し、ローカルの記事ミラーと
+    全文検索インデックスを閉じます。
 
     Returns:
         ログアウト結果のメッセージ
     """
     _session_manager.clear()
+    close_article_mirror()
+    close_article_search_index()
     return "ログアウトしました。"
 
 
@@ -220,17 +248,20 @@ async def note_update_article(
     title: Annotated[str, "新しいタイトル"],
     body: Annotated[str, "新しい本文（Markdown形式）"],
     tags: Annotated[list[str] | None, "新しいタグ（#なしでも可）"] = None,
+    force: Annotated[bool, "内容が前回の保存と同じでも保存する場合はTrue"] = False,
 ) -> str:
     """既存の記事を更新します。
 
     編集前にnote_get_articleで既存内容を取得することを推奨します。
     Markdown形式の本文をHTMLに変換してnote.comに送信します。
+    タイトル・タグ・本文が前回の保存と同じ場合は、APIを呼び出さずに終了します。
 
     Args:
         article_id: 更新する記事のID
         title: 新しいタイトル
         body: 新しい本文（Markdown形式）
         tags: 新しいタグ（オプション）
+        force: 内容に変更がなくても保存する場合はTrue
 
     Returns:
         更新結果のメッセージ
@@ -246,10 +277,13 @@ async def note_update_article(
     )
 
     try:
-        article = await update_article(session, article_id, article_input)
+        article = await update_article(session, article_id, article_input, force=force)
     except NoteAPIError as e:
         return f"記事更新に失敗しました: {e}"
 
+    if article.unchanged:
+        return f"前回の保存から変更がないため、更新をスキップしました。ID: {article.id}"
+
     tag_info = f"、タグ: {', '.join(article.tags)}" if article.tags else ""
     return f"記事を更新しました。ID: {article.id}{tag_info}"
 
@@ -432,8 +466,6 @@ async def note_publish_article(
     Returns:
         公開結果のメッセージ（記事URLを含む）
     """
-    from pathlib import Path
-
     session = _session_manager.load()
     if session is None or session.is_expired():
         return "セッションが無効です。note_loginでログインしてください。"
@@ -522,6 +554,171 @@ async def note_list_articles(
     return "\n".join(lines)
 
 
+@mcp.tool()
+async def note_sync_articles() -> str:
+    """記事のローカルミラーを同期します。
+
+    記事一覧を取得し、新規または更新日時が変わった記事のみを再取得して
+    ローカルのSQLiteデータベースに保存します。同期後は記事一覧・記事取得が
+    ローカルから返されます。
+
+    環境変数 NOTE_MCP_ARTICLE_MIRROR=1 でミラーを有効にする必要があります。
+
+    Returns:
+        同期結果（取得件数、変更なし件数、削除件数）
+    """
+    session = _session_manager.load()
+    if session is None or session.is_expired():
+        return "セッションが無効です。note_loginでログインしてください。"
+
+    try:
+        result = await sync_article_mirror(session)
+    except NoteAPIError as e:
+        return f"記事の同期に失敗しました: {e}"
+
+    lines = [
+        f"記事を同期しました（{result.listed}件）。",
+        f"  取得: {result.fetched}件、変更なし: {result.unchanged}件、削除: {result.removed}件",
+    ]
+    if result.failed_keys:
+        lines.append(f"  取得に失敗した記事: {', '.join(result.failed_keys)}")
+
+    return "\n".join(lines)
+
+
+@mcp.tool()
+async def note_search_articles(
+    query: Annotated[str, "検索語（空白区切りで複数指定するとすべてを含む記事を検索）"],
+    limit: Annotated[int, "最大件数"] = 10,
+) -> str:
+    """記事をキーワードで全文検索します。
+
+    タイトル・タグ・本文（Markdown）のローカル全文検索インデックスを検索し、
+    関連度順に記事キーと本文の抜粋を返します。ネットワークにはアクセスしません。
+
+    インデックスには、このサーバーで作成・更新・取得した記事が登録されます。
+    インデックスはアカウントごとで、ログイン中のアカウントの記事のみを検索します。
+    NOTE_MCP_ARTICLE_MIRROR=1 の場合はインデックスが保存され、
+    note_sync_articles ですべての記事が登録されます。
+
+    Args:
+        query: 検索語（空白区切りで複数指定可）
+        limit: 最大件数
+
+    Returns:
+        検索結果（記事キー、タイトル、抜粋）
+    """
+    session = _session_manager.load()
+    if session is None or session.is_expired():
+        return "セッションが無効です。note_loginでログインしてください。"
+
+    index = get_article_search_index(session.user_id)
+    if index is None:
+        return "全文検索を利用できません（SQLiteのFTS5が必要です）。"
+
+    hits = index.search(query, limit)
+    if not hits:
+        return f"「{query}」に一致する記事が見つかりませんでした。"
+
+    lines = [f"「{query}」の検索結果（{len(hits)}件）:"]
+    for hit in hits:
+        status_label = "下書き" if hit.status == ArticleStatus.DRAFT else "公開済み"
+        lines.append(f"  - [{status_label}] {hit.title} (キー: {hit.key})")
+        if hit.snippet:
+            lines.append(f"    {hit.snippet}")
+
+    return "\n".join(lines)
+
+
+# Maximum number of image uploads in flight in note_create_from_file
+IMAGE_UPLOAD_CONCURRENCY = 4
+
+
+@dataclass
+class _FileImageUploads:
+    """Outcome of uploading the images referenced by a Markdown file.
+
+    Attributes:
+        urls: Uploaded URL for each local image, keyed by its Markdown path
+        failed_images: Failure messages for body images, in document order
+        eyecatch_uploaded: Whether the eyecatch image was uploaded
+        eyecatch_error: Failure message for the eyecatch image, if any
+    """
+
+    urls: dict[str, str] = field(default_factory=dict)
+    failed_images: list[str] = field(default_factory=list)
+    eyecatch_uploaded: bool = False
+    eyecatch_error: str | None = None
+
+
+async def _upload_file_images(
+    session: Session,
+    parsed: ParsedArticle,
+    article_id: str,
+    max_concurrency: int = IMAGE_UPLOAD_CONCURRENCY,
+) -> _FileImageUploads:
+    """Upload a parsed file's local images and eyecatch concurrently.
+
+    Each distinct Markdown path is uploaded once. Failures are recorded per
+    image and do not stop the other uploads.
+
+    Args:
+        session: Authenticated session
+        parsed: Parsed Markdown file
+        article_id: ID of the article the images belong to
+        max_concurrency: Maximum number of uploads in flight at once
+
+    Returns:
+        Uploaded URLs and per-image failures
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def upload(
+        uploader: Callable[[Session, str, str], Awaitable[Image]],
+        path: Path,
+    ) -> str | NoteAPIError:
+        async with semaphore:
+            try:
+                image = await uploader(session, str(path), article_id)
+            except NoteAPIError as e:
+                return e
+            return image.url
+
+    images: dict[str, LocalImage] = {}
+    for img in parsed.local_images:
+        images.setdefault(img.markdown_path, img)
+
+    existing = [img for img in images.values() if img.absolute_path.exists()]
+    eyecatch = parsed.eyecatch if parsed.eyecatch and parsed.eyecatch.exists() else None
+
+    # Eyecatch first: it is a single upload and should not wait behind the body images
+    uploads = [upload(upload_eyecatch_image, eyecatch)] if eyecatch is not None else []
+    uploads.extend(upload(upload_body_image, img.absolute_path) for img in existing)
+    outcomes = await asyncio.gather(*uploads)
+    eyecatch_outcome = outcomes.pop(0) if eyecatch is not None else None
+
+    result = _FileImageUploads()
+    body_outcomes = dict(zip((img.markdown_path for img in existing), outcomes, strict=True))
+    for markdown_path in images:
+        outcome = body_outcomes.get(markdown_path)
+        if outcome is None:
+            result.failed_images.append(f"{markdown_path}: ファイルが見つかりません")
+        elif isinstance(outcome, NoteAPIError):
+            result.failed_images.append(f"{markdown_path}: {outcome}")
+        else:
+            result.urls[markdown_path] = outcome
+
+    if parsed.eyecatch is not None:
+        if eyecatch is None:
+            result.eyecatch_error = f"ファイルが見つかりません: {parsed.eyecatch}"
+        elif isinstance(eyecatch_outcome, NoteAPIError):
+            result.eyecatch_error = f"{parsed.eyecatch.name}: {eyecatch_outcome}"
+        else:
+            result.eyecatch_uploaded = True
+
+    return result
+
+
 @mcp.tool()
 async def note_create_from_file(
     file_path: Annotated[str, "Markdownファイルのパス"],
@@ -543,6 +740,7 @@ async def note_create_from_file(
 
     ローカル画像（./images/example.pngなど）は自動的にアップロードされ、
     本文内のパスがnote.comのURLに置換されます。
+    画像とアイキャッチ画像は並行してアップロードされます。
 
     アイキャッチ画像が指定されている場合、自動的にアップロードされ、
     記事のアイキャッチとして設定されます。
@@ -559,8 +757,6 @@ async def note_create_from_file(
     if session is None:
         return "ログインが必要です。note_loginを実行してください。"
 
-    from pathlib import Path
-
     try:
         parsed = parse_markdown_file(Path(file_path))
     except FileNotFoundError:
@@ -575,57 +771,29 @@ async def note_create_from_file(
     )
 
     try:
-        article = await create_draft(session, article_input)
-
-        uploaded_count = 0
-        failed_images: list[str] = []
-
-        # Upload images via API and replace local paths with URLs
-        updated_body = parsed.body
-        if upload_images and parsed.local_images:
-            for img in parsed.local_images:
-                if img.absolute_path.exists():
-                    try:
-                        upload_result = await upload_body_image(
-                            session,
-                            str(img.absolute_path),
-                            article.id,
-                        )
-                        updated_body = updated_body.replace(
-                            f"({img.markdown_path})",
-                            f"({upload_result.url})",
-                        )
-                        uploaded_count += 1
-                    except NoteAPIError as e:
-                        failed_images.append(f"{img.markdown_path}: {e}")
-                else:
-                    failed_images.append(f"{img.markdown_path}: ファイルが見つかりません")
-
-        # Update article with image URLs
-        if uploaded_count > 0:
-            updated_input = ArticleInput(
-                title=parsed.title,
-                body=updated_body,
-                tags=parsed.tags,
+        # Create the article entry first: uploads and embed registration need its ID/key
+        article = await create_article_entry(session, article_input)
+
+        # Upload body images and eyecatch, and register embeds, concurrently
+        uploads = _FileImageUploads()
+        if upload_images:
+            uploads, _ = await asyncio.gather(
+                _upload_file_images(session, parsed, article.id),
+                prefetch_embed_keys(session, find_embed_urls(parsed.body), article.key),
             )
-            await update_article(session, article.key, updated_input)
 
-        # Upload eyecatch image if specified
-        eyecatch_uploaded = False
-        eyecatch_error: str | None = None
-        if upload_images and parsed.eyecatch:
-            if parsed.eyecatch.exists():
-                try:
-                    await upload_eyecatch_image(
-                        session,
-                        str(parsed.eyecatch),
-                        article.id,
-                    )
-                    eyecatch_uploaded = True
-                except NoteAPIError as e:
-                    eyecatch_error = f"{parsed.eyecatch.name}: {e}"
-            else:
-                eyecatch_error = f"ファイルが見つかりません: {parsed.eyecatch}"
+        # Convert and save the body once, with local image paths replaced by URLs
+        final_input = ArticleInput(
+            title=parsed.title,
+            body=replace_local_image_paths(parsed.body, uploads.urls),
+            tags=parsed.tags,
+        )
+        await update_article(session, article.key, final_input)
+
+        uploaded_count = len(uploads.urls)
+        failed_images = uploads.failed_images
+        eyecatch_uploaded = uploads.eyecatch_uploaded
+        eyecatch_error = uploads.eyecatch_error
 
         result_lines = [
             "✅ 下書きを作成しました",
@@ -703,6 +871,24 @@ async def note_delete_draft(
         return f"削除に失敗しました: {e.message}"
 
 
+def _delete_progress_reporter() -> Callable[[int, int], Awaitable[None]] | None:
+    """Build a progress callback reporting to the active MCP request.
+
+    Returns:
+        Callback sending MCP progress notifications, or None when called
+        outside of an MCP request (e.g. directly from tests)
+    """
+    try:
+        ctx = get_context()
+    except RuntimeError:
+        return None
+
+    async def report(completed: int, total: int) -> None:
+        await ctx.report_progress(completed, total, f"{completed}/{total}件の下書きを処理しました")
+
+    return report
+
+
 @mcp.tool()
 async def note_delete_all_drafts(
     confirm: Annotated[bool, "削除を実行する場合はTrue、確認のみの場合はFalse"] = False,
@@ -718,6 +904,9 @@ async def note_delete_all_drafts(
 
     **注意**: 削除は取り消しできません。
 
+    削除は並行して実行され、クライアントが進捗トークンを指定した場合は
+    MCPの進捗通知（完了件数/総件数）が送信されます。
+
     Args:
         confirm: 削除を実行する場合はTrue（デフォルトはFalse）
 
@@ -729,7 +918,8 @@ async def note_delete_all_drafts(
         return "セッションが無効です。note_loginでログインしてください。"
 
     try:
-        result = await delete_all_drafts(session, confirm=confirm)
+        on_progress = _delete_progress_reporter()
+        result = await delete_all_drafts(session, confirm=confirm, on_progress=on_progress)
 
         # Check result type and format response
         from note_mcp.models import BulkDeletePreview, BulkDeleteResult
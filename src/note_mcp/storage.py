@@ -0,0 +1,189 @@
+"""Data directory and JSON file helpers for persisted state.
+
+Sessions, caches and the article mirror are stored in one data directory:
+
+1. NOTE_MCP_DATA_DIR environment variable
+2. /app/data (Docker)
+3. ~/.note-mcp (local)
+
+Optional on-disk stores are enabled by an environment variable set to "1";
+data_file() returns their path, or None while they are disabled. Stores that
+hold account data use account_data_file(), which puts the account in the
+filename so that another login never sees them.
+
+JSON stores rewrite the whole file on every change. JsonFileStore.batch()
+defers those writes, so recording the many entries of one API response
+costs a single write.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the data directory
+DATA_DIR_ENV_VAR = "NOTE_MCP_DATA_DIR"
+
+
+def get_data_dir() -> Path:
+    """Get the data directory for sessions and persisted caches.
+
+    Returns:
+        Path to data directory. Priority:
+        1. NOTE_MCP_DATA_DIR environment variable
+        2. /app/data (Docker)
+        3. ~/.note-mcp (local)
+    """
+    env_dir = os.environ.get(DATA_DIR_ENV_VAR)
+    if env_dir:
+        return Path(env_dir)
+
+    # Check for Docker environment
+    if Path("/app/data").exists() and os.access("/app/data", os.W_OK):
+        return Path("/app/data")
+
+    # Fall back to home directory
+    return Path.home() / ".note-mcp"
+
+
+def data_file(enable_env_var: str, filename: str) -> Path | None:
+    """Get the path of an optional on-disk store.
+
+    Args:
+        enable_env_var: Environment variable that enables the store when "1"
+        filename: Filename inside the data directory
+
+    Returns:
+        Path inside the data directory, or None if the store is disabled
+    """
+    if os.environ.get(enable_env_var) != "1":
+        return None
+    return get_data_dir() / filename
+
+
+def account_data_file(enable_env_var: str, filename: str, account: str) -> Path | None:
+    """Get the path of an optional on-disk store that belongs to one account.
+
+    Args:
+        enable_env_var: Environment variable that enables the store when "1"
+        filename: Filename inside the data directory (e.g., "articles.db")
+        account: Account the store belongs to (e.g., the session user ID)
+
+    Returns:
+        Path such as "articles-<account>.db" inside the data directory, or
+        None if the store is disabled
+
+    Example:
+        account_data_file("NOTE_MCP_ARTICLE_MIRROR", "articles.db", "12345")
+        # -> ~/.note-mcp/articles-12345.db
+    """
+    path = Path(filename)
+    safe_account = re.sub(r"[^0-9A-Za-z_-]", "_", account)
+    return data_file(enable_env_var, f"{path.stem}-{safe_account}{path.suffix}")
+
+
+def load_json_object(path: Path, description: str) -> dict[str, Any] | None:
+    """Load a JSON object from a file, ignoring missing or unreadable files.
+
+    Args:
+        path: JSON file
+        description: What the file holds, for log messages (e.g., "note ID cache")
+
+    Returns:
+        Parsed object, or None if the file is missing, unreadable or not an object
+    """
+    if not path.exists():
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to load {description} from {path}: {e}")
+        return None
+    if not isinstance(data, dict):
+        logger.warning(f"Ignoring {description} with invalid structure: {path}")
+        return None
+    return data
+
+
+def save_json(path: Path, data: Any, description: str) -> None:
+    """Write data to a JSON file (failures are logged, not raised).
+
+    Args:
+        path: JSON file (parent directories are created)
+        data: JSON-serializable data
+        description: What the file holds, for log messages
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError as e:
+        logger.warning(f"Failed to save {description} to {path}: {e}")
+
+
+class JsonFileStore:
+    """Base class of in-memory caches optionally mirrored to a JSON file.
+
+    Subclasses call _changed() after each modification and implement
+    _to_json(). Inside batch() the file is written once, when the outermost
+    batch ends, instead of on every change.
+
+    Attributes:
+        path: JSON file used as on-disk store (None for memory only)
+        description: What the file holds, for log messages
+    """
+
+    description = "cache"
+
+    def __init__(self, path: Path | None) -> None:
+        """Initialize the store.
+
+        Args:
+            path: JSON file to save to (None for memory only)
+        """
+        self.path = path
+        self._batch_depth = 0
+        self._dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer writes to the on-disk store until the outermost batch ends.
+
+        Yields:
+            None
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save()
+
+    def _changed(self) -> None:
+        """Write the store, or mark it for writing when the batch ends."""
+        if self.path is None:
+            return
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._save()
+
+    def _to_json(self) -> Any:
+        """Get the JSON-serializable content of the store."""
+        raise NotImplementedError
+
+    def _save(self) -> None:
+        """Write the store to the on-disk file (failures are logged, not raised)."""
+        assert self.path is not None
+        self._dirty = False
+        save_json(self.path, self._to_json(), self.description)
@@ -0,0 +1,211 @@
+"""Worker pool for large Markdown/HTML conversions.
+
+markdown_to_html() and html_to_markdown() are CPU-bound and are called from
+async tool handlers. Converting a very large article on the event loop stalls
+every other request served by the same loop (e.g. all clients in --http
+mode). run_conversion() converts inputs longer than a threshold in a worker
+pool instead; smaller inputs are still converted inline, where a round trip
+to the pool would cost more than the conversion itself.
+
+The pool is configured by environment variables, read when it is first used:
+
+- NOTE_MCP_CONVERSION_WORKERS: number of workers (default 2, 0 converts
+  everything inline)
+- NOTE_MCP_CONVERSION_THRESHOLD: minimum input length in characters that is
+  sent to the pool (default 32768)
+- NOTE_MCP_CONVERSION_POOL: "thread" (default) or "process"
+
+Thread workers share the process-wide caches (e.g. the HTML block cache) but
+still take turns with the event loop for the GIL, so other requests slow down
+while a conversion runs. Process workers keep the loop fully responsive, at
+the cost of pickling input and output and of a separate cache per worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Environment variables configuring the pool
+WORKERS_ENV_VAR = "NOTE_MCP_CONVERSION_WORKERS"
+THRESHOLD_ENV_VAR = "NOTE_MCP_CONVERSION_THRESHOLD"
+POOL_ENV_VAR = "NOTE_MCP_CONVERSION_POOL"
+
+# Default number of workers
+DEFAULT_WORKERS = 2
+
+# Default minimum input length (characters) converted in the pool
+DEFAULT_THRESHOLD = 32_768
+
+# Supported pool kinds
+POOL_KINDS = ("thread", "process")
+
+
+class ConversionPool:
+    """Runs large conversions in a thread or process pool.
+
+    The executor is created on the first offloaded conversion.
+
+    Attributes:
+        workers: Number of workers (0 converts everything inline)
+        threshold: Minimum input length in characters sent to the pool
+        kind: "thread" or "process"
+    """
+
+    def __init__(
+        self, workers: int = DEFAULT_WORKERS, threshold: int = DEFAULT_THRESHOLD, kind: str = "thread"
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            workers: Number of workers (0 converts everything inline)
+            threshold: Minimum input length in characters sent to the pool
+            kind: "thread" or "process"
+
+        Raises:
+            ValueError: If workers or threshold is negative, or kind is unknown.
+        """
+        if workers < 0:
+            raise ValueError("workers must be >= 0")
+        if threshold < 0:
+            raise ValueError("threshold must be >= 0")
+        if kind not in POOL_KINDS:
+            raise ValueError(f"kind must be one of {', '.join(POOL_KINDS)}")
+        self.workers = workers
+        self.threshold = threshold
+        self.kind = kind
+        self._executor: Executor | None = None
+
+    def offloads(self, text: str) -> bool:
+        """Check whether converting a text is sent to the pool.
+
+        Args:
+            text: Conversion input
+
+        Returns:
+            True if the text is converted by a worker
+        """
+        return self.workers > 0 and len(text) >= self.threshold
+
+    async def run(self, convert: Callable[..., str], text: str, **kwargs: Any) -> str:
+        """Convert a text, in a worker if it is at least threshold characters long.
+
+        Args:
+            convert: Conversion function (e.g., markdown_to_html); with a
+                process pool it must be picklable (a module-level function)
+            text: Conversion input
+            **kwargs: Keyword arguments passed to convert
+
+        Returns:
+            Converted text
+        """
+        if not self.offloads(text):
+            return convert(text, **kwargs)
+
+        call = functools.partial(convert, text, **kwargs)
+        loop = asyncio.get_running_loop()
+        if self.kind == "thread":
+            # Carry context variables (e.g. stable_element_ids) into the worker
+            return await loop.run_in_executor(self._get_executor(), contextvars.copy_context().run, call)
+        return await loop.run_in_executor(self._get_executor(), call)
+
+    def shutdown(self) -> None:
+        """Shut down the executor, waiting for running conversions.
+
+        The pool can still be used afterwards; a new executor is created.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        """Get the executor, creating it on first use."""
+        if self._executor is None:
+            if self.kind == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="note-mcp-convert")
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+
+def _int_from_env(name: str, default: int) -> int:
+    """Read a non-negative integer from an environment variable.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+
+    Returns:
+        Configured value
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+    return number
+
+
+_conversion_pool: ConversionPool | None = None
+
+
+def get_conversion_pool() -> ConversionPool:
+    """Get the process-wide conversion pool.
+
+    Created on first use from NOTE_MCP_CONVERSION_WORKERS,
+    NOTE_MCP_CONVERSION_THRESHOLD and NOTE_MCP_CONVERSION_POOL.
+
+    Returns:
+        Shared ConversionPool instance
+    """
+    global _conversion_pool
+    if _conversion_pool is None:
+        kind = os.environ.get(POOL_ENV_VAR, "thread")
+        if kind not in POOL_KINDS:
+            logger.warning(f"Ignoring invalid {POOL_ENV_VAR}={kind!r}, using thread")
+            kind = "thread"
+        _conversion_pool = ConversionPool(
+            workers=_int_from_env(WORKERS_ENV_VAR, DEFAULT_WORKERS),
+            threshold=_int_from_env(THRESHOLD_ENV_VAR, DEFAULT_THRESHOLD),
+            kind=kind,
+        )
+    return _conversion_pool
+
+
+def shutdown_conversion_pool() -> None:
+    """Shut down the workers of the process-wide pool (e.g., on server shutdown).
+
+    Does nothing if the pool was never used.
+    """
+    if _conversion_pool is not None:
+        _conversion_pool.shutdown()
+
+
+async def run_conversion(convert: Callable[..., str], text: str, **kwargs: Any) -> str:
+    """Convert a text, in the process-wide pool if it is large.
+
+    Args:
+        convert: Conversion function (e.g., markdown_to_html)
+        text: Conversion input
+        **kwargs: Keyword arguments passed to convert
+
+    Returns:
+        Converted text
+
+    Example:
+        html_body = await run_conversion(markdown_to_html, article_input.body)
+    """
+    return await get_conversion_pool().run(convert, text, **kwargs)
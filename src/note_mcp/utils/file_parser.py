@@ -312,3 +312,24 @@ def _detect_local_images(body: str, base_dir: Path) -> list[LocalImage]:
         )
 
     return images
+
+
+def replace_local_image_paths(body: str, image_urls: dict[str, str]) -> str:
+    """Replace local image paths in Markdown content with uploaded URLs.
+
+    Every "(markdown_path)" occurrence is rewritten in a single pass over the body.
+
+    Args:
+        body: The Markdown body content
+        image_urls: Mapping of markdown_path (as written in Markdown) to uploaded URL
+
+    Returns:
+        Markdown body with local image paths replaced
+    """
+    if not image_urls:
+        return body
+
+    # Longest paths first so that no path shadows a longer one sharing its prefix
+    paths = sorted(image_urls, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(f"({path})") for path in paths))
+    return pattern.sub(lambda m: f"({image_urls[m.group(0)[1:-1]]})", body)
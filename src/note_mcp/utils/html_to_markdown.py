@@ -2,92 +2,57 @@
 
 Converts note.com HTML format (ProseMirror) back to Markdown.
 This is the reverse operation of markdown_to_html.
+
+The HTML is tokenized once with the standard library's html.parser. The
+writer keeps a stack of the open elements that matter for Markdown (blocks,
+lists, figures and inline formatting); each one collects the Markdown of its
+content and hands the formatted result to its parent when it is closed.
+Conversion therefore takes time linear in the size of the body, and nesting
+follows the actual element tree. Other tags are dropped and their text is
+kept.
 """
 
-import html
 import re
-from collections.abc import Callable
-
-# Pre-compiled regex patterns for basic elements
-# Match <pre><code>...</code></pre> with or without class="codeBlock"
-_CODE_BLOCK_PATTERN = re.compile(
-    r"<pre[^>]*><code>(.*?)</code></pre>",
-    re.DOTALL | re.IGNORECASE,
-)
-# Match <pre>...</pre> without <code> tag (fallback for some note.com formats)
-_PRE_ONLY_PATTERN = re.compile(
-    r"<pre[^>]*>(?!<code>)(.*?)</pre>",
-    re.DOTALL | re.IGNORECASE,
-)
-_HEADING_PATTERN = re.compile(
-    r"<(h[1-6])[^>]*>(.*?)</\1>",
-    re.IGNORECASE | re.DOTALL,
-)
-_PARAGRAPH_PATTERN = re.compile(
-    r"<p[^>]*>(.*?)</p>",
-    re.IGNORECASE | re.DOTALL,
-)
-_HR_PATTERN = re.compile(r"<hr[^>]*/?>", re.IGNORECASE)
-
-# Patterns for complex elements
-_BLOCKQUOTE_FIGURE_PATTERN = re.compile(
-    r"<figure[^>]*>\s*<blockquote[^>]*>(.*?)</blockquote>\s*"
-    r"<figcaption>(.*?)</figcaption>\s*</figure>",
-    re.DOTALL | re.IGNORECASE,
-)
-_BR_PATTERN = re.compile(r"<br\s*/?>", re.IGNORECASE)
-_FIGCAPTION_LINK_PATTERN = re.compile(
-    r'<a\s+href="([^"]+)"[^>]*>([^<]+)</a>',
-    re.IGNORECASE,
-)
-_IMAGE_FIGURE_PATTERN = re.compile(
-    r'<figure[^>]*>\s*<img[^>]*src="([^"]+)"[^>]*alt="([^"]*)"[^>]*>\s*'
-    r"<figcaption>(.*?)</figcaption>\s*</figure>",
-    re.DOTALL | re.IGNORECASE,
-)
-# Alternative pattern for img with alt before src
-_IMAGE_FIGURE_PATTERN_ALT = re.compile(
-    r'<figure[^>]*>\s*<img[^>]*alt="([^"]*)"[^>]*src="([^"]+)"[^>]*>\s*'
-    r"<figcaption>(.*?)</figcaption>\s*</figure>",
-    re.DOTALL | re.IGNORECASE,
-)
-_UL_PATTERN = re.compile(r"<ul[^>]*>(.*?)</ul>", re.DOTALL | re.IGNORECASE)
-_OL_PATTERN = re.compile(r"<ol[^>]*>(.*?)</ol>", re.DOTALL | re.IGNORECASE)
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
 
-# Patterns for inline elements
-_LINK_PATTERN = re.compile(
-    r'<a\s+href="([^"]+)"[^>]*>(.*?)</a>',
-    re.DOTALL | re.IGNORECASE,
-)
-_STRONG_PATTERN = re.compile(r"<strong>(.*?)</strong>", re.DOTALL | re.IGNORECASE)
-_EM_PATTERN = re.compile(r"<em>(.*?)</em>", re.DOTALL | re.IGNORECASE)
-_INLINE_CODE_PATTERN = re.compile(r"<code>(.*?)</code>", re.DOTALL | re.IGNORECASE)
-_STRIKETHROUGH_PATTERN = re.compile(r"<s>(.*?)</s>", re.DOTALL | re.IGNORECASE)
-
-# TOC element pattern (note.com uses TableOfContents class)
-# Match elements with class containing "TableOfContents"
-_TOC_ELEMENT_PATTERN = re.compile(
-    r'<[^>]*class="[^"]*TableOfContents[^"]*"[^>]*>.*?</(?:div|section|nav)>',
-    re.DOTALL | re.IGNORECASE,
-)
-# Also match self-closing or empty TOC elements
-_TOC_ELEMENT_SIMPLE_PATTERN = re.compile(
-    r'<[^>]*class="[^"]*TableOfContents[^"]*"[^>]*/?>',
-    re.IGNORECASE,
-)
-
-# Text alignment pattern (Issue #40)
-# Match <p ... style="text-align: center/right/left" ...> with possible other style properties
-_TEXT_ALIGN_P_PATTERN = re.compile(
-    r'<p([^>]*style="[^"]*text-align:\s*(center|right|left)[^"]*"[^>]*)>(.*?)</p>',
-    re.DOTALL | re.IGNORECASE,
-)
-
-# Cleanup patterns
-_UUID_ATTR_PATTERN = re.compile(
-    r'\s(?:name|id)="[a-f0-9-]{36}"',
-    re.IGNORECASE,
+# Elements without content (their end tags are ignored)
+_VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
 )
+# Elements whose content is not article text
+_SKIPPED_TAGS = frozenset({"script", "style", "template"})
+_HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+# Inline formatting elements and their Markdown markers
+_INLINE_MARKERS = {
+    "strong": "**",
+    "b": "**",
+    "em": "*",
+    "i": "*",
+    "s": "~~",
+    "del": "~~",
+    "strike": "~~",
+    "code": "`",
+}
+# Containers whose whitespace-only text is layout between blocks
+_BLOCK_CONTAINER_TAGS = frozenset({"", "ul", "ol", "figure"})
+
+# TOC element (note.com uses TableOfContents class, markdown_to_html <table-of-contents>)
+_TOC_TAG = "table-of-contents"
+_TOC_CLASS = "TableOfContents"
+
+# Text alignment in a paragraph's style attribute (Issue #40)
+_TEXT_ALIGN_PATTERN = re.compile(r"text-align:\s*(center|right|left)", re.IGNORECASE)
+_ALIGNMENT_FORMATS = {
+    "center": "->{}<-",
+    "right": "->{}",
+    "left": "<-{}",
+}
+
+# Language class of a code block's <code> element
+_LANGUAGE_CLASS_PATTERN = re.compile(r"(?:^|\s)language-(\S+)")
+
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
 
 
 def _strip_fence_markers(code: str) -> str:
@@ -119,35 +84,331 @@ def _strip_fence_markers(code: str) -> str:
     return code.strip()
 
 
-def _create_code_block_extractor(code_blocks: list[str]) -> Callable[[re.Match[str]], str]:
-    """Create a code block extractor closure with local storage.
+@dataclass
+class _Element:
+    """An open element and the Markdown written for its content so far."""
 
-    Args:
-        code_blocks: List to store extracted code blocks (mutated in place)
+    tag: str
+    attrs: dict[str, str] = field(default_factory=dict)
+    parts: list[str] = field(default_factory=list)
 
-    Returns:
-        A function that extracts code blocks and returns placeholders
-    """
 
-    def extract_code_block(match: re.Match[str]) -> str:
-        """Extract code block and replace with placeholder."""
-        code = match.group(1)
-        code = html.unescape(code)
-        # Remove any remaining fence markers (``` at start/end)
-        code = _strip_fence_markers(code)
-        # Include trailing newlines for proper paragraph separation
-        block = f"```\n{code}\n```\n\n"
-        code_blocks.append(block)
-        return f"__CODE_BLOCK_{len(code_blocks) - 1}__"
+@dataclass
+class _ListElement(_Element):
+    """An open <ul>/<ol>; nested lists write to the lines of the top-level list."""
 
-    return extract_code_block
+    ordered: bool = False
+    indent: str = ""
+    counter: int = 1
+    nested: bool = False
+    lines: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _ItemElement(_Element):
+    """An open <li>; parts holds inline content not yet part of a paragraph."""
+
+    line_index: int = 0  # Slot in the list lines reserved for the item
+    paragraphs: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _FigureElement(_Element):
+    """An open <figure> (quote, image or embed)."""
+
+    quote_lines: list[str] | None = None
+    image: tuple[str, str] | None = None  # (alt, src)
+    caption: str = ""
+    caption_link: tuple[str, str] | None = None  # (text, url)
+
+
+@dataclass
+class _CaptionElement(_Element):
+    """An open <figcaption>; remembers its first link for quote citations."""
+
+    link: tuple[str, str] | None = None  # (text, url)
+
+
+@dataclass
+class _CodeBlockElement(_Element):
+    """An open <pre>; parts holds the raw code text."""
+
+    language: str = ""
+
+
+class _MarkdownWriter(HTMLParser):
+    """Single-pass note.com HTML to Markdown converter."""
+
+    def __init__(self) -> None:
+        """Initialize the writer with an empty document."""
+        super().__init__(convert_charrefs=True)
+        self._stack: list[_Element] = [_Element("")]
+        # Element whose content is being skipped (TOC, script) and its nesting depth
+        self._skip_tag: str | None = None
+        self._skip_depth = 0
+
+    def markdown(self) -> str:
+        """Close all open elements and return the Markdown document.
+
+        Returns:
+            Markdown text with runs of blank lines collapsed
+        """
+        self.close()
+        while len(self._stack) > 1:
+            self._close_element()
+        result = "".join(self._stack[0].parts)
+        return _BLANK_LINES_PATTERN.sub("\n\n", result).strip()
+
+    # === Tokenizer callbacks ===
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Open an element."""
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+            return
+
+        attributes = {name: value or "" for name, value in attrs}
+        top = self._stack[-1]
+
+        if isinstance(top, _CodeBlockElement):
+            # Code is kept verbatim; only the language and line breaks matter
+            if tag == "code":
+                language = _LANGUAGE_CLASS_PATTERN.search(attributes.get("class", ""))
+                if language:
+                    top.language = language.group(1)
+            elif tag == "br":
+                top.parts.append("\n")
+            return
+
+        if tag == _TOC_TAG or _TOC_CLASS in attributes.get("class", ""):
+            self._write_block("[TOC]\n\n")
+            self._skip(tag)
+        elif tag in _SKIPPED_TAGS:
+            self._skip(tag)
+        elif tag in _VOID_TAGS:
+            self._handle_void(tag, attributes)
+        elif tag == "p":
+            if top.tag == "p":
+                self._close_element()
+            self._stack.append(_Element(tag, attributes))
+        elif tag == "li":
+            if top.tag == "li":
+                self._close_element()
+                top = self._stack[-1]
+            if isinstance(top, _ListElement):
+                top.lines.append("")
+                self._stack.append(_ItemElement(tag, line_index=len(top.lines) - 1))
+            else:
+                self._stack.append(_Element(tag))
+        elif tag in ("ul", "ol"):
+            self._open_list(tag, attributes)
+        elif tag == "figure":
+            self._stack.append(_FigureElement(tag, attributes))
+        elif tag == "figcaption":
+            self._stack.append(_CaptionElement(tag))
+        elif tag == "pre":
+            self._stack.append(_CodeBlockElement(tag))
+        elif tag in _HEADING_LEVELS or tag in _INLINE_MARKERS or tag in ("a", "blockquote"):
+            self._stack.append(_Element(tag, attributes))
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close an element (and any unclosed elements inside it)."""
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth -= 1
+                if self._skip_depth == 0:
+                    self._skip_tag = None
+            return
+        if tag in _VOID_TAGS:
+            return
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                while len(self._stack) > index:
+                    self._close_element()
+                return
+
+    def handle_data(self, data: str) -> None:
+        """Add text to the innermost open element."""
+        if self._skip_tag is not None:
+            return
+        top = self._stack[-1]
+        if top.tag in _BLOCK_CONTAINER_TAGS and data.isspace():
+            return
+        top.parts.append(data)
+
+    # === Element handling ===
+
+    def _skip(self, tag: str) -> None:
+        """Drop the content of the element being opened."""
+        if tag not in _VOID_TAGS:
+            self._skip_tag = tag
+            self._skip_depth = 1
+
+    def _handle_void(self, tag: str, attrs: dict[str, str]) -> None:
+        """Write a line break, horizontal rule or image."""
+        top = self._stack[-1]
+        if tag == "br":
+            top.parts.append("\n")
+        elif tag == "hr":
+            self._write_block("---\n\n")
+        elif tag == "img":
+            alt, src = attrs.get("alt", ""), attrs.get("src", "")
+            if isinstance(top, _FigureElement):
+                top.image = (alt, src)
+            elif src:
+                top.parts.append(f"![{alt}]({src})")
+
+    def _open_list(self, tag: str, attrs: dict[str, str]) -> None:
+        """Open a list, sharing the lines of the enclosing list if nested."""
+        start = attrs.get("start", "")
+        counter = int(start) if start.isdigit() else 1
+        parent = next((element for element in reversed(self._stack) if isinstance(element, _ListElement)), None)
+        if parent is None:
+            self._stack.append(_ListElement(tag, ordered=tag == "ol", counter=counter))
+        else:
+            self._stack.append(
+                _ListElement(
+                    tag,
+                    ordered=tag == "ol",
+                    counter=counter,
+                    indent=parent.indent + "  ",
+                    nested=True,
+                    lines=parent.lines,
+                )
+            )
+
+    def _write_block(self, text: str) -> None:
+        """Write a block (ending with a blank line) to the innermost element.
+
+        List items collect blocks as their paragraphs and blockquotes as
+        lines; elsewhere the block is separated from preceding text by a
+        blank line.
+        """
+        parent = self._stack[-1]
+        if isinstance(parent, _ItemElement):
+            self._flush_item_text(parent)
+            if text.strip():
+                parent.paragraphs.append(text.strip())
+        elif parent.tag == "blockquote":
+            parent.parts.append(text.strip() + "\n")
+        else:
+            if parent.parts and not parent.parts[-1].endswith("\n\n"):
+                parent.parts.append("\n\n")
+            parent.parts.append(text)
+
+    def _close_element(self) -> None:
+        """Close the innermost element and write its Markdown to its parent."""
+        element = self._stack.pop()
+        parent = self._stack[-1]
+        content = "".join(element.parts)
+
+        if isinstance(element, _ItemElement):
+            self._close_item(element)
+        elif isinstance(element, _ListElement):
+            if not element.nested:
+                self._write_block("\n".join(line for line in element.lines if line) + "\n\n")
+        elif isinstance(element, _CodeBlockElement):
+            code = _strip_fence_markers(content)
+            self._write_block(f"```{element.language}\n{code}\n```\n\n")
+        elif isinstance(element, _FigureElement):
+            self._close_figure(element, content)
+        elif isinstance(element, _CaptionElement):
+            if isinstance(parent, _FigureElement):
+                parent.caption = content.strip()
+                parent.caption_link = element.link
+            else:
+                parent.parts.append(content)
+        elif element.tag == "p":
+            self._write_block(_format_paragraph(content.strip(), element.attrs.get("style", "")) + "\n\n")
+        elif element.tag in _HEADING_LEVELS:
+            self._write_block(f"{'#' * _HEADING_LEVELS[element.tag]} {content.strip()}\n\n")
+        elif element.tag == "blockquote":
+            quote_lines = [f"> {line.strip()}" for line in content.split("\n") if line.strip()]
+            if isinstance(parent, _FigureElement):
+                parent.quote_lines = quote_lines
+            else:
+                self._write_block("\n".join(quote_lines) + "\n\n")
+        elif element.tag == "a":
+            parent.parts.append(self._format_link(content.strip(), element.attrs.get("href", "")))
+        elif element.tag in _INLINE_MARKERS:
+            marker = _INLINE_MARKERS[element.tag]
+            if content:
+                parent.parts.append(f"{marker}{content}{marker}")
+        else:
+            parent.parts.append(content)
+
+    def _format_link(self, text: str, href: str) -> str:
+        """Format a link, recording it as the citation link of an open caption."""
+        if not href:
+            return text
+        for element in reversed(self._stack):
+            if isinstance(element, _CaptionElement):
+                if element.link is None:
+                    element.link = (text, href)
+                break
+        return f"[{text}]({href})"
+
+    def _flush_item_text(self, item: _ItemElement) -> None:
+        """Turn inline content collected by a list item into a paragraph."""
+        text = "".join(item.parts).strip()
+        item.parts.clear()
+        if text:
+            item.paragraphs.append(text)
+
+    def _close_item(self, item: _ItemElement) -> None:
+        """Write a list item's line into its list's reserved slot.
+
+        The first paragraph is the item text; further paragraphs follow as
+        indented continuation blocks. Items without text produce no line
+        (their nested lists are still written).
+        """
+        level = self._stack[-1]
+        if not isinstance(level, _ListElement):
+            return
+        self._flush_item_text(item)
+        if not item.paragraphs:
+            return
+        if level.ordered:
+            marker = f"{level.counter}."
+            level.counter += 1
+        else:
+            marker = "-"
+        continuation = "\n" + level.indent + " " * (len(marker) + 1)
+        blocks = [paragraph.replace("\n", continuation) for paragraph in item.paragraphs]
+        level.lines[item.line_index] = f"{level.indent}{marker} " + "\n".join(
+            [blocks[0]] + [continuation + block for block in blocks[1:]]
+        )
+
+    def _close_figure(self, figure: _FigureElement, content: str) -> None:
+        """Write a quote (with citation), image (with caption) or embed URL."""
+        if figure.quote_lines is not None:
+            lines = list(figure.quote_lines)
+            if figure.caption_link is not None:
+                text, url = figure.caption_link
+                lines.append(f"> — {text} ({url})")
+            elif figure.caption:
+                lines.append(f"> — {figure.caption}")
+            self._write_block("\n".join(lines) + "\n\n")
+        elif figure.image is not None:
+            alt, src = figure.image
+            if figure.caption:
+                self._write_block(f'![{alt}]({src} "{figure.caption}")\n\n')
+            else:
+                self._write_block(f"![{alt}]({src})\n\n")
+        elif figure.attrs.get("data-src"):
+            # Embed: the URL alone on a line converts back to the same embed
+            self._write_block(f"{figure.attrs['data-src']}\n\n")
+        elif content.strip():
+            self._write_block(content.strip() + "\n\n")
 
 
-def _convert_text_align_paragraph(match: re.Match[str]) -> str:
-    """Convert text-aligned paragraph to Markdown format with alignment markers.
+def _format_paragraph(content: str, style: str) -> str:
+    """Add text alignment markers to a paragraph's Markdown.
 
     Args:
-        match: Regex match with groups (attrs, alignment, content)
+        content: Paragraph Markdown
+        style: The paragraph's style attribute
 
     Returns:
         Markdown with alignment markers:
@@ -155,254 +416,10 @@ def _convert_text_align_paragraph(match: re.Match[str]) -> str:
         - right: ->text
         - left: <-text
     """
-    alignment = match.group(2).lower()
-    content = match.group(3).strip()
-
-    alignment_formats = {
-        "center": f"->{content}<-\n\n",
-        "right": f"->{content}\n\n",
-        "left": f"<-{content}\n\n",
-    }
-    return alignment_formats.get(alignment, f"{content}\n\n")
-
-
-def _convert_heading(match: re.Match[str]) -> str:
-    """Convert heading to Markdown format."""
-    level = int(match.group(1)[1])  # h1 -> 1, h2 -> 2, etc.
-    text = match.group(2).strip()
-    return f"{'#' * level} {text}\n\n"
-
-
-def _convert_paragraph(match: re.Match[str]) -> str:
-    """Convert paragraph to Markdown format."""
-    content = match.group(1).strip()
-    return f"{content}\n\n"
-
-
-def _convert_blockquote_figure(match: re.Match[str]) -> str:
-    """Convert blockquote figure to Markdown format."""
-    content = match.group(1)
-    figcaption = match.group(2).strip()
-
-    # Remove <p> tags from content
-    content = re.sub(r"<p[^>]*>(.*?)</p>", r"\1", content, flags=re.DOTALL | re.IGNORECASE)
-
-    # Convert <br> to newlines
-    content = _BR_PATTERN.sub("\n", content)
-
-    # Build blockquote lines
-    lines = content.strip().split("\n")
-    quote_lines = [f"> {line.strip()}" for line in lines if line.strip()]
-
-    # Add citation if present
-    if figcaption:
-        # Check for link in figcaption
-        link_match = _FIGCAPTION_LINK_PATTERN.search(figcaption)
-        if link_match:
-            url = link_match.group(1)
-            text = link_match.group(2)
-            quote_lines.append(f"> — {text} ({url})")
-        else:
-            quote_lines.append(f"> — {figcaption}")
-
-    return "\n".join(quote_lines) + "\n\n"
-
-
-def _convert_image_figure(match: re.Match[str], alt_first: bool = False) -> str:
-    """Convert image figure to Markdown format."""
-    if alt_first:
-        alt = match.group(1)
-        src = match.group(2)
-        caption = match.group(3).strip()
-    else:
-        src = match.group(1)
-        alt = match.group(2)
-        caption = match.group(3).strip()
-
-    if caption:
-        return f'![{alt}]({src} "{caption}")\n\n'
-    return f"![{alt}]({src})\n\n"
-
-
-def _find_matching_tags(
-    html_content: str,
-    tag_name: str,
-) -> list[tuple[str, int, int]]:
-    """Find all top-level matching tag pairs with proper nesting support.
-
-    Args:
-        html_content: HTML string to search
-        tag_name: Tag name to find (e.g., "li", "ul")
-
-    Returns:
-        List of (content, start_pos, end_pos) tuples for each match
-    """
-    results: list[tuple[str, int, int]] = []
-    open_tag = f"<{tag_name}"
-    close_tag = f"</{tag_name}>"
-    pos = 0
-
-    while pos < len(html_content):
-        # Find opening tag
-        tag_start = html_content.find(open_tag, pos)
-        if tag_start == -1:
-            break
-
-        # Find the > that closes the opening tag
-        tag_end = html_content.find(">", tag_start)
-        if tag_end == -1:
-            break
-
-        # Track depth to find matching close tag
-        depth = 1
-        search_pos = tag_end + 1
-
-        while depth > 0 and search_pos < len(html_content):
-            next_open = html_content.find(open_tag, search_pos)
-            next_close = html_content.find(close_tag, search_pos)
-
-            if next_close == -1:
-                break
-
-            if next_open != -1 and next_open < next_close:
-                depth += 1
-                search_pos = next_open + len(open_tag)
-            else:
-                depth -= 1
-                if depth == 0:
-                    content = html_content[tag_end + 1 : next_close]
-                    results.append((content, tag_start, next_close + len(close_tag)))
-                search_pos = next_close + len(close_tag)
-
-        pos = search_pos
-
-    return results
-
-
-def _find_matching_li_tags(html_content: str) -> list[str]:
-    """Find all top-level <li> elements, properly handling nested lists."""
-    return [content for content, _, _ in _find_matching_tags(html_content, "li")]
-
-
-def _convert_list(html_content: str, ordered: bool = False, indent_level: int = 0) -> str:
-    """Convert list to Markdown format with nested list support.
-
-    Args:
-        html_content: HTML content of list
-        ordered: True for ordered list, False for unordered
-        indent_level: Current indentation level (0 = top level)
-
-    Returns:
-        Markdown formatted list
-    """
-    indent = "  " * indent_level  # 2 spaces per level
-    lines: list[str] = []
-    counter = 1
-
-    # Use proper tag matching instead of regex
-    li_contents = _find_matching_li_tags(html_content)
-
-    for li_content in li_contents:
-        # Extract text from first <p> tag if present (before any nested lists)
-        p_match = re.search(r"<p[^>]*>(.*?)</p>", li_content, re.DOTALL | re.IGNORECASE)
-        if p_match:
-            text = p_match.group(1).strip()
-        else:
-            # Remove any nested lists before extracting text
-            text = _UL_PATTERN.sub("", li_content)
-            text = _OL_PATTERN.sub("", text)
-            text = text.strip()
-
-        # Clean up any remaining HTML tags from text
-        text = re.sub(r"<[^>]+>", "", text).strip()
-
-        # Add list item
-        if text:  # Only add if there's text content
-            if ordered:
-                lines.append(f"{indent}{counter}. {text}")
-                counter += 1
-            else:
-                lines.append(f"{indent}- {text}")
-
-        # Process nested lists
-        nested_ul = _UL_PATTERN.search(li_content)
-        nested_ol = _OL_PATTERN.search(li_content)
-        if nested_ul:
-            nested_md = _convert_list(nested_ul.group(1), ordered=False, indent_level=indent_level + 1)
-            lines.append(nested_md.rstrip())
-        if nested_ol:
-            nested_md = _convert_list(nested_ol.group(1), ordered=True, indent_level=indent_level + 1)
-            lines.append(nested_md.rstrip())
-
-    return "\n".join(lines) + "\n"
-
-
-def _find_matching_tag_content(html_content: str, tag_name: str) -> tuple[str, int, int] | None:
-    """Find the content of a tag, properly handling nested same-name tags.
-
-    Returns (content, start_pos, end_pos) or None if not found.
-    """
-    results = _find_matching_tags(html_content, tag_name)
-    return results[0] if results else None
-
-
-def _convert_all_lists(html_content: str) -> str:
-    """Convert all lists in the HTML content, properly handling nesting."""
-    result = html_content
-
-    # Process lists repeatedly until no more are found
-    # We process from innermost to outermost by repeatedly finding and replacing
-    max_iterations = 100  # Prevent infinite loops
-    for _ in range(max_iterations):
-        # Try to find a ul or ol
-        ul_match = _find_matching_tag_content(result, "ul")
-        ol_match = _find_matching_tag_content(result, "ol")
-
-        # Find which one comes first
-        if ul_match is None and ol_match is None:
-            break
-
-        if ul_match is not None and (ol_match is None or ul_match[1] < ol_match[1]):
-            # Process ul
-            content, start, end = ul_match
-            md = _convert_list(content, ordered=False)
-            result = result[:start] + md + result[end:]
-        elif ol_match is not None:
-            # Process ol
-            content, start, end = ol_match
-            md = _convert_list(content, ordered=True)
-            result = result[:start] + md + result[end:]
-
-    return result
-
-
-def _convert_link(match: re.Match[str]) -> str:
-    """Convert link to Markdown format."""
-    url = match.group(1)
-    text = match.group(2).strip()
-    return f"[{text}]({url})"
-
-
-def _convert_inline_elements(text: str) -> str:
-    """Convert inline elements to Markdown format."""
-    result = text
-
-    # Links
-    result = _LINK_PATTERN.sub(_convert_link, result)
-
-    # Bold
-    result = _STRONG_PATTERN.sub(r"**\1**", result)
-
-    # Italic
-    result = _EM_PATTERN.sub(r"*\1*", result)
-
-    # Strikethrough
-    result = _STRIKETHROUGH_PATTERN.sub(r"~~\1~~", result)
-
-    # Inline code (must be after code block extraction to avoid false matches)
-    result = _INLINE_CODE_PATTERN.sub(r"`\1`", result)
-
-    return result
+    alignment = _TEXT_ALIGN_PATTERN.search(style)
+    if alignment is None:
+        return content
+    return _ALIGNMENT_FORMATS[alignment.group(1).lower()].format(content)
 
 
 def html_to_markdown(html_content: str) -> str:
@@ -417,61 +434,6 @@ def html_to_markdown(html_content: str) -> str:
     if not html_content or not html_content.strip():
         return ""
 
-    # Use local storage for code blocks (thread-safe)
-    code_blocks: list[str] = []
-    extract_code_block = _create_code_block_extractor(code_blocks)
-
-    result = html_content
-
-    # 1. コードブロック（プレースホルダーで保護）
-    result = _CODE_BLOCK_PATTERN.sub(extract_code_block, result)
-    # Also handle <pre> without <code> tag (some note.com formats)
-    result = _PRE_ONLY_PATTERN.sub(extract_code_block, result)
-
-    # 2. TOC要素を[TOC]マーカーに変換
-    result = _TOC_ELEMENT_PATTERN.sub("[TOC]\n\n", result)
-    result = _TOC_ELEMENT_SIMPLE_PATTERN.sub("[TOC]\n\n", result)
-
-    # 3. figure要素（blockquoteとimageを先に処理）
-    result = _BLOCKQUOTE_FIGURE_PATTERN.sub(_convert_blockquote_figure, result)
-    result = _IMAGE_FIGURE_PATTERN.sub(lambda m: _convert_image_figure(m, alt_first=False), result)
-    result = _IMAGE_FIGURE_PATTERN_ALT.sub(lambda m: _convert_image_figure(m, alt_first=True), result)
-
-    # 4. 見出し
-    result = _HEADING_PATTERN.sub(_convert_heading, result)
-
-    # 5. リスト（ネスト対応 - 適切なタグマッチングを使用）
-    result = _convert_all_lists(result)
-
-    # 6. 水平線
-    result = _HR_PATTERN.sub("\n---\n\n", result)
-
-    # 7. インライン要素（リンク、太字、斜体、インラインコード）
-    result = _convert_inline_elements(result)
-
-    # 8. テキスト配置を持つ段落（通常の段落変換より先に処理）
-    result = _TEXT_ALIGN_P_PATTERN.sub(_convert_text_align_paragraph, result)
-
-    # 9. 段落（他の要素処理後に適用）
-    result = _PARAGRAPH_PATTERN.sub(_convert_paragraph, result)
-
-    # === 最終処理 ===
-
-    # プレースホルダー復元（コードブロック）
-    for i, block in enumerate(code_blocks):
-        result = result.replace(f"__CODE_BLOCK_{i}__", block)
-
-    # UUID属性削除（残存する場合のクリーンアップ）
-    result = _UUID_ATTR_PATTERN.sub("", result)
-
-    # 残存するHTMLタグを削除（エンティティデコード前に実行）
-    # これにより、ユーザーコンテンツ内の &lt;tag&gt; が保護される
-    result = re.sub(r"<[^>]+>", "", result)
-
-    # HTMLエンティティデコード
-    result = html.unescape(result)
-
-    # 連続する空行を正規化
-    result = re.sub(r"\n{3,}", "\n\n", result)
-
-    return result.strip()
+    writer = _MarkdownWriter()
+    writer.feed(html_content)
+    return writer.markdown()
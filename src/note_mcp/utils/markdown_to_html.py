@@ -1,18 +1,42 @@
 """Markdown to HTML conversion utility.
 
-Uses markdown-it-py for CommonMark-compliant conversion.
+Uses markdown-it-py for CommonMark-compliant conversion. NoteHtmlRenderer
+writes note.com's ProseMirror-compatible HTML (element IDs, figures, embeds,
+TOC, alignment, code blocks) in a single pass over the token stream.
+
+Documents are converted block by block: the Markdown is split into top-level
+blocks (paragraphs, headings, lists, blockquotes, code blocks, ...) and the
+note.com HTML of each block is kept in a bounded LRU cache keyed by a hash of
+its source, so re-converting an edited article only renders the blocks that
+changed. Cached blocks are rendered with placeholder element IDs that are
+replaced on every use, so documents never share element IDs.
+
+Element IDs are random by default. With stable_ids=True they are derived from
+each block's content and its occurrence in the document (see
+api.element_ids), so converting the same Markdown twice gives identical HTML
+and unchanged blocks keep their IDs after an edit.
 """
 
+import hashlib
 import re
-import uuid
-from collections.abc import Callable, Iterator
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
+from typing import Any, NamedTuple
 
 from markdown_it import MarkdownIt
+from markdown_it.common.utils import escapeHtml, unescapeAll
+from markdown_it.renderer import RendererHTML
+from markdown_it.rules_core import StateCore
+from markdown_it.token import Token
+from markdown_it.utils import EnvType, OptionsDict
 
+from note_mcp.api.element_ids import new_element_id, stable_element_ids
 from note_mcp.api.embeds import (
     generate_embed_html,
     get_embed_service,
+    placeholder_embed_key,
 )
 
 # Pre-compiled regex patterns for performance
@@ -21,11 +45,6 @@ _TOC_PATTERN = re.compile(r"^\[TOC\]$", re.MULTILINE)
 # TOC placeholder (text marker, not HTML comment)
 # Must match TOC_PLACEHOLDER in toc_helpers.py
 _TOC_PLACEHOLDER = "§§TOC§§"
-# Pattern to match TOC placeholder wrapped in paragraph tags (after Markdown conversion)
-_TOC_PLACEHOLDER_HTML_PATTERN = re.compile(
-    r'<p\s+name="([^"]+)"\s+id="([^"]+)">' + re.escape(_TOC_PLACEHOLDER) + r"</p>",
-    re.IGNORECASE,
-)
 
 # Note: <li> and <blockquote> are excluded because note.com doesn't add name/id to these tags
 _TAG_PATTERN = re.compile(
@@ -33,22 +52,7 @@ _TAG_PATTERN = re.compile(
     re.IGNORECASE,
 )
 _PRE_PATTERN = re.compile(r"<pre([^>]*)>(.*?)</pre>", re.DOTALL | re.IGNORECASE)
-_IMG_IN_P_PATTERN = re.compile(
-    r'<p>\s*<img\s+src="([^"]+)"\s+alt="([^"]*)"(?:\s+title="([^"]*)")?\s*/?\s*>\s*</p>',
-    re.IGNORECASE,
-)
 _LANGUAGE_CLASS_PATTERN = re.compile(r'<code[^>]*class="language-[^"]*"[^>]*>')
-# Pattern to match li elements with direct text content (not already wrapped in p)
-# This matches <li ...>content</li> where content doesn't start with <p
-_LI_CONTENT_PATTERN = re.compile(
-    r"(<li[^>]*>)(?!<p)([^<]+|(?:(?!</li>).)*?)(</li>)",
-    re.IGNORECASE | re.DOTALL,
-)
-# Pattern to match blockquote elements and their content
-_BLOCKQUOTE_PATTERN = re.compile(
-    r"(<blockquote[^>]*>)(.*?)(</blockquote>)",
-    re.DOTALL | re.IGNORECASE,
-)
 # Pattern to detect citation line: em-dash followed by space at start of line or after <br>
 # Matches: "— Text" or "<br>— Text" at the end of content
 _CITATION_PATTERN = re.compile(
@@ -76,215 +80,209 @@ _STOCK_JP_PATTERN = re.compile(r"^\^(\d{4,5})$", re.MULTILINE)
 # US stocks: $GOOG (uppercase ticker) - must be alone on a line
 _STOCK_US_PATTERN = re.compile(r"^\$([A-Z]+)$", re.MULTILINE)
 
-# Pattern to match paragraphs containing alignment placeholders (for html_transformer)
-_ALIGN_P_PATTERN = re.compile(
-    r"<p([^>]*)>§§ALIGN_(CENTER|RIGHT|LEFT)§§(.*?)§§/ALIGN§§</p>",
-    re.DOTALL | re.IGNORECASE,
-)
+# Code protected from pre-processing: fenced blocks, then inline code spans
+_FENCED_CODE_PATTERN = re.compile(r"```[\s\S]*?```")
+_INLINE_CODE_PATTERN = re.compile(r"`[^`]+`")
 
-# Pattern to match <p> content inside blockquotes (for html_transformer)
-_P_IN_BLOCKQUOTE_PATTERN = re.compile(
-    r"(<blockquote[^>]*>.*?)(<p[^>]*>)(.*?)(</p>)(.*?</blockquote>)",
-    re.DOTALL | re.IGNORECASE,
-)
+# Inline HTML of a paragraph holding nothing but a URL (embed candidate)
+_STANDALONE_URL_HTML_PATTERN = re.compile(r"\s*(https?://\S+?)\s*")
 
-# Pattern to match blockquote elements for figure wrapping (for html_transformer)
-_BLOCKQUOTE_FIGURE_PATTERN = re.compile(
-    r"<blockquote[^>]*>(.*?)</blockquote>",
-    re.DOTALL | re.IGNORECASE,
-)
+# Inline HTML of a paragraph marked by _replace_alignment_markers
+_ALIGN_CONTENT_PATTERN = re.compile(r"§§ALIGN_(CENTER|RIGHT|LEFT)§§(.*?)§§/ALIGN§§", re.DOTALL)
 
+# Number of converted blocks kept by the block cache
+HTML_BLOCK_CACHE_SIZE = 2048
 
-@contextmanager
-def _protect_code_blocks(content: str, prefix: str = "CODE_BLOCK") -> Iterator[tuple[str, list[tuple[str, str]]]]:
-    """Context manager for protecting code blocks during content processing.
+# Parser used to split documents into top-level blocks (block rules only)
+_BLOCK_SPLITTER = MarkdownIt().enable("strikethrough").disable("inline")
 
-    Temporarily replaces fenced (```) and inline (`) code blocks with placeholders.
-    This prevents code block content from being processed by other transformations.
 
-    Args:
-        content: Content to protect code blocks in.
-        prefix: Prefix for placeholder names. Use unique prefixes to avoid conflicts.
+class CachedBlock(NamedTuple):
+    """Converted HTML of a block and the element IDs generated for it.
 
-    Yields:
-        Tuple of (protected_content, code_blocks_list) where:
-        - protected_content: Content with code blocks replaced by placeholders
-        - code_blocks_list: List of (placeholder, original_code) tuples for restoration
+    Attributes:
+        html: note.com HTML of the block
+        element_ids: Element IDs in html, in the order they were generated
+    """
 
-    Example:
-        with _protect_code_blocks(content, "ALIGN") as (protected, blocks):
-            # Process the protected content (reassign to protected)
-            protected = some_pattern.sub(replacement, protected)
-        return _restore_code_blocks(protected, blocks)
+    html: str
+    element_ids: tuple[str, ...] = ()
+
+
+class HtmlBlockCache:
+    """LRU cache of Markdown block digest -> converted note.com HTML.
+
+    Safe to share between conversion pool threads.
+
+    Attributes:
+        max_entries: Maximum number of cached blocks
     """
-    code_blocks: list[tuple[str, str]] = []
 
-    def protect(match: re.Match[str]) -> str:
-        placeholder = f"__{prefix}_{len(code_blocks)}__"
-        code_blocks.append((placeholder, match.group(0)))
-        return placeholder
+    def __init__(self, max_entries: int = HTML_BLOCK_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
 
-    # Protect fenced code blocks first (```)
-    protected = re.sub(r"```[\s\S]*?```", protect, content)
-    # Then protect inline code (`)
-    protected = re.sub(r"`[^`]+`", protect, protected)
+        Args:
+            max_entries: Maximum number of cached blocks
 
-    yield protected, code_blocks
+        Raises:
+            ValueError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedBlock] = OrderedDict()
+        self._lock = threading.Lock()
 
+    def __len__(self) -> int:
+        """Number of cached blocks."""
+        return len(self._entries)
 
-def html_transformer(
-    pattern: re.Pattern[str],
-    transformer: Callable[[re.Match[str]], str],
-) -> Callable[[str], str]:
-    """Create an HTML transformation function.
+    def get(self, digest: str) -> CachedBlock | None:
+        """Get the HTML of a block and mark it as recently used.
 
-    This Higher-Order Function reduces code duplication for pattern-based
-    HTML transformations that follow the pattern:
-        result = pattern.sub(transform_func, html)
+        Args:
+            digest: Digest of the block's Markdown source
 
-    Args:
-        pattern: Compiled regex pattern to match.
-        transformer: Function that takes a Match object and returns replacement string.
+        Returns:
+            Converted block, or None if not cached
+        """
+        with self._lock:
+            block = self._entries.get(digest)
+            if block is not None:
+                self._entries.move_to_end(digest)
+            return block
 
-    Returns:
-        Function that applies the transformation to HTML content.
+    def put(self, digest: str, block: CachedBlock) -> None:
+        """Record the HTML of a block, evicting the least recently used one if full.
 
-    Example:
-        >>> pattern = re.compile(r"<em>(.*?)</em>")
-        >>> strong_transformer = html_transformer(pattern, lambda m: f"<strong>{m.group(1)}</strong>")
-        >>> strong_transformer("<em>text</em>")
-        '<strong>text</strong>'
-    """
+        Args:
+            digest: Digest of the block's Markdown source
+            block: Converted block
+        """
+        with self._lock:
+            self._entries[digest] = block
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
 
-    def transform(html: str) -> str:
-        return pattern.sub(transformer, html)
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
 
-    return transform
 
+_html_block_cache: HtmlBlockCache | None = None
 
-def _restore_code_blocks(content: str, blocks: list[tuple[str, str]]) -> str:
-    """Restore code blocks from placeholders.
 
-    Args:
-        content: Content with placeholders.
-        blocks: List of (placeholder, original) tuples from _protect_code_blocks.
+def get_html_block_cache() -> HtmlBlockCache:
+    """Get the process-wide block conversion cache.
 
     Returns:
-        Content with placeholders replaced by original code blocks.
+        Shared HtmlBlockCache instance
     """
-    for placeholder, original in blocks:
-        content = content.replace(placeholder, original)
-    return content
+    global _html_block_cache
+    if _html_block_cache is None:
+        _html_block_cache = HtmlBlockCache()
+    return _html_block_cache
+
+
+class ProtectedCode:
+    """Code blocks replaced by __PREFIX_n__ placeholders in _protect_code_blocks."""
 
+    def __init__(self, prefix: str) -> None:
+        """Initialize an empty set of protected blocks.
 
-def protected_content_transformer(
-    prefix: str,
-) -> Callable[[Callable[[str], str]], Callable[[str], str]]:
-    """Create a decorator that protects code blocks during transformation.
+        Args:
+            prefix: Placeholder prefix
+        """
+        self.originals: list[str] = []
+        self.placeholder_pattern = re.compile(rf"__{re.escape(prefix)}_(\d+)__")
 
-    This Higher-Order Function reduces code duplication for pattern-based
-    Markdown transformations that need to preserve code blocks.
+    def original(self, match: re.Match[str]) -> str:
+        """Get the code block a placeholder match stands for (unknown ones are kept)."""
+        index = int(match.group(1))
+        return self.originals[index] if index < len(self.originals) else match.group(0)
 
-    The decorator:
-    1. Protects fenced (```) and inline (`) code blocks with placeholders
-    2. Applies the transformation function
-    3. Restores the original code blocks
+
+@contextmanager
+def _protect_code_blocks(content: str, prefix: str = "CODE_BLOCK") -> Iterator[tuple[str, ProtectedCode]]:
+    """Context manager for protecting code blocks during content processing.
+
+    Temporarily replaces fenced (```) and inline (`) code blocks with placeholders.
+    This prevents code block content from being processed by other transformations.
+    Protect once and run every transformation on the protected content
+    (see _preprocess_markdown) rather than protecting per transformation.
 
     Args:
-        prefix: Unique prefix for placeholders (e.g., "STOCK", "ALIGN", "TOC").
-                Use unique prefixes to avoid conflicts between transformations.
+        content: Content to protect code blocks in.
+        prefix: Prefix for placeholder names. Use unique prefixes to avoid conflicts.
 
-    Returns:
-        Decorator function that wraps a transformation function.
+    Yields:
+        Tuple of (protected_content, code_blocks) where:
+        - protected_content: Content with code blocks replaced by placeholders
+        - code_blocks: Original code blocks for restoration
 
     Example:
-        >>> @protected_content_transformer("STOCK")
-        ... def convert_stock(content: str) -> str:
-        ...     return pattern.sub(replacement, content)
-        >>> convert_stock("text with `^5243` in code")  # code block preserved
+        with _protect_code_blocks(content, "ALIGN") as (protected, blocks):
+            # Process the protected content (reassign to protected)
+            protected = some_pattern.sub(replacement, protected)
+        return _restore_code_blocks(protected, blocks)
     """
-    import functools
-
-    def decorator(transform: Callable[[str], str]) -> Callable[[str], str]:
-        @functools.wraps(transform)
-        def wrapper(content: str) -> str:
-            with _protect_code_blocks(content, prefix) as (protected, blocks):
-                result = transform(protected)
-            return _restore_code_blocks(result, blocks)
+    code_blocks = ProtectedCode(prefix)
 
-        return wrapper
+    def protect(match: re.Match[str]) -> str:
+        # An inline span may enclose an already protected fenced block
+        code_blocks.originals.append(_restore_code_blocks(match.group(0), code_blocks))
+        return f"__{prefix}_{len(code_blocks.originals) - 1}__"
 
-    return decorator
+    # Protect fenced code blocks first (```)
+    protected = _FENCED_CODE_PATTERN.sub(protect, content)
+    # Then protect inline code (`)
+    protected = _INLINE_CODE_PATTERN.sub(protect, protected)
 
+    yield protected, code_blocks
 
-def has_embed_url(content: str) -> bool:
-    """Check if content contains URLs that should be embedded.
 
-    Detects YouTube, Twitter/X, note.com article, GitHub Gist, GitHub Repository,
-    noteマネー, Zenn.dev, Google Slides, and SpeakerDeck URLs that appear alone on
-    a line (indicating they should be embedded, not linked).
+def _restore_code_blocks(content: str, blocks: ProtectedCode) -> str:
+    """Restore code blocks from placeholders.
 
-    Uses get_embed_service() for URL detection (Issue #235: DRY principle).
+    All placeholders are replaced in a single pass, so restoring takes
+    linear time however many blocks were protected.
 
     Args:
-        content: Markdown content to check.
+        content: Content with placeholders.
+        blocks: Protected code blocks from _protect_code_blocks.
 
     Returns:
-        True if content contains embed-worthy URLs.
+        Content with placeholders replaced by original code blocks.
     """
-    # Find all standalone URLs (URLs alone on their own line)
-    for match in _STANDALONE_URL_PATTERN.finditer(content):
-        url = match.group(1)
-        # Check if this URL matches any embed pattern (using api.embeds patterns)
-        if get_embed_service(url) is not None:
-            return True
-    return False
-
-
-# Pattern to match standalone embed URLs in HTML paragraphs
-# Matches: <p name="..." id="...">https://youtube.com/watch?v=xxx</p>
-# Uses negative lookbehind to exclude paragraphs inside list items
-_STANDALONE_EMBED_URL_IN_HTML_PATTERN = re.compile(
-    r'(?<!<li>)<p\s+name="[^"]+"\s+id="[^"]+">(\s*)(https?://\S+?)(\s*)</p>',
-    re.IGNORECASE,
-)
+    if not blocks.originals:
+        return content
+    return blocks.placeholder_pattern.sub(blocks.original, content)
 
 
-def _convert_standalone_embed_urls(html: str) -> str:
-    """Convert standalone embed URLs to figure elements.
+def find_embed_urls(content: str) -> list[str]:
+    """List the URLs that markdown_to_html() will convert to embeds.
 
-    Detects standalone URLs (URLs that are alone in a paragraph) and converts
-    supported embed URLs (YouTube, Twitter, note.com, GitHub Gist, GitHub Repository,
-    noteマネー, Zenn.dev, Google Slides, SpeakerDeck) to figure elements.
-
-    This function should be called after markdown conversion and UUID addition,
-    but before code block processing.
+    Finds supported embed URLs alone on a line outside code blocks, including
+    those produced by stock notation (Issue #216). This lets callers register
+    embed keys while other work (e.g., image uploads) is still in progress.
 
     Args:
-        html: HTML content with paragraphs containing potential embed URLs.
+        content: Markdown content to scan.
 
     Returns:
-        HTML with embed URLs converted to figure elements.
+        Distinct embed URLs in order of first appearance.
     """
-
-    def replace_embed_url(match: re.Match[str]) -> str:
-        url = match.group(2).strip()
-
-        # Check if this URL is a supported embed URL
-        service = get_embed_service(url)
-        if service is None:
-            # Not an embed URL, keep original paragraph
-            return match.group(0)
-
-        # Generate embed HTML
-        return generate_embed_html(url, service)
-
-    return _STANDALONE_EMBED_URL_IN_HTML_PATTERN.sub(replace_embed_url, html)
+    with _protect_code_blocks(content, "EMBED_URL") as (protected, _):
+        protected = _replace_stock_notation(protected)
+        urls = [match.group(1) for match in _STANDALONE_URL_PATTERN.finditer(protected)]
+    return list(dict.fromkeys(url for url in urls if get_embed_service(url) is not None))
 
 
 def _generate_uuid() -> str:
-    """Generate a UUID for note.com element IDs."""
-    return str(uuid.uuid4())
+    """Generate a UUID for note.com element IDs (see api.element_ids)."""
+    return new_element_id()
 
 
 def _extract_citation(blockquote_content: str) -> tuple[str, str]:
@@ -337,24 +335,14 @@ def _extract_citation(blockquote_content: str) -> tuple[str, str]:
     return modified_content, figcaption_html
 
 
-@protected_content_transformer("STOCK")
-def _convert_stock_notation(content: str) -> str:
-    """Convert stock notation to noteマネー URLs.
-
-    Converts stock notation markers BEFORE markdown conversion:
-    - ^5243 (Japanese stock) → https://money.note.com/companies/5243
-    - $GOOG (US stock) → https://money.note.com/us-companies/GOOG
-
-    Only converts notations that are alone on a line.
-    Code blocks are protected from conversion via decorator.
-
-    Issue #216: Support stock chart embedding via notation.
+def _replace_stock_notation(content: str) -> str:
+    """Replace stock notation with noteマネー URLs (code blocks not protected).
 
     Args:
-        content: Markdown content with stock notations
+        content: Content with code blocks already protected.
 
     Returns:
-        Content with stock notations converted to URLs
+        Content with stock notations converted to URLs.
     """
     # Japanese stocks: ^5243 → https://money.note.com/companies/5243
     content = _STOCK_JP_PATTERN.sub(r"https://money.note.com/companies/\1", content)
@@ -363,28 +351,15 @@ def _convert_stock_notation(content: str) -> str:
     return content
 
 
-@protected_content_transformer("ALIGN")
-def _convert_text_alignment(content: str) -> str:
-    """Convert text alignment Markdown notation to internal placeholders.
-
-    This function processes text alignment markers BEFORE markdown conversion.
-    It converts the custom notation to placeholders that will be converted
-    to proper HTML after markdown processing.
-
-    Code blocks are protected from conversion via decorator.
-
-    Notation:
-        ->text<- : center alignment
-        ->text   : right alignment
-        <-text   : left alignment
+def _replace_alignment_markers(content: str) -> str:
+    """Replace text alignment markers with placeholders (code blocks not protected).
 
     Args:
-        content: Markdown content with alignment markers
+        content: Content with code blocks already protected.
 
     Returns:
-        Content with alignment markers converted to placeholders
+        Content with alignment markers converted to placeholders.
     """
-    # Convert alignment markers to placeholders
     # Order matters: center first (more specific), then right/left
     content = _TEXT_ALIGN_CENTER_PATTERN.sub(r"§§ALIGN_CENTER§§\1§§/ALIGN§§", content)
     content = _TEXT_ALIGN_RIGHT_PATTERN.sub(r"§§ALIGN_RIGHT§§\1§§/ALIGN§§", content)
@@ -392,183 +367,6 @@ def _convert_text_alignment(content: str) -> str:
     return content
 
 
-def _apply_alignment(match: re.Match[str]) -> str:
-    """Transform alignment placeholder to styled paragraph.
-
-    Args:
-        match: Regex match with groups:
-            - group(1): HTML attributes (e.g., ' name="..." id="..."')
-            - group(2): Alignment type (CENTER, RIGHT, or LEFT)
-            - group(3): Paragraph content
-
-    Returns:
-        HTML paragraph with text-align style applied.
-    """
-    attrs = match.group(1)
-    alignment = match.group(2).lower()
-    content = match.group(3)
-
-    # Add style attribute for text-align
-    style = f"text-align: {alignment}"
-
-    # If there are existing attributes, append style
-    if attrs and 'style="' in attrs:
-        # Append to existing style (unlikely but handle it)
-        attrs = attrs.replace('style="', f'style="{style}; ')
-    else:
-        # Add new style attribute before other attrs
-        attrs = f' style="{style}"' + (attrs or "")
-
-    return f"<p{attrs}>{content}</p>"
-
-
-_apply_text_alignment_to_html = html_transformer(_ALIGN_P_PATTERN, _apply_alignment)
-"""Convert text alignment placeholders to HTML style attributes.
-
-This function processes the alignment placeholders created by
-_convert_text_alignment and converts them to proper HTML paragraphs
-with text-align styles.
-
-Args:
-    html: HTML content with alignment placeholders
-
-Returns:
-    HTML with proper text-align styles applied
-"""
-
-
-def _wrap_li_content_in_p(html: str) -> str:
-    """Wrap list item content in paragraph tags.
-
-    ProseMirror (used by note.com) expects list items to contain
-    block content like paragraphs, not just inline text.
-
-    Converts: <li>Item text</li>
-    To: <li><p>Item text</p></li>
-
-    Args:
-        html: HTML string with list items
-
-    Returns:
-        HTML with list item content wrapped in <p> tags
-    """
-
-    def wrap_content(match: re.Match[str]) -> str:
-        li_open = match.group(1)  # <li ...>
-        content = match.group(2)  # text content
-        li_close = match.group(3)  # </li>
-
-        # Skip if content is empty or whitespace only
-        if not content or not content.strip():
-            return match.group(0)
-
-        return f"{li_open}<p>{content.strip()}</p>{li_close}"
-
-    return _LI_CONTENT_PATTERN.sub(wrap_content, html)
-
-
-def _convert_p_newlines(match: re.Match[str]) -> str:
-    """Transform paragraph newlines to <br> tags inside blockquotes.
-
-    Args:
-        match: Regex match with groups:
-            - group(1): Content before <p> tag (including <blockquote>)
-            - group(2): Opening <p> tag (e.g., '<p name="..." id="...">')
-            - group(3): Paragraph content (text inside <p>)
-            - group(4): Closing </p> tag
-            - group(5): Content after </p> tag (including </blockquote>)
-
-    Returns:
-        Blockquote HTML with newlines converted to <br> tags.
-    """
-    before_p = match.group(1)  # <blockquote...> and anything before <p>
-    p_open = match.group(2)  # <p ...>
-    p_content = match.group(3)  # content inside <p>
-    p_close = match.group(4)  # </p>
-    after_p = match.group(5)  # anything after </p> including </blockquote>
-
-    # Convert newlines to <br> tags (note.com uses <br> without slash)
-    p_content = p_content.replace("\n", "<br>")
-
-    return f"{before_p}{p_open}{p_content}{p_close}{after_p}"
-
-
-_convert_blockquote_newlines_to_br = html_transformer(_P_IN_BLOCKQUOTE_PATTERN, _convert_p_newlines)
-"""Convert newlines inside blockquote paragraphs to <br> tags.
-
-note.com's browser editor uses <br> tags for line breaks inside blockquotes.
-This function converts newlines to <br> tags to match that format.
-
-Converts:
-    <blockquote><p>Line 1
-    Line 2</p></blockquote>
-To:
-    <blockquote><p>Line 1<br>Line 2</p></blockquote>
-
-Note: While this generates correct HTML with <br> tags, note.com's API
-sanitizes <br> tags from blockquote content. This is a server-side
-limitation. Content created via browser editor preserves <br> tags,
-but API-submitted content has them stripped.
-
-Workaround for users: Use separate blockquotes for each line:
-    > Line 1
-
-    > Line 2
-
-Args:
-    html: HTML string with blockquotes
-
-Returns:
-    HTML with blockquote paragraph newlines converted to <br> tags
-"""
-
-
-def _wrap_in_figure(match: re.Match[str]) -> str:
-    """Transform blockquote to note.com figure format.
-
-    Args:
-        match: Regex match with groups:
-            - group(1): Blockquote inner content (HTML between <blockquote> tags)
-
-    Returns:
-        Blockquote wrapped in figure element with citation extracted.
-    """
-    blockquote_content = match.group(1)
-    element_id = _generate_uuid()
-
-    # Extract citation if present
-    modified_content, figcaption_html = _extract_citation(blockquote_content)
-
-    return (
-        f'<figure name="{element_id}" id="{element_id}">'
-        f"<blockquote>{modified_content}</blockquote>"
-        f"<figcaption>{figcaption_html}</figcaption></figure>"
-    )
-
-
-_convert_blockquotes_to_note_format = html_transformer(_BLOCKQUOTE_FIGURE_PATTERN, _wrap_in_figure)
-"""Convert blockquotes to note.com figure format.
-
-note.com expects blockquotes to be wrapped in <figure> elements:
-<figure name="UUID" id="UUID">
-  <blockquote><p name="UUID" id="UUID">content</p></blockquote>
-  <figcaption>citation</figcaption>
-</figure>
-
-Citation is extracted from lines starting with em-dash (—):
-- "— Source" becomes <figcaption>Source</figcaption>
-- "— Source (URL)" becomes <figcaption><a href="URL">Source</a></figcaption>
-
-This format is required for the API to preserve <br> tags inside blockquotes.
-
-Args:
-    html: HTML string with blockquotes
-
-Returns:
-    HTML with blockquotes wrapped in figure elements
-"""
-
-
 def _add_uuid_to_elements(html: str) -> str:
     """Add name attribute (UUID) to HTML elements.
 
@@ -598,39 +396,6 @@ def _add_uuid_to_elements(html: str) -> str:
     return _TAG_PATTERN.sub(add_uuid, html)
 
 
-def _convert_images_to_note_format(html: str) -> str:
-    """Convert standard HTML img tags to note.com figure format.
-
-    note.com expects images in this format:
-    <figure name="UUID" id="UUID">
-      <img src="URL" alt="" width="620" height="457"
-           contenteditable="false" draggable="false">
-      <figcaption></figcaption>
-    </figure>
-
-    Args:
-        html: HTML string with standard img tags
-
-    Returns:
-        HTML with img tags converted to figure format
-    """
-
-    def replace_img(match: re.Match[str]) -> str:
-        src = match.group(1)
-        alt = match.group(2)
-        caption = match.group(3) or ""  # titleがなければ空文字
-        element_id = _generate_uuid()
-        # note.com requires both 'name' and 'id' attributes for proper content handling
-        return (
-            f'<figure name="{element_id}" id="{element_id}">'
-            f'<img src="{src}" alt="{alt}" width="620" height="457" '
-            f'contenteditable="false" draggable="false">'
-            f"<figcaption>{caption}</figcaption></figure>"
-        )
-
-    return _IMG_IN_P_PATTERN.sub(replace_img, html)
-
-
 def _convert_code_blocks_to_note_format(html: str) -> str:
     """Convert code blocks to note.com format and handle newlines.
 
@@ -682,18 +447,6 @@ def _convert_code_blocks_to_note_format(html: str) -> str:
     return result
 
 
-def _has_toc_placeholder(content: str) -> bool:
-    """Check if content contains [TOC] placeholder.
-
-    Args:
-        content: Markdown content to check.
-
-    Returns:
-        True if [TOC] placeholder exists on its own line.
-    """
-    return bool(_TOC_PATTERN.search(content))
-
-
 def _replace_toc_markers(content: str) -> str:
     """Replace [TOC] markers with placeholder (first only, rest removed).
 
@@ -718,109 +471,410 @@ def _replace_toc_markers(content: str) -> str:
     return _TOC_PATTERN.sub(replace_toc, content)
 
 
-@protected_content_transformer("TOC")
-def _convert_toc_to_placeholder(content: str) -> str:
-    """Convert first [TOC] to HTML placeholder.
+def _preprocess_markdown(content: str) -> str:
+    """Apply the note.com notations that are handled before Markdown parsing.
 
-    Only the first [TOC] is converted. Subsequent ones are removed.
-    [TOC] inside code blocks is not processed via decorator.
+    Code blocks are protected once and all transformations run on the
+    protected content:
+    1. [TOC] → TOC placeholder (first only)
+    2. Stock notation → noteマネー URLs (Issue #216), so they become embeds
+    3. Text alignment markers → alignment placeholders
 
     Args:
-        content: Markdown content with potential [TOC] markers.
+        content: Markdown content.
 
     Returns:
-        Content with [TOC] converted to placeholder.
+        Markdown content ready for conversion.
+    """
+    with _protect_code_blocks(content, "PRE") as (protected, blocks):
+        protected = _replace_toc_markers(protected)
+        protected = _replace_stock_notation(protected)
+        protected = _replace_alignment_markers(protected)
+    return _restore_code_blocks(protected, blocks)
+
+
+def _element_attrs() -> str:
+    """Generate the name/id attribute pair note.com requires on block elements."""
+    element_id = _generate_uuid()
+    # note.com requires both 'name' and 'id' attributes for proper content handling
+    return f' name="{element_id}" id="{element_id}"'
+
+
+class NoteHtmlRenderer(RendererHTML):
+    """markdown-it renderer emitting note.com (ProseMirror) HTML.
+
+    Walks the token stream once and writes note.com's structures directly:
+
+    - name/id attributes on p, h1-h6, ul, ol, hr and inline code elements
+    - list items hold paragraphs (<li><p>...</p></li>)
+    - blockquotes are wrapped in <figure>, with the citation line ("— Source")
+      as <figcaption>; line breaks inside them become <br>
+    - paragraphs holding only an image become image figures
+    - paragraphs holding only a supported URL become embed figures (Issue #116)
+    - the [TOC] placeholder becomes <table-of-contents> (Issue #117)
+    - text alignment placeholders become text-align styles (Issue #40)
+    - code blocks become <pre class="codeBlock">
+
+    Newlines are only kept inside code blocks.
     """
-    return _replace_toc_markers(content)
 
+    def render(self, tokens: Sequence[Token], options: OptionsDict, env: EnvType) -> str:
+        """Render block tokens to note.com HTML.
+
+        Args:
+            tokens: Block token stream from MarkdownIt.parse()
+            options: Parser options
+            env: Parser environment
+
+        Returns:
+            HTML in note.com format
+        """
+        out: list[str] = []
+        self._render_children(tokens, 0, options, env, out, quoted=False)
+        return "".join(out)
+
+    def code_inline(self, tokens: Sequence[Token], idx: int, options: OptionsDict, env: EnvType) -> str:
+        """Render inline code with name/id attributes."""
+        token = tokens[idx]
+        return f"<code{_element_attrs()}{self.renderAttrs(token)}>{escapeHtml(token.content)}</code>"
+
+    def html_inline(self, tokens: Sequence[Token], idx: int, options: OptionsDict, env: EnvType) -> str:
+        """Render raw inline HTML, adding name/id attributes to its elements."""
+        return _add_uuid_to_elements(tokens[idx].content)
+
+    def _render_children(
+        self,
+        tokens: Sequence[Token],
+        idx: int,
+        options: OptionsDict,
+        env: EnvType,
+        out: list[str],
+        *,
+        quoted: bool,
+    ) -> int:
+        """Render tokens up to the closing token of the enclosing container.
+
+        Args:
+            tokens: Block token stream
+            idx: Index of the first token to render
+            options: Parser options
+            env: Parser environment
+            out: Buffer the HTML is appended to
+            quoted: Whether the tokens are inside a blockquote
+
+        Returns:
+            Index of the closing token (or len(tokens) at the end of the stream)
+        """
+        while idx < len(tokens):
+            token = tokens[idx]
+            if token.nesting == -1:
+                return idx
+            if token.type in ("paragraph_open", "heading_open"):
+                # Always followed by an inline token and the closing token
+                out.append(self._render_text_block(token, tokens[idx + 1], options, env, quoted=quoted))
+                idx += 3
+            elif token.nesting == 1:
+                idx = self._render_container(tokens, idx, options, env, out, quoted=quoted)
+            else:
+                out.append(self._render_leaf(tokens, idx, options, env))
+                idx += 1
+        return idx
+
+    def _render_container(
+        self,
+        tokens: Sequence[Token],
+        idx: int,
+        options: OptionsDict,
+        env: EnvType,
+        out: list[str],
+        *,
+        quoted: bool,
+    ) -> int:
+        """Render a list, list item or blockquote with its children.
+
+        Returns:
+            Index of the token following the container's closing token
+        """
+        token = tokens[idx]
+        if token.type == "blockquote_open":
+            inner: list[str] = []
+            close = self._render_children(tokens, idx + 1, options, env, inner, quoted=True)
+            content, figcaption_html = _extract_citation("".join(inner))
+            out.append(
+                f"<figure{_element_attrs()}><blockquote>{content}</blockquote>"
+                f"<figcaption>{figcaption_html}</figcaption></figure>"
+            )
+            return close + 1
+
+        # note.com doesn't add name/id to <li> tags
+        attrs = _element_attrs() if token.type in ("bullet_list_open", "ordered_list_open") else ""
+        out.append(f"<{token.tag}{attrs}{self.renderAttrs(token)}>")
+        close = self._render_children(tokens, idx + 1, options, env, out, quoted=quoted)
+        out.append(f"</{token.tag}>")
+        return close + 1
+
+    def _render_text_block(
+        self,
+        token: Token,
+        inline: Token,
+        options: OptionsDict,
+        env: EnvType,
+        *,
+        quoted: bool,
+    ) -> str:
+        """Render a paragraph or heading.
+
+        Paragraphs of tight list items (hidden by markdown-it) are still
+        written as <p>, but never become figures, embeds or TOC.
+        """
+        children = inline.children or []
+        if token.tag != "p":
+            content = self.renderInline(children, options, env).replace("\n", "")
+            return f"<{token.tag}{_element_attrs()}>{content}</{token.tag}>"
+
+        if not token.hidden and len(children) == 1 and children[0].type == "image":
+            figure = self._render_image_figure(children[0], options, env)
+            if figure is not None:
+                return figure
+
+        content = self.renderInline(children, options, env)
+        # note.com's editor uses <br> (without slash) for line breaks inside blockquotes
+        line_break = "<br>" if quoted else ""
+
+        if token.hidden:
+            content = content.strip()
+        elif content == _TOC_PLACEHOLDER:
+            return f"<table-of-contents{_element_attrs()}></table-of-contents>"
+        elif align_match := _ALIGN_CONTENT_PATTERN.fullmatch(content):
+            alignment = align_match.group(1).lower()
+            aligned = align_match.group(2).replace("\n", line_break)
+            return f'<p style="text-align: {alignment}"{_element_attrs()}>{aligned}</p>'
+        elif url_match := _STANDALONE_URL_HTML_PATTERN.fullmatch(content):
+            url = url_match.group(1)
+            service = get_embed_service(url)
+            if service is not None:
+                return generate_embed_html(url, service)
+
+        content = content.replace("\n", line_break)
+        return f"<p{_element_attrs()}>{content}</p>"
+
+    def _render_image_figure(self, image: Token, options: OptionsDict, env: EnvType) -> str | None:
+        """Render an image alone in a paragraph as a note.com image figure.
+
+        The image title becomes the figure caption.
+
+        Returns:
+            Figure HTML, or None for images without a source
+        """
+        src = image.attrGet("src")
+        if not src:
+            return None
+        alt = escapeHtml(self.renderInlineAsText(image.children or [], options, env)).replace("\n", "")
+        title = image.attrGet("title")
+        caption = escapeHtml(str(title)).replace("\n", "") if title else ""
+        return (
+            f"<figure{_element_attrs()}>"
+            f'<img src="{escapeHtml(str(src))}" alt="{alt}" width="620" height="457" '
+            f'contenteditable="false" draggable="false">'
+            f"<figcaption>{caption}</figcaption></figure>"
+        )
+
+    def _render_leaf(self, tokens: Sequence[Token], idx: int, options: OptionsDict, env: EnvType) -> str:
+        """Render a code block, horizontal rule or raw HTML block."""
+        token = tokens[idx]
+        if token.type in ("fence", "code_block"):
+            # note.com doesn't use language classes; code without one keeps name/id
+            has_language = token.type == "fence" and bool(unescapeAll(token.info).strip())
+            code_attrs = "" if has_language else _element_attrs()
+            return (
+                f'<pre{_element_attrs()} class="codeBlock"><code{code_attrs}>{escapeHtml(token.content)}</code></pre>'
+            )
+        if token.type == "hr":
+            return f"<hr{_element_attrs()} />"
+        if token.type == "html_block":
+            return _convert_code_blocks_to_note_format(_add_uuid_to_elements(token.content))
+        return super().render(tokens[idx : idx + 1], options, env).replace("\n", "")
 
-def _convert_toc_placeholder_to_html(html: str) -> str:
-    """Convert TOC placeholder in HTML to <table-of-contents> element.
 
-    Replaces <p name="..." id="...">§§TOC§§</p> with
-    <table-of-contents name="..." id="..."></table-of-contents>
+# Parser shared by all conversions. Building a MarkdownIt instance compiles its
+# rule chains, so it is done once; rendering keeps no state on the instance
+# (element IDs come from a context variable), so it is safe to share across threads.
+_NOTE_MARKDOWN = MarkdownIt(renderer_cls=NoteHtmlRenderer).enable("strikethrough")
 
-    This is called after markdown conversion and UUID addition to convert
-    the placeholder to the actual custom element that note.com preserves via API.
 
-    Issue #117: This enables TOC via API without browser automation.
+def _is_closed_fence(markup: str, body_lines: list[str]) -> bool:
+    """Check whether a fenced code block ends with a closing fence.
 
     Args:
-        html: HTML content with potential TOC placeholder
+        markup: Opening fence marker (e.g. "```" or "~~~~")
+        body_lines: Lines of the block after the opening fence
 
     Returns:
-        HTML with TOC placeholder converted to <table-of-contents> element
+        True if the last line closes the fence
     """
+    if not body_lines:
+        return False
+    closing = re.compile(rf" {{0,3}}{re.escape(markup[0])}{{{len(markup)},}}[ \t]*")
+    return closing.fullmatch(body_lines[-1]) is not None
 
-    def replace_with_toc(match: re.Match[str]) -> str:
-        name = match.group(1)
-        element_id = match.group(2)
-        return f'<table-of-contents name="{name}" id="{element_id}"></table-of-contents>'
 
-    return _TOC_PLACEHOLDER_HTML_PATTERN.sub(replace_with_toc, html)
+def _split_top_level_blocks(content: str) -> list[str] | None:
+    """Split Markdown into the source of its top-level blocks.
 
+    Blank lines between blocks are dropped; they do not affect the output.
+    An unclosed fence runs to the end of the document and keeps the rest of
+    the source, since it includes the trailing newlines in its code.
 
-def markdown_to_html(content: str) -> str:
-    """Convert Markdown content to HTML.
+    Args:
+        content: Pre-processed Markdown content
 
-    Uses markdown-it-py for CommonMark-compliant conversion.
-    Converts images to note.com's figure format.
+    Returns:
+        Source of each top-level block in document order, or None when the
+        blocks cannot be converted independently: link reference definitions
+        apply to the whole document, and raw HTML blocks may open an element
+        in one block and close it in another.
+    """
+    env: dict[str, Any] = {}
+    state = StateCore(content, _BLOCK_SPLITTER, env)
+    _BLOCK_SPLITTER.core.process(state)
+    if env.get("references"):
+        return None
+
+    lines = state.src.split("\n")
+    blocks: list[str] = []
+    for token in state.tokens:
+        if token.level != 0 or token.nesting < 0 or token.map is None:
+            continue
+        if token.type == "html_block":
+            return None
+        start, end = token.map
+        if token.type == "fence" and not _is_closed_fence(token.markup, lines[start + 1 : end]):
+            end = len(lines)
+        blocks.append("\n".join(lines[start:end]))
+    return blocks
+
+
+def _render_note_html(content: str) -> str:
+    """Render pre-processed Markdown as note.com HTML.
 
     Args:
-        content: Markdown formatted text
+        content: Markdown content after TOC, stock notation and text
+            alignment pre-processing
 
     Returns:
-        HTML formatted text. Returns empty string for empty input.
+        HTML in note.com format
+    """
+    result: str = _NOTE_MARKDOWN.render(content)
+    return result
 
-    Example:
-        >>> markdown_to_html("# Hello")
-        '<h1>Hello</h1>\\n'
+
+def _render_with_seed(content: str, seed: str | None) -> str:
+    """Convert pre-processed Markdown, deriving element IDs from a seed if given.
+
+    Args:
+        content: Pre-processed Markdown content
+        seed: Seed for stable element IDs (None for random IDs)
+
+    Returns:
+        HTML in note.com format
     """
-    if not content or not content.strip():
-        return ""
+    if seed is None:
+        return _render_note_html(content)
+    with stable_element_ids(seed):
+        return _render_note_html(content)
 
-    # 1. Convert [TOC] to placeholder FIRST (before any processing)
-    content = _convert_toc_to_placeholder(content)
 
-    # 2. Convert stock notation to URLs (Issue #216)
-    # Must be before markdown conversion so URLs can be processed as embeds
-    content = _convert_stock_notation(content)
+def _with_fresh_ids(block: CachedBlock) -> str:
+    """Replace the element IDs of a cached block with newly generated ones.
 
-    # 3. Convert text alignment markers to placeholders BEFORE markdown conversion
-    content = _convert_text_alignment(content)
+    Args:
+        block: Cached block
 
-    # 4. Markdown conversion
-    md = MarkdownIt().enable("strikethrough")
-    result: str = md.render(content)
+    Returns:
+        HTML of the block with new element IDs (and embed placeholder keys)
+    """
+    html = block.html
+    for cached_id in block.element_ids:
+        element_id = new_element_id()
+        html = html.replace(cached_id, element_id)
+        html = html.replace(placeholder_embed_key(cached_id), placeholder_embed_key(element_id))
+    return html
 
-    # Convert images to note.com format
-    result = _convert_images_to_note_format(result)
 
-    # Wrap list item content in p tags (ProseMirror requirement)
-    result = _wrap_li_content_in_p(result)
+def _render_blocks_cached(blocks: list[str], *, stable_ids: bool = False) -> str:
+    """Convert top-level blocks, reusing cached HTML for unchanged blocks.
 
-    # Convert blockquote newlines to <br> tags (note.com browser editor format)
-    result = _convert_blockquote_newlines_to_br(result)
+    Blocks are rendered with element IDs seeded by the block digest. With
+    random IDs, these are replaced by new IDs each time a block is used, so
+    element IDs are never shared between documents or repeated blocks. Stable
+    IDs are seeded with the block digest and occurrence number and are used
+    as rendered.
 
-    # Add UUID to all elements (note.com requirement)
-    result = _add_uuid_to_elements(result)
+    Args:
+        blocks: Source of each top-level block
+        stable_ids: Derive element IDs from block content and occurrence
+
+    Returns:
+        HTML of the whole document
+    """
+    cache = get_html_block_cache()
+    occurrences: dict[str, int] = {}
+    parts: list[str] = []
+    for block in blocks:
+        digest = hashlib.sha256(block.encode("utf-8")).hexdigest()
+        if stable_ids:
+            occurrence = occurrences.get(digest, 0)
+            occurrences[digest] = occurrence + 1
+            # Seeds contain ":" and never collide with the plain digests of random-ID entries
+            seed = f"{digest}:{occurrence}"
+        else:
+            seed = digest
+        cached = cache.get(seed)
+        if cached is None:
+            with stable_element_ids(seed) as element_ids:
+                html = _render_note_html(block)
+            cached = CachedBlock(html, tuple(element_ids))
+            cache.put(seed, cached)
+        parts.append(cached.html if stable_ids else _with_fresh_ids(cached))
+    return "".join(parts)
+
+
+def markdown_to_html(content: str, *, incremental: bool = True, stable_ids: bool = False) -> str:
+    """Convert Markdown content to HTML.
 
-    # Convert TOC placeholder to <table-of-contents> element (Issue #117)
-    # Must be after UUID addition to preserve name/id attributes
-    result = _convert_toc_placeholder_to_html(result)
+    Uses markdown-it-py for CommonMark-compliant conversion.
+    Converts images to note.com's figure format.
 
-    # Apply text alignment styles to paragraphs (must be after UUID addition)
-    result = _apply_text_alignment_to_html(result)
+    Args:
+        content: Markdown formatted text
+        incremental: Convert top-level blocks separately and reuse the cached
+            HTML of unchanged blocks (see HtmlBlockCache). The output is the
+            same as a full conversion; with random IDs, reused blocks get new
+            element IDs.
+        stable_ids: Derive element IDs (and embed placeholder keys) from the
+            content instead of generating random UUIDs. Each block is seeded
+            with its content and occurrence number, so unchanged blocks keep
+            their IDs when other blocks are edited. Documents converted as a
+            whole (incremental=False, reference definitions, raw HTML blocks)
+            are seeded with the whole document.
 
-    # Convert blockquotes to note.com figure format
-    # This is required for the API to preserve <br> tags inside blockquotes
-    result = _convert_blockquotes_to_note_format(result)
+    Returns:
+        HTML formatted text. Returns empty string for empty input.
 
-    # Convert standalone embed URLs to figure elements (Issue #116)
-    # YouTube, Twitter, note.com URLs alone in a paragraph become embeds
-    result = _convert_standalone_embed_urls(result)
+    Example:
+        >>> markdown_to_html("# Hello")
+        '<h1>Hello</h1>\\n'
+    """
+    if not content or not content.strip():
+        return ""
 
-    # Convert code blocks to note.com format and handle newlines
-    result = _convert_code_blocks_to_note_format(result)
+    # 1. TOC, stock notation and text alignment markers (code blocks protected once)
+    content = _preprocess_markdown(content)
 
-    return result
+    # 2. Markdown conversion and note.com HTML post-processing
+    if incremental:
+        blocks = _split_top_level_blocks(content)
+        if blocks is not None:
+            return _render_blocks_cached(blocks, stable_ids=stable_ids)
+    seed = hashlib.sha256(content.encode("utf-8")).hexdigest() if stable_ids else None
+    return _render_with_seed(content, seed)
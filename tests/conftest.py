@@ -13,7 +13,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from note_mcp.api.embed_cache import EmbedKeyCache
+from note_mcp.api.id_cache import NoteIdCache
+from note_mcp.api.markdown_cache import ConvertedMarkdownCache
+from note_mcp.api.mirror import MIRROR_ENV_VAR
+from note_mcp.api.save_cache import SavedContentCache
+from note_mcp.api.search_index import ArticleSearchIndex
 from note_mcp.models import Session
+from note_mcp.utils.conversion_pool import ConversionPool
+from note_mcp.utils.markdown_to_html import HtmlBlockCache
 
 if TYPE_CHECKING:
     pass
@@ -93,6 +101,112 @@ def mock_keyring_with_session(mock_keyring: MagicMock, mock_session: Session) ->
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def isolated_note_id_cache() -> Generator[NoteIdCache]:
+    """Give each test an empty, memory-only key/ID cache.
+
+    The process-wide cache is filled as a side effect of API responses,
+    which would otherwise leak resolved IDs between tests.
+
+    Yields:
+        The NoteIdCache instance used during the test.
+    """
+    cache = NoteIdCache()
+    with patch("note_mcp.api.id_cache._note_id_cache", cache):
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_embed_key_cache() -> Generator[EmbedKeyCache]:
+    """Give each test an empty, memory-only embed key cache.
+
+    Yields:
+        The EmbedKeyCache instance used during the test.
+    """
+    cache = EmbedKeyCache()
+    with patch("note_mcp.api.embed_cache._embed_key_cache", cache):
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def disabled_article_mirror(monkeypatch: pytest.MonkeyPatch) -> Generator[None]:
+    """Keep the local article mirror disabled unless a test enables it.
+
+    Tests enable it by patching note_mcp.api.mirror._article_mirror.
+    """
+    monkeypatch.delenv(MIRROR_ENV_VAR, raising=False)
+    with patch("note_mcp.api.mirror._article_mirror", None):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_search_index() -> Generator[ArticleSearchIndex]:
+    """Give each test an empty, in-memory full-text search index.
+
+    The index belongs to user_id "user123"; sessions of other accounts get
+    a fresh index of their own.
+
+    Yields:
+        The ArticleSearchIndex instance used during the test.
+    """
+    index = ArticleSearchIndex(account="user123")
+    with patch("note_mcp.api.search_index._search_index", index):
+        yield index
+    index.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_saved_content_cache() -> Generator[SavedContentCache]:
+    """Give each test an empty last-saved content cache.
+
+    Without this, a save in one test would make identical updates in later
+    tests return early.
+
+    Yields:
+        The SavedContentCache instance used during the test.
+    """
+    cache = SavedContentCache()
+    with patch("note_mcp.api.save_cache._saved_content_cache", cache):
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_markdown_cache() -> Generator[ConvertedMarkdownCache]:
+    """Give each test an empty converted Markdown cache.
+
+    Yields:
+        The ConvertedMarkdownCache instance used during the test.
+    """
+    cache = ConvertedMarkdownCache()
+    with patch("note_mcp.api.markdown_cache._converted_markdown_cache", cache):
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_html_block_cache() -> Generator[HtmlBlockCache]:
+    """Give each test an empty Markdown block conversion cache.
+
+    Yields:
+        The HtmlBlockCache instance used during the test.
+    """
+    cache = HtmlBlockCache()
+    with patch("note_mcp.utils.markdown_to_html._html_block_cache", cache):
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_conversion_pool() -> Generator[ConversionPool]:
+    """Give each test a default conversion pool, shut down afterwards.
+
+    Yields:
+        The ConversionPool instance used during the test.
+    """
+    pool = ConversionPool()
+    with patch("note_mcp.utils.conversion_pool._conversion_pool", pool):
+        yield pool
+    pool.shutdown()
+
+
 @pytest.fixture
 def mock_api_client() -> Generator[AsyncMock]:
     """Create a mock NoteAPIClient for testing API operations.
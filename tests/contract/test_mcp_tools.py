@@ -175,7 +175,7 @@ class TestToolSchemas:
         assert "properties" in schema
 
         # Exact properties match
-        expected_properties = {"article_id", "title", "body", "tags"}
+        expected_properties = {"article_id", "title", "body", "tags", "force"}
         actual_properties = set(schema.get("properties", {}).keys())
         assert actual_properties == expected_properties, (
             f"Schema mismatch: "
@@ -66,6 +66,9 @@ class TestCreateDraft:
             assert "python" in article.tags
             # create_draft calls POST twice: /v1/text_notes and /v1/text_notes/draft_save
             assert mock_client.post.call_count == 2
+            # Only draft_save opts in to retries
+            assert not mock_client.post.call_args_list[0][1].get("retry")
+            assert mock_client.post.call_args_list[1][1]["retry"] is True
 
     @pytest.mark.asyncio
     async def test_create_draft_converts_markdown_to_html(self) -> None:
@@ -411,24 +414,8 @@ class TestPublishArticle:
             }
         }
 
-        # Mock article returned by get_article_via_api after publishing
-        mock_published_article = Article(
-            id="123456",
-            key="n1234567890ab",
-            title="Published Article",
-            body="Content",
-            status=ArticleStatus.PUBLISHED,
-            url="https://note.com/testuser/n/n1234567890ab",
-        )
-
         with (
             patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class,
-            patch("note_mcp.api.articles._resolve_numeric_note_id") as mock_resolve,
-            patch(
-                "note_mcp.api.articles.get_article_via_api",
-                new_callable=AsyncMock,
-                return_value=mock_published_article,
-            ) as mock_get_article,
         ):
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
@@ -436,13 +423,9 @@ class TestPublishArticle:
             mock_client.__aexit__ = AsyncMock(return_value=False)
             mock_client.get = AsyncMock(return_value=mock_get_response)
             mock_client.put = AsyncMock(return_value=mock_put_response)
-            mock_resolve.return_value = "123456"
 
             article = await publish_article(session, article_id="n1234567890ab")
 
-            # Verify _resolve_numeric_note_id was called
-            mock_resolve.assert_called_once_with(session, "n1234567890ab")
-
             # Verify GET /v3/notes/{article_id} was called to fetch article title
             mock_client.get.assert_called_once()
 
@@ -461,9 +444,7 @@ class TestPublishArticle:
                 "index": False,
             }
 
-            # Verify get_article_via_api was called once (after publish)
-            mock_get_article.assert_called_once_with(session, "n1234567890ab")
-
+            # The returned article is built from the fetched snapshot, not fetched again
             assert article.id == "123456"
             assert article.status == ArticleStatus.PUBLISHED
             assert article.url == "https://note.com/testuser/n/n1234567890ab"
@@ -560,7 +541,6 @@ class TestPublishArticle:
 
         with (
             patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class,
-            patch("note_mcp.api.articles._resolve_numeric_note_id") as mock_resolve,
         ):
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
@@ -568,13 +548,43 @@ class TestPublishArticle:
             mock_client.__aexit__ = AsyncMock(return_value=False)
             mock_client.get = AsyncMock(return_value=mock_get_response)
             mock_client.put = AsyncMock(return_value=mock_put_response)
-            mock_resolve.return_value = "123456"
 
             with pytest.raises(NoteAPIError) as exc_info:
                 await publish_article(session, article_id="n1234567890ab")
 
             assert "Failed to publish article" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_publish_rejects_deleted_article(self) -> None:
+        """Test that a deleted article is reported as not found without publishing."""
+        from note_mcp.models import NoteAPIError
+
+        session = create_mock_session()
+
+        mock_get_response: dict[str, Any] = {
+            "data": {
+                "id": 123456,
+                "key": "n1234567890ab",
+                "name": "Deleted Article",
+                "body": "",
+                "status": "deleted",
+            }
+        }
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=False)
+            mock_client.get = AsyncMock(return_value=mock_get_response)
+            mock_client.put = AsyncMock()
+
+            with pytest.raises(NoteAPIError) as exc_info:
+                await publish_article(session, article_id="n1234567890ab")
+
+            assert exc_info.value.code == ErrorCode.ARTICLE_NOT_FOUND
+            mock_client.put.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_publish_handles_put_request_failure(self) -> None:
         """Test that publish_article propagates PUT request failures."""
@@ -595,7 +605,6 @@ class TestPublishArticle:
 
         with (
             patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class,
-            patch("note_mcp.api.articles._resolve_numeric_note_id") as mock_resolve,
         ):
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
@@ -608,7 +617,6 @@ class TestPublishArticle:
                     message="Server error",
                 )
             )
-            mock_resolve.return_value = "123456"
 
             with pytest.raises(NoteAPIError) as exc_info:
                 await publish_article(session, article_id="n1234567890ab")
@@ -643,25 +651,8 @@ class TestPublishArticle:
             }
         }
 
-        # Mock article returned by get_article_via_api after publishing
-        mock_published_article = Article(
-            id="123456",
-            key="n1234567890ab",
-            title="Published Article with Tags",
-            body="Content",
-            status=ArticleStatus.PUBLISHED,
-            url="https://note.com/testuser/n/n1234567890ab",
-            tags=["Python", "test"],
-        )
-
         with (
             patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class,
-            patch("note_mcp.api.articles._resolve_numeric_note_id") as mock_resolve,
-            patch(
-                "note_mcp.api.articles.get_article_via_api",
-                new_callable=AsyncMock,
-                return_value=mock_published_article,
-            ) as mock_get_article,
         ):
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
@@ -669,13 +660,9 @@ class TestPublishArticle:
             mock_client.__aexit__ = AsyncMock(return_value=False)
             mock_client.get = AsyncMock(return_value=mock_get_response)
             mock_client.put = AsyncMock(return_value=mock_put_response)
-            mock_resolve.return_value = "123456"
 
             article = await publish_article(session, article_id="n1234567890ab", tags=["Python", "test"])
 
-            # Verify _resolve_numeric_note_id was called
-            mock_resolve.assert_called_once_with(session, "n1234567890ab")
-
             # Verify GET /v3/notes/{article_id} was called to fetch article data
             mock_client.get.assert_called_once()
             get_call_args = mock_client.get.call_args
@@ -699,9 +686,7 @@ class TestPublishArticle:
                 "hashtags": ["#Python", "#test"],
             }
 
-            # Verify get_article_via_api was called once (after publish)
-            mock_get_article.assert_called_once_with(session, "n1234567890ab")
-
+            # The returned article is built from the fetched snapshot, not fetched again
             assert article.id == "123456"
             assert article.status == ArticleStatus.PUBLISHED
             assert "Python" in article.tags
@@ -734,24 +719,8 @@ class TestPublishArticle:
             }
         }
 
-        # Mock article returned by get_article_via_api after publishing
-        mock_published_article = Article(
-            id="123456",
-            key="n1234567890ab",
-            title="Published Article",
-            body="Content",
-            status=ArticleStatus.PUBLISHED,
-            url="https://note.com/testuser/n/n1234567890ab",
-        )
-
         with (
             patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class,
-            patch("note_mcp.api.articles._resolve_numeric_note_id") as mock_resolve,
-            patch(
-                "note_mcp.api.articles.get_article_via_api",
-                new_callable=AsyncMock,
-                return_value=mock_published_article,
-            ) as mock_get_article,
         ):
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
@@ -760,9 +729,8 @@ class TestPublishArticle:
             mock_client.get = AsyncMock(return_value=mock_get_response)
             mock_client.put = AsyncMock(return_value=mock_put_response)
             mock_client.post = AsyncMock()  # Should not be called
-            mock_resolve.return_value = "123456"
 
-            await publish_article(session, article_id="n1234567890ab")
+            article = await publish_article(session, article_id="n1234567890ab")
 
             # Verify GET was called to fetch article title
             mock_client.get.assert_called_once()
@@ -781,8 +749,12 @@ class TestPublishArticle:
                 "index": False,
             }
 
-            # Verify get_article_via_api was called once (after publish)
-            mock_get_article.assert_called_once_with(session, "n1234567890ab")
+            # The returned article is built from the fetched snapshot and PUT response
+            assert mock_client.get.call_count + mock_client.put.call_count == 2
+            assert article.key == "n1234567890ab"
+            assert article.title == "Published Article"
+            assert article.status == ArticleStatus.PUBLISHED
+            assert article.body == ""
 
 
 class TestCreateDraftWithEmbeds:
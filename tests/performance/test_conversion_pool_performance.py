@@ -0,0 +1,106 @@
+"""Load test for offloading large conversions to the conversion pool.
+
+Small requests keep running on the event loop while large articles are
+converted. Their p99 latency is compared with and without a worker pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from note_mcp.utils.conversion_pool import ConversionPool
+from note_mcp.utils.markdown_to_html import markdown_to_html
+
+# Number of large conversions run during each measurement
+LARGE_CONVERSIONS = 2
+
+SMALL_ARTICLE = "## 小さな記事\n\n短い本文です。**太字**と[リンク](https://example.com)。"
+
+
+def _large_article(sections: int) -> str:
+    """Build a Markdown article with the given number of sections."""
+    return "\n\n".join(
+        f"## 見出し {i}\n\n段落 {i} の本文。**太字**、`code`、[リンク](https://example.com/{i})\n\n"
+        f"- 項目 {i}-1\n- 項目 {i}-2"
+        for i in range(sections)
+    )
+
+
+def _p99(latencies: list[float]) -> float:
+    """99th percentile of latencies, in seconds."""
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+async def _small_request_latencies(pool: ConversionPool, large: str | None) -> list[float]:
+    """Latencies of small requests served while large conversions run.
+
+    Each small request waits for I/O (1ms) and converts a small article on
+    the event loop. Without a large article, the requests run for a fixed time.
+    """
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def small_requests() -> None:
+        while not done.is_set():
+            start_time = time.perf_counter()
+            await asyncio.sleep(0.001)
+            await pool.run(markdown_to_html, SMALL_ARTICLE, incremental=False)
+            latencies.append(time.perf_counter() - start_time)
+
+    task = asyncio.create_task(small_requests())
+    await asyncio.sleep(0.05)
+    if large is None:
+        await asyncio.sleep(0.5)
+    else:
+        for _ in range(LARGE_CONVERSIONS):
+            await pool.run(markdown_to_html, large, incremental=False)
+    done.set()
+    await task
+    return latencies
+
+
+class TestConversionPoolLoad:
+    """p99 latency of small requests while large articles are converted."""
+
+    @pytest.mark.asyncio
+    async def test_small_request_p99_stays_flat(self) -> None:
+        """Offloading keeps small requests responsive during large conversions.
+
+        Inline, every small request that arrives during a large conversion
+        waits for all of it. With a process pool the p99 stays close to the
+        idle p99; a thread pool still shares the GIL but no longer waits for
+        whole conversions.
+
+        Latencies are only compared with the inline run measured by the same
+        test, with generous ratios, so the result does not depend on the
+        speed of the machine.
+        """
+        large = _large_article(1500)
+        threshold = len(SMALL_ARTICLE) + 1
+
+        idle = _p99(await _small_request_latencies(ConversionPool(workers=0), None))
+        inline = _p99(await _small_request_latencies(ConversionPool(workers=0), large))
+
+        process_pool = ConversionPool(workers=1, threshold=threshold, kind="process")
+        thread_pool = ConversionPool(workers=1, threshold=threshold, kind="thread")
+        try:
+            # Start the workers before measuring
+            await process_pool.run(markdown_to_html, SMALL_ARTICLE * 2)
+            process = _p99(await _small_request_latencies(process_pool, large))
+            thread = _p99(await _small_request_latencies(thread_pool, large))
+        finally:
+            process_pool.shutdown()
+            thread_pool.shutdown()
+
+        print(
+            f"\n[PERF] small request p99: idle {idle * 1000:.1f}ms, "
+            f"inline {inline * 1000:.1f}ms, thread pool {thread * 1000:.1f}ms, "
+            f"process pool {process * 1000:.1f}ms ({len(large)} chars x {LARGE_CONVERSIONS})"
+        )
+
+        assert process * 4 < inline, f"process pool p99 {process:.3f}s vs inline {inline:.3f}s"
+        assert thread * 2 < inline, f"thread pool p99 {thread:.3f}s vs inline {inline:.3f}s"
@@ -0,0 +1,162 @@
+"""Performance tests for embed processing.
+
+Measures embed key substitution over large article bodies with many embeds,
+and embed URL classification.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+EMBED_COUNT = 500
+PARAGRAPHS_PER_EMBED = 20
+
+
+def _build_large_body() -> str:
+    """Build an article body with many embeds separated by long text."""
+    paragraph = '<p name="p" id="p">' + "本文テキスト" * 50 + "</p>"
+    parts: list[str] = []
+    for i in range(EMBED_COUNT):
+        parts.append(paragraph * PARAGRAPHS_PER_EMBED)
+        parts.append(
+            f'<figure name="fig{i}" id="fig{i}" '
+            f'data-src="https://www.youtube.com/watch?v=video{i}" '
+            f'embedded-service="youtube" '
+            f'embedded-content-key="embrandom{i}x" '
+            f'contenteditable="false"></figure>'
+        )
+    return "".join(parts)
+
+
+def _replace_keys_repeatedly(html_body: str, keys: dict[str, str]) -> str:
+    """Previous approach: one str.replace over the whole body per embed."""
+    result = html_body
+    for old_key, new_key in keys.items():
+        result = result.replace(
+            f'embedded-content-key="{old_key}"',
+            f'embedded-content-key="{new_key}"',
+        )
+    return result
+
+
+class TestEmbedKeySubstitutionPerformance:
+    """Performance tests for resolve_embed_keys substitution."""
+
+    def test_single_pass_substitution_is_faster(self) -> None:
+        """Compare single-pass substitution with repeated str.replace.
+
+        Both approaches must produce identical output; the single pass
+        copies the body once instead of once per embed.
+        """
+        from note_mcp.api.embeds import _EMBED_FIGURE_PATTERN, _replace_embed_keys
+
+        html_body = _build_large_body()
+        matches = list(_EMBED_FIGURE_PATTERN.finditer(html_body))
+        assert len(matches) == EMBED_COUNT
+        replacements = [(match, f"embserver{i}x") for i, match in enumerate(matches)]
+        keys = {match.group(2): new_key for match, new_key in replacements}
+
+        start_time = time.perf_counter()
+        expected = _replace_keys_repeatedly(html_body, keys)
+        repeated_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        result = _replace_embed_keys(html_body, replacements)
+        single_pass_ms = (time.perf_counter() - start_time) * 1000
+
+        assert result == expected
+        assert single_pass_ms < repeated_ms, (
+            f"single pass took {single_pass_ms:.2f}ms, repeated replace took {repeated_ms:.2f}ms"
+        )
+
+        print(
+            f"\n[PERF] embed key substitution ({len(html_body) // 1024} KiB, {EMBED_COUNT} embeds): "
+            f"single pass {single_pass_ms:.2f}ms, repeated replace {repeated_ms:.2f}ms"
+        )
+
+    @pytest.mark.asyncio
+    async def test_resolve_embed_keys_large_body(self) -> None:
+        """Measure resolve_embed_keys end to end with mocked key lookups."""
+        from note_mcp.api.embeds import resolve_embed_keys
+        from note_mcp.models import Session
+
+        session = Session(
+            cookies={"note_gql_auth_token": "token123", "_note_session_v5": "session456"},
+            user_id="user123",
+            username="testuser",
+            expires_at=int(time.time()) + 3600,
+            created_at=int(time.time()),
+        )
+        html_body = _build_large_body()
+
+        async def fake_fetch(_session: Session, url: str, _article_key: str) -> tuple[str, str]:
+            return f"embserver{url.rsplit('video', 1)[1]}x", "<iframe></iframe>"
+
+        with patch("note_mcp.api.embeds.fetch_embed_key", side_effect=fake_fetch):
+            start_time = time.perf_counter()
+            result = await resolve_embed_keys(session, html_body, "n1234567890ab")
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        assert "embrandom" not in result
+        assert result.count("embserver") == EMBED_COUNT
+        assert elapsed_ms < 1000, f"resolve_embed_keys took {elapsed_ms:.2f}ms (expected < 1000ms with mocks)"
+
+        print(f"\n[PERF] resolve_embed_keys ({EMBED_COUNT} embeds): {elapsed_ms:.2f}ms")
+
+
+CLASSIFY_ROUNDS = 2000
+
+CLASSIFY_URLS = [
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://twitter.com/user/status/1234567890",
+    "https://note.com/username/n/n1234567890ab",
+    "https://gist.github.com/user/abc123def456",
+    "https://github.com/anthropics/claude-code",
+    "https://docs.google.com/presentation/d/1W543BSd-hHANrJOzCPyNf-r3x0s5s7ljc9xA7a7x960/edit",
+    "https://speakerdeck.com/tomohisa/introducing-decider",
+    "https://money.note.com/companies/7203",
+    "https://zenn.dev/zenn/articles/markdown-guide",
+    "https://qiita.com/driller/items/31c1ff4d0bf5813f624f",
+    "https://fin-py.connpass.com/event/381982/",
+    # Unsupported URLs scan the whole table in the linear approach
+    "https://example.com/some/page",
+    "https://docs.python.org/3/library/re.html",
+]
+
+
+class TestEmbedServiceClassificationPerformance:
+    """Micro-benchmark for get_embed_service."""
+
+    def test_host_dispatch_is_faster_than_linear_scan(self) -> None:
+        """Compare host dispatch with trying every pattern in EMBED_PATTERNS."""
+        from note_mcp.api.embeds import EMBED_PATTERNS, get_embed_service
+
+        def scan(url: str) -> str | None:
+            for pattern, service in EMBED_PATTERNS:
+                if pattern.match(url):
+                    return service
+            return None
+
+        assert [get_embed_service(url) for url in CLASSIFY_URLS] == [scan(url) for url in CLASSIFY_URLS]
+
+        start_time = time.perf_counter()
+        for _ in range(CLASSIFY_ROUNDS):
+            for url in CLASSIFY_URLS:
+                scan(url)
+        scan_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        for _ in range(CLASSIFY_ROUNDS):
+            for url in CLASSIFY_URLS:
+                get_embed_service(url)
+        dispatch_ms = (time.perf_counter() - start_time) * 1000
+
+        assert dispatch_ms < scan_ms, f"host dispatch took {dispatch_ms:.2f}ms, linear scan took {scan_ms:.2f}ms"
+
+        print(
+            f"\n[PERF] get_embed_service ({CLASSIFY_ROUNDS * len(CLASSIFY_URLS)} URLs): "
+            f"host dispatch {dispatch_ms:.2f}ms, linear scan {scan_ms:.2f}ms"
+        )
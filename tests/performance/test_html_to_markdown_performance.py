@@ -0,0 +1,92 @@
+"""Performance tests for HTML to Markdown conversion.
+
+Checks that conversion time grows linearly with the size of note.com HTML
+(the number of lists and the size of the whole body).
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from note_mcp.utils.html_to_markdown import html_to_markdown
+
+ROUNDS = 5
+
+GOLDEN_DIR = Path(__file__).parent.parent / "unit" / "golden" / "markdown_to_html"
+
+
+def _checklist_article(lists: int) -> str:
+    """Build note.com HTML with the given number of checklist sections."""
+    sections = []
+    for i in range(lists):
+        sections.append(
+            f'<h3 name="h{i}" id="h{i}">チェック項目 {i}</h3>'
+            f'<ul name="u{i}" id="u{i}">'
+            f'<li><p name="a{i}" id="a{i}">確認 {i}-1</p></li>'
+            f'<li><p name="b{i}" id="b{i}">確認 {i}-2</p>'
+            f'<ol name="o{i}" id="o{i}"><li><p name="c{i}" id="c{i}">手順 {i}</p></li></ol></li>'
+            "</ul>"
+        )
+    return "".join(sections)
+
+
+def _best_time(content: str) -> float:
+    """Best conversion time of ROUNDS runs, in seconds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start_time = time.perf_counter()
+        html_to_markdown(content)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+class TestListConversionPerformance:
+    """Benchmark for converting articles with many lists."""
+
+    def test_many_lists_scale_linearly(self) -> None:
+        """Converting twice as many lists takes about twice as long.
+
+        Every list must be converted (no raw <ul>/<ol> left behind).
+        """
+        small = _checklist_article(400)
+        large = _checklist_article(1600)
+
+        result = html_to_markdown(large)
+        assert "<ul" not in result and "<ol" not in result
+        assert result.count("  1. 手順 ") == 1600
+
+        small_s = _best_time(small)
+        large_s = _best_time(large)
+
+        # 4x the lists: linear is ~4x, quadratic would be ~16x
+        assert large_s < small_s * 8, f"400 lists took {small_s:.4f}s, 1600 lists took {large_s:.4f}s"
+
+        print(
+            f"\n[PERF] html_to_markdown lists: 400 lists {small_s * 1000:.1f}ms, "
+            f"1600 lists {large_s * 1000:.1f}ms ({large_s / small_s:.1f}x)"
+        )
+
+
+class TestHtmlToMarkdownScaling:
+    """Benchmark for converting multi-megabyte note.com bodies."""
+
+    def test_large_bodies_scale_linearly(self) -> None:
+        """Converting an eight times larger body takes about eight times as long."""
+        # Example articles in note.com HTML (every element type the converter handles)
+        article = "".join(path.read_text(encoding="utf-8") for path in sorted(GOLDEN_DIR.glob("*.html")))
+        small = article * 20
+        large = article * 160
+        assert len(large) > 1_000_000
+
+        small_s = _best_time(small)
+        large_s = _best_time(large)
+
+        # 8x the size: linear is ~8x, quadratic would be ~64x
+        assert large_s < small_s * 16, f"{len(small)} chars took {small_s:.3f}s, {len(large)} chars took {large_s:.3f}s"
+
+        print(
+            f"\n[PERF] html_to_markdown: {len(small) // 1000}KB {small_s * 1000:.0f}ms, "
+            f"{len(large) // 1000}KB {large_s * 1000:.0f}ms ({large_s / small_s:.1f}x), "
+            f"{len(large) / large_s / 1_000_000:.1f}MB/s"
+        )
@@ -0,0 +1,161 @@
+"""Performance tests for Markdown to HTML conversion.
+
+Measures conversions per second on the example articles used by the
+markdown_to_html golden tests.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+ROUNDS = 200
+
+EXAMPLE_DIR = Path(__file__).parent.parent / "unit" / "golden" / "markdown_to_html"
+
+
+def _load_articles() -> list[str]:
+    """Load the example Markdown articles."""
+    return [path.read_text(encoding="utf-8") for path in sorted(EXAMPLE_DIR.glob("*.md"))]
+
+
+class TestMarkdownParserReusePerformance:
+    """Benchmark for reusing the configured MarkdownIt instance."""
+
+    def test_shared_parser_is_faster(self) -> None:
+        """Compare the shared parser with building a MarkdownIt per conversion.
+
+        Both approaches must produce identical HTML (with seeded element IDs).
+        """
+        from markdown_it import MarkdownIt
+
+        from note_mcp.api.element_ids import stable_element_ids
+        from note_mcp.utils.markdown_to_html import NoteHtmlRenderer, _render_note_html
+
+        def render_with_new_parser(content: str) -> str:
+            """Previous approach: build and configure a parser for every call."""
+            result: str = MarkdownIt(renderer_cls=NoteHtmlRenderer).enable("strikethrough").render(content)
+            return result
+
+        articles = _load_articles()
+        assert articles
+        for i, content in enumerate(articles):
+            with stable_element_ids(str(i)):
+                expected = render_with_new_parser(content)
+            with stable_element_ids(str(i)):
+                assert _render_note_html(content) == expected
+
+        conversions = ROUNDS * len(articles)
+
+        start_time = time.perf_counter()
+        for _ in range(ROUNDS):
+            for content in articles:
+                render_with_new_parser(content)
+        per_call_s = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for _ in range(ROUNDS):
+            for content in articles:
+                _render_note_html(content)
+        shared_s = time.perf_counter() - start_time
+
+        assert shared_s < per_call_s, f"shared parser took {shared_s:.3f}s, new parser per call took {per_call_s:.3f}s"
+
+        print(
+            f"\n[PERF] markdown render ({len(articles)} example articles x {ROUNDS}): "
+            f"shared parser {conversions / shared_s:.0f} conversions/s, "
+            f"new parser per call {conversions / per_call_s:.0f} conversions/s"
+        )
+
+    def test_markdown_to_html_throughput(self) -> None:
+        """Measure full markdown_to_html conversions per second."""
+        from note_mcp.utils.markdown_to_html import markdown_to_html
+
+        articles = _load_articles()
+        conversions = ROUNDS * len(articles)
+
+        start_time = time.perf_counter()
+        for _ in range(ROUNDS):
+            for content in articles:
+                markdown_to_html(content, incremental=False)
+        elapsed_s = time.perf_counter() - start_time
+
+        assert elapsed_s < 30, f"{conversions} conversions took {elapsed_s:.2f}s"
+
+        print(f"\n[PERF] markdown_to_html (full conversion): {conversions / elapsed_s:.0f} conversions/s")
+
+
+def _code_heavy_article(spans: int) -> str:
+    """Build an article with the given number of inline code spans (plus fences and notations)."""
+    lines = ["[TOC]", "", "^5243", "", "->centered<-", ""]
+    for i in range(spans):
+        lines.append(f"Call `func_{i}()` with `arg_{i}` and check `$RESULT`.")
+        if i % 20 == 0:
+            lines.extend(["", "```python", f"value_{i} = compute()  # ->not aligned", "```", ""])
+    return "\n".join(lines) + "\n"
+
+
+class TestCodeProtectionPerformance:
+    """Benchmark for protecting code blocks once during Markdown pre-processing."""
+
+    def test_shared_protection_is_faster(self) -> None:
+        """Compare one shared protection pass with protecting per transformation.
+
+        Both approaches must produce identical pre-processed Markdown.
+        """
+        import re
+
+        from note_mcp.utils.markdown_to_html import (
+            _preprocess_markdown,
+            _replace_alignment_markers,
+            _replace_stock_notation,
+            _replace_toc_markers,
+        )
+
+        def protect_and_apply(content: str, prefix: str, transform: Callable[[str], str]) -> str:
+            """Previous approach: two protection passes and one str.replace per block."""
+            blocks: list[tuple[str, str]] = []
+
+            def protect(match: re.Match[str]) -> str:
+                placeholder = f"__{prefix}_{len(blocks)}__"
+                blocks.append((placeholder, match.group(0)))
+                return placeholder
+
+            protected = re.sub(r"```[\s\S]*?```", protect, content)
+            protected = re.sub(r"`[^`]+`", protect, protected)
+            result = transform(protected)
+            for placeholder, original in blocks:
+                result = result.replace(placeholder, original)
+            return result
+
+        def preprocess_per_transform(content: str) -> str:
+            content = protect_and_apply(content, "TOC", _replace_toc_markers)
+            content = protect_and_apply(content, "STOCK", _replace_stock_notation)
+            return protect_and_apply(content, "ALIGN", _replace_alignment_markers)
+
+        content = _code_heavy_article(500)
+        assert content.count("`") > 1000
+        assert _preprocess_markdown(content) == preprocess_per_transform(content)
+
+        rounds = 20
+
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            preprocess_per_transform(content)
+        per_transform_s = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            _preprocess_markdown(content)
+        shared_s = time.perf_counter() - start_time
+
+        assert shared_s < per_transform_s, (
+            f"shared protection took {shared_s:.3f}s, protection per transformation took {per_transform_s:.3f}s"
+        )
+
+        print(
+            f"\n[PERF] markdown pre-processing (1500 code spans x {rounds}): "
+            f"shared protection {shared_s * 1000 / rounds:.1f}ms/article, "
+            f"protection per transformation {per_transform_s * 1000 / rounds:.1f}ms/article"
+        )
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
+from collections.abc import Generator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from note_mcp.api.client import NoteAPIClient
+from note_mcp.api.client import (
+    MAX_RETRIES,
+    NoteAPIClient,
+    _compute_retry_delay,
+    _is_retryable_request,
+    _parse_retry_after,
+    close_pooled_clients,
+)
+from note_mcp.api.rate_limit import TokenBucket, get_rate_limiter
 from note_mcp.models import ErrorCode, NoteAPIError, Session
 
 if TYPE_CHECKING:
@@ -27,6 +39,19 @@ def create_mock_session() -> Session:
     )
 
 
+@pytest.fixture
+def fast_retries() -> Generator[None]:
+    """Skip retry backoff delays and use a generous rate limiter."""
+    with (
+        patch("note_mcp.api.client._compute_retry_delay", return_value=0.0),
+        patch(
+            "note_mcp.api.client.get_rate_limiter",
+            side_effect=lambda _account: TokenBucket(capacity=100, refill_rate=1000.0),
+        ),
+    ):
+        yield
+
+
 class TestNoteAPIClient:
     """Tests for NoteAPIClient class."""
 
@@ -152,7 +177,7 @@ class TestNoteAPIClientErrors:
         assert exc_info.value.code == ErrorCode.ARTICLE_NOT_FOUND
 
     @pytest.mark.asyncio
-    async def test_429_error_raises_rate_limited(self) -> None:
+    async def test_429_error_raises_rate_limited(self, fast_retries: None) -> None:
         """Test that 429 response raises RATE_LIMITED error."""
         session = create_mock_session()
         client = NoteAPIClient(session)
@@ -170,7 +195,7 @@ class TestNoteAPIClientErrors:
         assert exc_info.value.code == ErrorCode.RATE_LIMITED
 
     @pytest.mark.asyncio
-    async def test_5xx_error_raises_api_error(self) -> None:
+    async def test_5xx_error_raises_api_error(self, fast_retries: None) -> None:
         """Test that 5xx responses raise API_ERROR."""
         session = create_mock_session()
         client = NoteAPIClient(session)
@@ -192,8 +217,8 @@ class TestNoteAPIClientRateLimiting:
     """Tests for rate limiting."""
 
     @pytest.mark.asyncio
-    async def test_rate_limit_tracked(self) -> None:
-        """Test that requests are tracked for rate limiting."""
+    async def test_request_consumes_token(self) -> None:
+        """Test that each request consumes a token from the account's bucket."""
         session = create_mock_session()
         client = NoteAPIClient(session)
 
@@ -203,33 +228,320 @@ class TestNoteAPIClientRateLimiting:
 
         with patch.object(httpx.AsyncClient, "get", return_value=mock_response):
             async with client:
-                # Make a request
+                limiter = client._rate_limiter
+                assert limiter is not None
+                before = limiter.tokens
+
                 await client.get("/test-endpoint")
 
-                # Check that request was tracked
-                assert len(client._request_times) == 1
+                assert limiter.tokens < before
 
     @pytest.mark.asyncio
-    async def test_old_requests_cleaned_up(self) -> None:
-        """Test that old request timestamps are cleaned up."""
+    async def test_limiter_shared_across_clients(self) -> None:
+        """Test that clients of the same account share one limiter."""
         session = create_mock_session()
-        client = NoteAPIClient(session)
 
-        # Add some old timestamps (more than 1 minute ago)
-        old_time = time.time() - 120  # 2 minutes ago
-        client._request_times = [old_time, old_time + 1, old_time + 2]
+        async with NoteAPIClient(session) as first:
+            first_limiter = first._rate_limiter
+        async with NoteAPIClient(session) as second:
+            second_limiter = second._rate_limiter
+
+        assert first_limiter is not None
+        assert first_limiter is second_limiter
+
+    @pytest.mark.asyncio
+    async def test_429_slows_down_limiter(self) -> None:
+        """Test that a 429 response reduces the limiter's refill rate."""
+        session = create_mock_session()
+        client = NoteAPIClient(session)
 
         mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {}}
+        mock_response.status_code = 429
+        mock_response.is_success = False
+        mock_response.headers = httpx.Headers()
+        mock_response.text = "Too Many Requests"
 
         with patch.object(httpx.AsyncClient, "get", return_value=mock_response):
             async with client:
+                limiter = client._rate_limiter
+                assert limiter is not None
+                initial_rate = limiter.refill_rate
+
+                with pytest.raises(NoteAPIError):
+                    await client.get("/test-endpoint", retry=False)
+
+                assert limiter.refill_rate < initial_rate
+
+
+class TestNoteAPIClientRetry:
+    """Tests for the retry/backoff layer."""
+
+    @staticmethod
+    def _response(status_code: int, headers: dict[str, str] | None = None) -> httpx.Response:
+        request = httpx.Request("GET", "https://note.com/api/test-endpoint")
+        if status_code < 400:
+            return httpx.Response(status_code, json={"data": {"ok": True}}, request=request)
+        return httpx.Response(status_code, text="error", headers=headers, request=request)
+
+    @pytest.mark.asyncio
+    async def test_get_retries_transient_error(self, fast_retries: None) -> None:
+        """Test that a GET succeeds after a transient 503."""
+        session = create_mock_session()
+        responses = [self._response(503), self._response(200)]
+
+        with patch.object(httpx.AsyncClient, "get", side_effect=responses) as mock_get:
+            async with NoteAPIClient(session) as client:
+                result = await client.get("/test-endpoint")
+
+        assert result == {"data": {"ok": True}}
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted_raises(self, fast_retries: None) -> None:
+        """Test that the error is raised after MAX_RETRIES retries."""
+        session = create_mock_session()
+
+        with patch.object(httpx.AsyncClient, "get", return_value=self._response(502)) as mock_get:
+            async with NoteAPIClient(session) as client:
+                with pytest.raises(NoteAPIError) as exc_info:
+                    await client.get("/test-endpoint")
+
+        assert exc_info.value.code == ErrorCode.API_ERROR
+        assert mock_get.call_count == MAX_RETRIES + 1
+
+    @pytest.mark.asyncio
+    async def test_non_transient_error_not_retried(self, fast_retries: None) -> None:
+        """Test that 500 and 4xx errors are not retried."""
+        session = create_mock_session()
+
+        with patch.object(httpx.AsyncClient, "get", return_value=self._response(500)) as mock_get:
+            async with NoteAPIClient(session) as client:
+                with pytest.raises(NoteAPIError):
+                    await client.get("/test-endpoint")
+
+        assert mock_get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried_by_default(self, fast_retries: None) -> None:
+        """Test that non-idempotent POST requests are not retried."""
+        session = create_mock_session()
+
+        with patch.object(httpx.AsyncClient, "post", return_value=self._response(503)) as mock_post:
+            async with NoteAPIClient(session) as client:
+                with pytest.raises(NoteAPIError):
+                    await client.post("/v1/text_notes", json={"name": "test"})
+
+        assert mock_post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_draft_save_post_not_retried_without_opt_in(self, fast_retries: None) -> None:
+        """Test that draft_save is only retried when the caller opts in."""
+        session = create_mock_session()
+
+        with patch.object(httpx.AsyncClient, "post", return_value=self._response(503)) as mock_post:
+            async with NoteAPIClient(session) as client:
+                with pytest.raises(NoteAPIError):
+                    await client.post("/v1/text_notes/draft_save?id=123&is_temp_saved=true", json={"name": "test"})
+
+        assert mock_post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_post_retry_opt_in(self, fast_retries: None) -> None:
+        """Test that callers can opt in to retries for POST."""
+        session = create_mock_session()
+        responses = [self._response(504), self._response(200)]
+
+        with patch.object(httpx.AsyncClient, "post", side_effect=responses) as mock_post:
+            async with NoteAPIClient(session) as client:
+                await client.post("/v1/embed", json={"url": "x"}, retry=True)
+
+        assert mock_post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_transport_error_retried(self, fast_retries: None) -> None:
+        """Test that connection errors are retried for idempotent requests."""
+        session = create_mock_session()
+        responses = [httpx.ConnectError("connection reset"), self._response(200)]
+
+        with patch.object(httpx.AsyncClient, "get", side_effect=responses) as mock_get:
+            async with NoteAPIClient(session) as client:
+                result = await client.get("/test-endpoint")
+
+        assert result == {"data": {"ok": True}}
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honored(self) -> None:
+        """Test that Retry-After sets the delay before the next attempt."""
+        session = create_mock_session()
+        responses = [self._response(429, {"Retry-After": "7"}), self._response(200)]
+
+        with (
+            patch.object(httpx.AsyncClient, "get", side_effect=responses),
+            patch(
+                "note_mcp.api.client.get_rate_limiter",
+                side_effect=lambda _account: TokenBucket(capacity=100, refill_rate=1000.0),
+            ),
+            patch("note_mcp.api.client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            async with NoteAPIClient(session) as client:
+                # Avoid the limiter's own Retry-After block in this test
+                assert client._rate_limiter is not None
+                client._rate_limiter.on_rate_limited = MagicMock()  # type: ignore[method-assign]
                 await client.get("/test-endpoint")
 
-                # Old requests should be cleaned up
-                # Only the new request should remain
-                assert len(client._request_times) == 1
+        assert mock_sleep.await_args_list[0].args[0] == pytest.approx(7.0)
+
+    def test_is_retryable_request(self) -> None:
+        """Test the default per-method retry policy."""
+        assert _is_retryable_request("GET")
+        assert _is_retryable_request("put")
+        assert _is_retryable_request("DELETE")
+        assert not _is_retryable_request("POST")
+
+    def test_compute_retry_delay_bounds(self) -> None:
+        """Test that backoff is jittered within the exponential bound."""
+        for attempt in range(6):
+            delay = _compute_retry_delay(attempt)
+            assert 0 <= delay <= min(8.0, 0.5 * 2**attempt)
+
+        assert _compute_retry_delay(0, retry_after=5.0) >= 5.0
+        assert _compute_retry_delay(0, retry_after=3600.0) == pytest.approx(60.0)
+
+
+class TestTokenBucket:
+    """Tests for the async token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_does_not_wait(self) -> None:
+        """Test that requests within the burst size are granted immediately."""
+        bucket = TokenBucket(capacity=5, refill_rate=1.0)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+
+        assert time.monotonic() - start < 0.1
+
+    @pytest.mark.asyncio
+    async def test_waits_when_exhausted(self) -> None:
+        """Test that an empty bucket makes callers wait for a refill."""
+        bucket = TokenBucket(capacity=1, refill_rate=20.0)
+
+        await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_order(self) -> None:
+        """Test that queued callers acquire tokens in arrival order."""
+        bucket = TokenBucket(capacity=1, refill_rate=50.0)
+        order: list[int] = []
+
+        async def worker(index: int) -> None:
+            await bucket.acquire()
+            order.append(index)
+
+        await asyncio.gather(*(worker(i) for i in range(5)))
+
+        assert order == [0, 1, 2, 3, 4]
+
+    def test_rate_limited_backs_off_and_recovers(self) -> None:
+        """Test that 429 halves the refill rate and successes restore it."""
+        bucket = TokenBucket(capacity=5, refill_rate=2.0, min_refill_rate=0.5)
+
+        bucket.on_rate_limited()
+        assert bucket.refill_rate == pytest.approx(1.0)
+
+        for _ in range(3):
+            bucket.on_rate_limited()
+        assert bucket.refill_rate == pytest.approx(0.5)
+
+        for _ in range(100):
+            bucket.on_success()
+        assert bucket.refill_rate == pytest.approx(2.0)
+
+    @pytest.mark.asyncio
+    async def test_retry_after_blocks_acquire(self) -> None:
+        """Test that Retry-After from a 429 delays the next acquisition."""
+        bucket = TokenBucket(capacity=5, refill_rate=100.0)
+
+        bucket.on_rate_limited(retry_after=0.1)
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+    def test_invalid_configuration_raises(self) -> None:
+        """Test that non-positive settings are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(capacity=0)
+        with pytest.raises(ValueError):
+            TokenBucket(refill_rate=0)
+
+
+class TestGetRateLimiter:
+    """Tests for the per-account limiter configuration."""
+
+    @pytest.mark.asyncio
+    async def test_default_is_ten_requests_per_minute(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the default limiter enforces the documented safe rate."""
+        monkeypatch.delenv("NOTE_MCP_RATE_LIMIT_BURST", raising=False)
+        monkeypatch.delenv("NOTE_MCP_RATE_LIMIT_PER_MINUTE", raising=False)
+
+        limiter = get_rate_limiter("default-rate-account")
+
+        assert limiter.capacity == 10
+        assert limiter.max_refill_rate * 60 == pytest.approx(10.0)
+
+    @pytest.mark.asyncio
+    async def test_configured_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that burst and sustained rate are read from environment variables."""
+        monkeypatch.setenv("NOTE_MCP_RATE_LIMIT_BURST", "3")
+        monkeypatch.setenv("NOTE_MCP_RATE_LIMIT_PER_MINUTE", "30")
+
+        limiter = get_rate_limiter("configured-rate-account")
+
+        assert limiter.capacity == 3
+        assert limiter.max_refill_rate * 60 == pytest.approx(30.0)
+        assert limiter.min_refill_rate < limiter.max_refill_rate
+
+    @pytest.mark.asyncio
+    async def test_invalid_environment_uses_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that invalid values fall back to the defaults."""
+        monkeypatch.setenv("NOTE_MCP_RATE_LIMIT_BURST", "many")
+        monkeypatch.setenv("NOTE_MCP_RATE_LIMIT_PER_MINUTE", "-5")
+
+        limiter = get_rate_limiter("invalid-rate-account")
+
+        assert limiter.capacity == 10
+        assert limiter.max_refill_rate * 60 == pytest.approx(10.0)
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_delay_seconds(self) -> None:
+        """Test numeric Retry-After values."""
+        response = httpx.Response(429, headers={"Retry-After": "3"})
+        assert _parse_retry_after(response) == 3.0
+
+    def test_http_date(self) -> None:
+        """Test HTTP-date Retry-After values."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+        response = httpx.Response(429, headers={"Retry-After": format_datetime(retry_at, usegmt=True)})
+
+        delay = _parse_retry_after(response)
+
+        assert delay is not None
+        assert 25 <= delay <= 30
+
+    def test_missing_or_invalid(self) -> None:
+        """Test that missing or malformed headers return None."""
+        assert _parse_retry_after(httpx.Response(429)) is None
+        assert _parse_retry_after(httpx.Response(429, headers={"Retry-After": "soon"})) is None
 
 
 class TestNoteAPIClientNoSession:
@@ -249,3 +561,74 @@ class TestNoteAPIClientNoSession:
                 result = await client.get("/public-endpoint")
 
         assert result == {"data": {"public": True}}
+
+
+class TestNoteAPIClientPooling:
+    """Tests for the shared connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_clients_of_same_account_share_http_client(self) -> None:
+        """Test that sequential contexts reuse the same pooled httpx client."""
+        session = create_mock_session()
+
+        async with NoteAPIClient(session) as first:
+            first_http = first._client
+        async with NoteAPIClient(session) as second:
+            second_http = second._client
+
+        assert first_http is not None
+        assert first_http is second_http
+        assert not first_http.is_closed
+
+        await close_pooled_clients()
+
+    @pytest.mark.asyncio
+    async def test_different_accounts_use_different_pools(self) -> None:
+        """Test that each account gets its own pooled httpx client."""
+        session = create_mock_session()
+        other = session.model_copy(update={"user_id": "other_user"})
+
+        async with NoteAPIClient(session) as first:
+            first_http = first._client
+        async with NoteAPIClient(other) as second:
+            second_http = second._client
+
+        assert first_http is not second_http
+
+        await close_pooled_clients()
+
+    @pytest.mark.asyncio
+    async def test_exit_releases_without_closing(self) -> None:
+        """Test that leaving the context does not close pooled connections."""
+        session = create_mock_session()
+        client = NoteAPIClient(session)
+
+        async with client:
+            http_client = client._client
+
+        assert client._client is None
+        assert http_client is not None
+        assert not http_client.is_closed
+
+        await close_pooled_clients()
+
+    @pytest.mark.asyncio
+    async def test_close_pooled_clients_closes_and_recreates(self) -> None:
+        """Test that closing the pool closes clients and new contexts get a fresh one."""
+        session = create_mock_session()
+
+        async with NoteAPIClient(session) as first:
+            first_http = first._client
+
+        await close_pooled_clients()
+        assert first_http is not None
+        assert first_http.is_closed
+
+        async with NoteAPIClient(session) as second:
+            second_http = second._client
+
+        assert second_http is not first_http
+        assert second_http is not None
+        assert not second_http.is_closed
+
+        await close_pooled_clients()
@@ -0,0 +1,346 @@
+"""Unit tests for the local SQLite article mirror."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from note_mcp.api.articles import get_article, list_articles, sync_article_mirror, update_article
+from note_mcp.api.mirror import MIRROR_ENV_VAR, ArticleMirror, close_article_mirror, get_article_mirror
+from note_mcp.models import Article, ArticleInput, ArticleStatus, ErrorCode, NoteAPIError, Session
+from note_mcp.storage import DATA_DIR_ENV_VAR
+
+
+def create_mock_session() -> Session:
+    """Create a mock session for testing."""
+    return Session(
+        cookies={"note_gql_auth_token": "token123", "_note_session_v5": "session456"},
+        user_id="user123",
+        username="testuser",
+        expires_at=int(time.time()) + 3600,
+        created_at=int(time.time()),
+    )
+
+
+def make_article(key: str, *, article_id: str = "1", updated_at: str = "2025-01-01T00:00:00+09:00") -> Article:
+    """Create an Article with an HTML body."""
+    return Article(
+        id=article_id,
+        key=key,
+        title=f"Title {key}",
+        body=f'<p name="p1" id="p1">Body {key}</p>',
+        status=ArticleStatus.DRAFT,
+        tags=["python", "テスト"],
+        updated_at=updated_at,
+    )
+
+
+@pytest.fixture
+def mirror() -> Generator[ArticleMirror]:
+    """Enable an in-memory article mirror for the test."""
+    article_mirror = ArticleMirror(account="user123")
+    with patch("note_mcp.api.mirror._article_mirror", article_mirror):
+        yield article_mirror
+    article_mirror.close()
+
+
+class FakeNoteApi:
+    """Serves note_list and /v3/notes responses from a dict of notes."""
+
+    def __init__(self, notes: list[dict[str, Any]]) -> None:
+        self.notes = notes
+        self.fetched: list[str] = []
+
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        if path == "/v2/note_list/contents":
+            summaries = [{k: v for k, v in note.items() if k != "body"} for note in self.notes]
+            return {"data": {"notes": summaries, "totalCount": len(summaries), "isLastPage": True}}
+        key = path.rsplit("/", 1)[1]
+        self.fetched.append(key)
+        return {"data": next(note for note in self.notes if note["key"] == key)}
+
+
+def api_note(key: str, note_id: int, updated_at: str, status: str = "draft") -> dict[str, Any]:
+    """Build a raw note as returned by the API."""
+    return {
+        "id": note_id,
+        "key": key,
+        "name": f"Title {key}",
+        "status": status,
+        "body": f"<p>Body {key}</p>",
+        "updated_at": updated_at,
+    }
+
+
+def patch_client(api: FakeNoteApi) -> Any:
+    """Patch NoteAPIClient in api.articles to use the fake API."""
+    patcher = patch("note_mcp.api.articles.NoteAPIClient")
+    mock_client_class = patcher.start()
+    mock_client = AsyncMock()
+    mock_client_class.return_value = mock_client
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    mock_client.get = AsyncMock(side_effect=api.get)
+    return patcher
+
+
+class TestArticleMirror:
+    """Tests for ArticleMirror storage."""
+
+    def test_store_and_get_by_key_or_id(self) -> None:
+        """Stored articles are returned with Markdown or raw HTML bodies."""
+        store = ArticleMirror()
+        article = make_article("naaa", article_id="123")
+
+        store.store(article, "Body naaa")
+
+        assert store.get_article("naaa") == article.model_copy(update={"body": "Body naaa"})
+        assert store.get_article("123") == store.get_article("naaa")
+        raw = store.get_raw_article("naaa")
+        assert raw is not None
+        assert raw.body == article.body
+        assert store.updated_at("naaa") == "2025-01-01T00:00:00+09:00"
+        assert store.get_article("nmissing") is None
+
+    def test_persists_to_disk(self, tmp_path: Path) -> None:
+        """A database file is reopened with its articles."""
+        path = tmp_path / "mirror" / "articles.db"
+        first = ArticleMirror(path)
+        first.store(make_article("naaa"), "Body naaa")
+        first.close()
+
+        reopened = ArticleMirror(path)
+
+        assert len(reopened) == 1
+        assert reopened.keys() == {"naaa"}
+        reopened.close()
+
+    def test_complete_listing_orders_and_prunes(self) -> None:
+        """complete_listing() keeps listed articles in order and drops the rest."""
+        store = ArticleMirror()
+        for i, key in enumerate(["naaa", "nbbb", "nccc"]):
+            store.store(make_article(key, article_id=str(i + 1)), f"Body {key}")
+
+        store.complete_listing(["nccc", "naaa"])
+
+        assert store.has_complete_listing()
+        result = store.list_articles()
+        assert [a.key for a in result.articles] == ["nccc", "naaa"]
+        assert result.total == 2
+        assert result.has_more is False
+
+    def test_list_articles_pages_and_filters(self) -> None:
+        """Local listing follows the API page size and status filter."""
+        store = ArticleMirror()
+        keys = [f"n{i:03d}" for i in range(12)]
+        for i, key in enumerate(keys):
+            article = make_article(key, article_id=str(i + 1))
+            if i == 0:
+                article = article.model_copy(update={"status": ArticleStatus.PUBLISHED})
+            store.store(article, "")
+        store.complete_listing(keys)
+
+        first = store.list_articles(page=1, limit=3)
+        second = store.list_articles(page=2)
+        published = store.list_articles(ArticleStatus.PUBLISHED)
+
+        assert [a.key for a in first.articles] == keys[:3]
+        assert first.has_more is True
+        assert [a.key for a in second.articles] == keys[10:]
+        assert second.has_more is False
+        assert [a.key for a in published.articles] == ["n000"]
+
+    def test_forget_marks_listing_stale(self) -> None:
+        """Forgetting an article removes it and disables local listing."""
+        store = ArticleMirror()
+        store.store(make_article("naaa", article_id="123"), "")
+        store.complete_listing(["naaa"])
+
+        store.forget("123")
+
+        assert store.get_article("naaa") is None
+        assert not store.has_complete_listing()
+
+    def test_discards_articles_of_another_account(self, tmp_path: Path) -> None:
+        """Reopening a database for a different account starts empty."""
+        path = tmp_path / "articles.db"
+        first = ArticleMirror(path, "user123")
+        first.store(make_article("naaa"), "Body naaa")
+        first.complete_listing(["naaa"])
+        first.close()
+
+        other = ArticleMirror(path, "user456")
+
+        assert len(other) == 0
+        assert not other.has_complete_listing()
+        other.close()
+
+    def test_disabled_by_default(self) -> None:
+        """Without NOTE_MCP_ARTICLE_MIRROR=1 there is no mirror."""
+        assert get_article_mirror("user123") is None
+
+
+class TestGetArticleMirror:
+    """Tests for the per-account process-wide mirror."""
+
+    def test_one_database_per_account(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each account gets its own file, and switching accounts closes the previous mirror."""
+        monkeypatch.setenv(MIRROR_ENV_VAR, "1")
+        monkeypatch.setenv(DATA_DIR_ENV_VAR, str(tmp_path))
+
+        first = get_article_mirror("user123")
+        assert first is not None
+        first.store(make_article("naaa"), "Body naaa")
+        second = get_article_mirror("user456")
+
+        assert second is not None
+        assert second.path == tmp_path / "articles-user456.db"
+        assert second.get_article("naaa") is None
+        reopened = get_article_mirror("user123")
+        assert reopened is not None
+        assert reopened.path == tmp_path / "articles-user123.db"
+        assert reopened.get_article("naaa") is not None
+        close_article_mirror()
+
+    def test_close_article_mirror(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Closing (e.g., on logout) drops the open mirror."""
+        monkeypatch.setenv(MIRROR_ENV_VAR, "1")
+        monkeypatch.setenv(DATA_DIR_ENV_VAR, str(tmp_path))
+        mirror = get_article_mirror("user123")
+
+        close_article_mirror()
+
+        assert get_article_mirror("user123") is not mirror
+        close_article_mirror()
+
+
+class TestSyncArticleMirror:
+    """Tests for sync_article_mirror."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_articles_are_refetched(self, mirror: ArticleMirror) -> None:
+        """A second sync only fetches articles whose updated_at changed."""
+        api = FakeNoteApi([api_note("naaa", 1, "t1"), api_note("nbbb", 2, "t1")])
+        patcher = patch_client(api)
+        try:
+            first = await sync_article_mirror(create_mock_session())
+            api.notes[1] = api_note("nbbb", 2, "t2")
+            api.fetched.clear()
+            second = await sync_article_mirror(create_mock_session())
+        finally:
+            patcher.stop()
+
+        assert (first.listed, first.fetched, first.unchanged) == (2, 2, 0)
+        assert (second.listed, second.fetched, second.unchanged) == (2, 1, 1)
+        assert api.fetched == ["nbbb"]
+        assert mirror.updated_at("nbbb") == "t2"
+        mirrored = mirror.get_article("naaa")
+        assert mirrored is not None
+        assert mirrored.body == "Body naaa"
+
+    @pytest.mark.asyncio
+    async def test_removed_articles_are_pruned(self, mirror: ArticleMirror) -> None:
+        """Articles missing from the note list are removed from the mirror."""
+        api = FakeNoteApi([api_note("naaa", 1, "t1"), api_note("nbbb", 2, "t1")])
+        patcher = patch_client(api)
+        try:
+            await sync_article_mirror(create_mock_session())
+            del api.notes[0]
+            result = await sync_article_mirror(create_mock_session())
+        finally:
+            patcher.stop()
+
+        assert result.removed == 1
+        assert mirror.keys() == {"nbbb"}
+
+    @pytest.mark.asyncio
+    async def test_reads_are_served_locally_after_sync(self, mirror: ArticleMirror) -> None:
+        """get_article and list_articles do not call the API after a sync."""
+        api = FakeNoteApi([api_note("naaa", 1, "t1", status="published"), api_note("nbbb", 2, "t1")])
+        patcher = patch_client(api)
+        try:
+            await sync_article_mirror(create_mock_session())
+        finally:
+            patcher.stop()
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            article = await get_article(create_mock_session(), "nbbb")
+            listing = await list_articles(create_mock_session(), status=ArticleStatus.DRAFT)
+
+        mock_client_class.assert_not_called()
+        assert article.body == "Body nbbb"
+        assert [a.key for a in listing.articles] == ["nbbb"]
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_mirrored_article(self, mirror: ArticleMirror) -> None:
+        """Updating an article drops it so the next read goes to the API."""
+        mirror.store(make_article("naaa", article_id="123"), "Body naaa")
+        mirror.complete_listing(["naaa"])
+
+        with (
+            patch("note_mcp.api.articles._resolve_numeric_note_id", AsyncMock(return_value="123")),
+            patch("note_mcp.api.articles._execute_post", AsyncMock()),
+        ):
+            await update_article(create_mock_session(), "naaa", ArticleInput(title="New", body="New body"))
+
+        assert mirror.get_article("naaa") is None
+        assert not mirror.has_complete_listing()
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_keeps_listing_stale(self, mirror: ArticleMirror) -> None:
+        """A failed article fetch is reported and the list stays remote."""
+        api = FakeNoteApi([api_note("naaa", 1, "t1")])
+        patcher = patch_client(api)
+        try:
+            with patch(
+                "note_mcp.api.articles.get_article_via_api",
+                AsyncMock(side_effect=NoteAPIError(code=ErrorCode.API_ERROR, message="boom")),
+            ):
+                result = await sync_article_mirror(create_mock_session())
+        finally:
+            patcher.stop()
+
+        assert result.failed_keys == ["naaa"]
+        assert result.fetched == 0
+        assert not mirror.has_complete_listing()
+
+    @pytest.mark.asyncio
+    async def test_listing_failure_cancels_started_fetches(self, mirror: ArticleMirror) -> None:
+        """Fetches started before the listing fails are cancelled, not leaked."""
+        fetch_started = asyncio.Event()
+        fetch_cancelled = asyncio.Event()
+
+        async def slow_fetch(session: Session, article_key: str) -> None:
+            fetch_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                fetch_cancelled.set()
+                raise
+
+        async def failing_listing(session: Session) -> Any:
+            yield make_article("naaa")
+            await fetch_started.wait()
+            raise NoteAPIError(code=ErrorCode.API_ERROR, message="listing failed")
+
+        with (
+            patch("note_mcp.api.articles.iter_articles", failing_listing),
+            patch("note_mcp.api.articles.get_article_via_api", slow_fetch),
+            pytest.raises(NoteAPIError, match="listing failed"),
+        ):
+            await sync_article_mirror(create_mock_session())
+
+        assert fetch_cancelled.is_set()
+        assert not mirror.has_complete_listing()
+
+    @pytest.mark.asyncio
+    async def test_disabled_mirror_raises(self) -> None:
+        """Syncing without an enabled mirror is an error."""
+        with pytest.raises(NoteAPIError, match="NOTE_MCP_ARTICLE_MIRROR"):
+            await sync_article_mirror(create_mock_session())
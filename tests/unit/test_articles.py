@@ -1,5 +1,6 @@
 """Unit tests for article operations."""
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -13,9 +14,11 @@ from note_mcp.api.articles import (
     _execute_post,
     _parse_article_response,
     _parse_create_response,
+    create_article_entry,
     delete_all_drafts,
     get_article_raw_html,
     get_article_via_api,
+    iter_articles,
 )
 from note_mcp.models import (
     Article,
@@ -433,12 +436,14 @@ class TestExecutePost:
                 "/v1/text_notes/draft_save?id=123",
                 parser,
                 payload={"name": "Test", "body": "<p>Content</p>"},
+                retry=True,
             )
 
             assert result is True
             mock_client.post.assert_called_once_with(
                 "/v1/text_notes/draft_save?id=123",
                 json={"name": "Test", "body": "<p>Content</p>"},
+                retry=True,
             )
 
     @pytest.mark.asyncio
@@ -463,7 +468,7 @@ class TestExecutePost:
             )
 
             assert result == "published"
-            mock_client.post.assert_called_once_with("/v3/notes/n123abc/publish", json=None)
+            mock_client.post.assert_called_once_with("/v3/notes/n123abc/publish", json=None, retry=None)
 
 
 class TestExecuteDelete:
@@ -652,6 +657,44 @@ class TestParseCreateResponse:
         assert exc_info.value.code == ErrorCode.API_ERROR
 
 
+class TestCreateArticleEntry:
+    """Tests for create_article_entry function."""
+
+    @pytest.mark.asyncio
+    async def test_posts_entry_without_body(self) -> None:
+        """create_article_entry should only POST /v1/text_notes, without body."""
+        import time
+
+        session = Session(
+            cookies={"note_gql_auth_token": "token123", "_note_session_v5": "session456"},
+            user_id="user123",
+            username="testuser",
+            expires_at=int(time.time()) + 3600,
+            created_at=int(time.time()),
+        )
+        article_input = ArticleInput(title="Title", body="Body", tags=["tag"])
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.post = AsyncMock(
+                return_value={"data": {"id": 123456789, "key": "n1234567890ab", "name": "Title", "status": ""}}
+            )
+
+            article = await create_article_entry(session, article_input)
+
+        mock_client.post.assert_called_once()
+        endpoint = mock_client.post.call_args[0][0]
+        payload = mock_client.post.call_args[1]["json"]
+        assert endpoint == "/v1/text_notes"
+        assert "body" not in payload
+        assert article.id == "123456789"
+        assert article.key == "n1234567890ab"
+        assert article.status == ArticleStatus.DRAFT
+
+
 class TestDeleteAllDraftsArticle6Compliance:
     """Tests for delete_all_drafts Article 6 (Data Accuracy Mandate) compliance.
 
@@ -760,3 +803,141 @@ class TestDeleteAllDraftsArticle6Compliance:
             assert isinstance(result, BulkDeletePreview)
             assert result.articles[0].title == "Has Title"
             assert result.articles[1].title == ""
+
+
+def _note_list_page(page: int, *, size: int = 2, is_last_page: bool = False) -> dict[str, Any]:
+    """Build a note_list response page with `size` draft notes."""
+    notes = [
+        {"id": page * 100 + i, "key": f"n{page:03d}{i:09d}", "name": f"記事{page}-{i}", "status": "draft"}
+        for i in range(size)
+    ]
+    return {"data": {"notes": notes, "totalCount": 99, "isLastPage": is_last_page}}
+
+
+class TestIterArticles:
+    """Tests for the iter_articles paginator."""
+
+    @pytest.fixture
+    def mock_session(self) -> Session:
+        """Create a mock session for testing."""
+        return Session(
+            cookies={"note_gql_auth_token": "test_token", "XSRF-TOKEN": "test_xsrf"},
+            user_id="test_user",
+            username="testuser",
+            created_at=1700000000,
+        )
+
+    @pytest.mark.asyncio
+    async def test_yields_articles_until_last_page(self, mock_session: Session) -> None:
+        """Articles of every page are yielded in order; isLastPage stops paging."""
+        pages = {1: _note_list_page(1), 2: _note_list_page(2, is_last_page=True)}
+
+        async def get(path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+            assert params is not None
+            return pages[params["page"]]
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(side_effect=get)
+
+            articles = [article async for article in iter_articles(mock_session, ArticleStatus.DRAFT)]
+
+        assert [a.id for a in articles] == ["100", "101", "200", "201"]
+        assert all(isinstance(a, Article) for a in articles)
+        assert mock_client.get.call_count == 2
+        mock_client.get.assert_any_call("/v2/note_list/contents", params={"page": 2, "publish_status": "draft"})
+
+    @pytest.mark.asyncio
+    async def test_next_page_is_prefetched(self, mock_session: Session) -> None:
+        """The next page is requested before the caller finishes the current one."""
+        requested: list[int] = []
+
+        async def get(path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+            assert params is not None
+            requested.append(params["page"])
+            return _note_list_page(params["page"], is_last_page=params["page"] == 3)
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(side_effect=get)
+
+            seen_while_on_first_page: list[int] = []
+            async for article in iter_articles(mock_session):
+                if article.id == "100":
+                    # Let the prefetch task run while "processing" the first article
+                    await asyncio.sleep(0)
+                    seen_while_on_first_page = list(requested)
+
+        assert seen_while_on_first_page == [1, 2]
+        assert requested == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_prefetch(self, mock_session: Session) -> None:
+        """Stopping early does not wait for or leak the prefetched page."""
+        release = asyncio.Event()
+
+        async def get(path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+            assert params is not None
+            if params["page"] > 1:
+                await release.wait()
+            return _note_list_page(params["page"])
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(side_effect=get)
+
+            iterator = iter_articles(mock_session)
+            first = await anext(iterator)
+            await iterator.aclose()
+
+        assert first.id == "100"
+        mock_client.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_max_pages_limits_fetching(self, mock_session: Session) -> None:
+        """No page beyond max_pages is requested."""
+
+        async def get(path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+            assert params is not None
+            return _note_list_page(params["page"])
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(side_effect=get)
+
+            articles = [article async for article in iter_articles(mock_session, max_pages=3)]
+
+        assert len(articles) == 6
+        assert mock_client.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_stops_on_empty_page(self, mock_session: Session) -> None:
+        """An empty page ends pagination even without isLastPage."""
+        responses: list[dict[str, Any]] = [
+            {"data": {"notes": _note_list_page(1)["data"]["notes"]}},
+            {"data": {"notes": []}},
+        ]
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(side_effect=responses)
+
+            articles = [article async for article in iter_articles(mock_session)]
+
+        assert len(articles) == 2
+        assert mock_client.get.call_count == 2
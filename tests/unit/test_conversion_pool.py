@@ -0,0 +1,191 @@
+"""Unit tests for the conversion worker pool."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from note_mcp.api.articles import create_draft
+from note_mcp.api.element_ids import new_element_id, stable_element_ids
+from note_mcp.models import ArticleInput, Session
+from note_mcp.utils.conversion_pool import (
+    DEFAULT_THRESHOLD,
+    DEFAULT_WORKERS,
+    POOL_ENV_VAR,
+    THRESHOLD_ENV_VAR,
+    WORKERS_ENV_VAR,
+    ConversionPool,
+    get_conversion_pool,
+    shutdown_conversion_pool,
+)
+from note_mcp.utils.markdown_to_html import markdown_to_html
+
+
+def create_mock_session() -> Session:
+    """Create a mock session for testing."""
+    return Session(
+        cookies={"note_gql_auth_token": "token123", "_note_session_v5": "session456"},
+        user_id="user123",
+        username="testuser",
+        expires_at=int(time.time()) + 3600,
+        created_at=int(time.time()),
+    )
+
+
+def _thread_name(text: str) -> str:
+    """Return the name of the thread that converts the text."""
+    return threading.current_thread().name
+
+
+def _seeded_id(text: str) -> str:
+    """Return the next element ID of the current context."""
+    return new_element_id()
+
+
+class TestConversionPool:
+    """Tests for ConversionPool."""
+
+    @pytest.mark.asyncio
+    async def test_small_input_is_converted_inline(self) -> None:
+        """Inputs below the threshold run on the calling thread."""
+        pool = ConversionPool(workers=1, threshold=10)
+
+        assert await pool.run(_thread_name, "short") == threading.current_thread().name
+        assert pool._executor is None
+
+    @pytest.mark.asyncio
+    async def test_large_input_is_offloaded(self) -> None:
+        """Inputs at or above the threshold run in a worker thread."""
+        pool = ConversionPool(workers=1, threshold=10)
+        try:
+            name = await pool.run(_thread_name, "x" * 10)
+        finally:
+            pool.shutdown()
+
+        assert name.startswith("note-mcp-convert")
+
+    @pytest.mark.asyncio
+    async def test_zero_workers_converts_inline(self) -> None:
+        """workers=0 disables offloading."""
+        pool = ConversionPool(workers=0, threshold=0)
+
+        assert await pool.run(_thread_name, "x" * 100) == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_context_is_carried_into_threads(self) -> None:
+        """Worker threads see the caller's stable_element_ids seed."""
+        pool = ConversionPool(workers=1, threshold=0)
+        try:
+            with stable_element_ids("seed"):
+                offloaded = await pool.run(_seeded_id, "text")
+        finally:
+            pool.shutdown()
+        with stable_element_ids("seed"):
+            inline = new_element_id()
+
+        assert offloaded == inline
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_inline(self) -> None:
+        """A process pool returns the same HTML as an inline conversion."""
+        content = "## 見出し\n\n本文 **太字**\n\n- 項目"
+        pool = ConversionPool(workers=1, threshold=0, kind="process")
+        try:
+            html = await pool.run(markdown_to_html, content, stable_ids=True)
+        finally:
+            pool.shutdown()
+
+        assert html == markdown_to_html(content, stable_ids=True)
+
+    def test_invalid_configuration(self) -> None:
+        """Negative sizes and unknown pool kinds are rejected."""
+        with pytest.raises(ValueError):
+            ConversionPool(workers=-1)
+        with pytest.raises(ValueError):
+            ConversionPool(threshold=-1)
+        with pytest.raises(ValueError):
+            ConversionPool(kind="fiber")
+
+
+class TestGetConversionPool:
+    """Tests for configuring the process-wide pool."""
+
+    def test_reads_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Workers, threshold and kind come from environment variables."""
+        monkeypatch.setenv(WORKERS_ENV_VAR, "4")
+        monkeypatch.setenv(THRESHOLD_ENV_VAR, "1000")
+        monkeypatch.setenv(POOL_ENV_VAR, "process")
+
+        with patch("note_mcp.utils.conversion_pool._conversion_pool", None):
+            pool = get_conversion_pool()
+
+        assert (pool.workers, pool.threshold, pool.kind) == (4, 1000, "process")
+
+    def test_invalid_environment_uses_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Unparsable values fall back to the defaults."""
+        monkeypatch.setenv(WORKERS_ENV_VAR, "many")
+        monkeypatch.setenv(THRESHOLD_ENV_VAR, "-5")
+        monkeypatch.setenv(POOL_ENV_VAR, "fiber")
+
+        with patch("note_mcp.utils.conversion_pool._conversion_pool", None):
+            pool = get_conversion_pool()
+
+        assert (pool.workers, pool.threshold, pool.kind) == (DEFAULT_WORKERS, DEFAULT_THRESHOLD, "thread")
+
+
+class TestShutdownConversionPool:
+    """Tests for shutting down the process-wide pool."""
+
+    @pytest.mark.asyncio
+    async def test_server_lifespan_shuts_down_workers(self, isolated_conversion_pool: ConversionPool) -> None:
+        """Leaving the server lifespan stops the conversion workers."""
+        from note_mcp.server import _lifespan, mcp
+
+        isolated_conversion_pool.threshold = 0
+        async with _lifespan(mcp):
+            await isolated_conversion_pool.run(_thread_name, "text")
+            assert isolated_conversion_pool._executor is not None
+
+        assert isolated_conversion_pool._executor is None
+
+    def test_unused_pool_is_not_created(self) -> None:
+        """Shutting down before first use does not create the pool."""
+        with (
+            patch("note_mcp.utils.conversion_pool._conversion_pool", None),
+            patch("note_mcp.utils.conversion_pool.ConversionPool") as pool_class,
+        ):
+            shutdown_conversion_pool()
+
+        pool_class.assert_not_called()
+
+
+class TestArticleConversionOffload:
+    """Tests for offloading from article operations."""
+
+    @pytest.mark.asyncio
+    async def test_create_draft_converts_large_body_in_worker(self, isolated_conversion_pool: ConversionPool) -> None:
+        """create_draft converts a body above the threshold off the event loop."""
+        isolated_conversion_pool.threshold = 100
+        threads: list[str] = []
+
+        def convert(content: str) -> str:
+            threads.append(threading.current_thread().name)
+            return markdown_to_html(content)
+
+        with (
+            patch("note_mcp.api.articles.markdown_to_html", convert),
+            patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class,
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.post = AsyncMock(side_effect=[{"data": {"id": 123, "key": "naaa"}}, {"data": {"result": True}}])
+
+            await create_draft(create_mock_session(), ArticleInput(title="題", body="本文 " * 100))
+
+        assert len(threads) == 1
+        assert threads[0].startswith("note-mcp-convert")
@@ -5,11 +5,14 @@ Tests for the bulk draft deletion functionality:
 - T032: delete_all_drafts with confirm=True executes bulk deletion
 - T033: delete_all_drafts when no drafts returns empty message
 - T034: delete_all_drafts with partial failure returns detailed result
+- Concurrent deletion with progress reporting
 """
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from note_mcp.api.articles import delete_all_drafts
@@ -275,6 +278,40 @@ class TestDeleteAllDraftsPartialFailure:
             assert failed.title == "失敗する下書き"
             assert "削除に失敗しました" in failed.error
 
+    @pytest.mark.asyncio
+    async def test_transport_error_recorded_as_failure(self) -> None:
+        """A connection failure fails only its draft; the other deletions are reported."""
+        session = create_mock_session()
+        drafts = [
+            create_mock_draft_article("111", "n1111111111aa", "成功する下書き"),
+            create_mock_draft_article("222", "n2222222222bb", "接続できない下書き"),
+            create_mock_draft_article("333", "n3333333333cc", "もう一つ成功"),
+        ]
+        on_progress = AsyncMock()
+
+        def delete_side_effect(path: str) -> dict[str, bool]:
+            if "n2222222222bb" in path:
+                raise httpx.ConnectError("connection reset")
+            return {"success": True}
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client.get.side_effect = create_paginated_get_side_effect(drafts)
+            mock_client.delete.side_effect = delete_side_effect
+            mock_client_cls.return_value = mock_client
+
+            result = await delete_all_drafts(session, confirm=True, on_progress=on_progress)
+
+        assert isinstance(result, BulkDeleteResult)
+        assert result.deleted_count == 2
+        assert result.failed_count == 1
+        failed = result.failed_articles[0]
+        assert failed.article_key == "n2222222222bb"
+        assert "connection reset" in failed.error
+        assert on_progress.await_count == 3
+
     @pytest.mark.asyncio
     async def test_delete_all_drafts_all_fail_returns_failure_result(self) -> None:
         """Test that complete failure is properly reported."""
@@ -305,3 +342,122 @@ class TestDeleteAllDraftsPartialFailure:
             assert result.failed_count == 2
             assert len(result.deleted_articles) == 0
             assert len(result.failed_articles) == 2
+
+
+class TestDeleteAllDraftsConcurrency:
+    """Unit tests for concurrent deletion and progress reporting."""
+
+    @pytest.mark.asyncio
+    async def test_deletions_run_concurrently_within_limit(self) -> None:
+        """Deletions overlap but never exceed max_concurrency."""
+        session = create_mock_session()
+        drafts = [create_mock_draft_article(str(i), f"n{i:012d}", f"下書き{i}") for i in range(10)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def delete_side_effect(path: str) -> dict[str, bool]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"success": True}
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client.get.side_effect = create_paginated_get_side_effect(drafts)
+            mock_client.delete.side_effect = delete_side_effect
+            mock_client_cls.return_value = mock_client
+
+            result = await delete_all_drafts(session, confirm=True, max_concurrency=3)
+
+        assert isinstance(result, BulkDeleteResult)
+        assert result.deleted_count == 10
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_results_keep_listing_order(self) -> None:
+        """Deleted and failed articles are reported in listing order."""
+        session = create_mock_session()
+        drafts = [create_mock_draft_article(str(i), f"n{i:012d}", f"下書き{i}") for i in range(6)]
+
+        async def delete_side_effect(path: str) -> dict[str, bool]:
+            index = int(path.rsplit("n", 1)[1])
+            # Earlier drafts finish later
+            await asyncio.sleep(0.001 * (6 - index))
+            if index % 2:
+                raise NoteAPIError(code=ErrorCode.API_ERROR, message="削除に失敗しました")
+            return {"success": True}
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client.get.side_effect = create_paginated_get_side_effect(drafts)
+            mock_client.delete.side_effect = delete_side_effect
+            mock_client_cls.return_value = mock_client
+
+            result = await delete_all_drafts(session, confirm=True)
+
+        assert isinstance(result, BulkDeleteResult)
+        assert [a.article_id for a in result.deleted_articles] == ["0", "2", "4"]
+        assert [a.article_id for a in result.failed_articles] == ["1", "3", "5"]
+
+    @pytest.mark.asyncio
+    async def test_progress_reported_for_each_draft(self) -> None:
+        """on_progress is awaited once per processed draft, failures included."""
+        session = create_mock_session()
+        drafts = [
+            create_mock_draft_article("111", "n1111111111aa", "下書き1"),
+            create_mock_draft_article("222", "n2222222222bb", "下書き2"),
+            create_mock_draft_article("333", "n3333333333cc", "下書き3"),
+        ]
+        on_progress = AsyncMock()
+
+        def delete_side_effect(path: str) -> dict[str, bool]:
+            if "n2222222222bb" in path:
+                raise NoteAPIError(code=ErrorCode.API_ERROR, message="削除に失敗しました")
+            return {"success": True}
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client.get.side_effect = create_paginated_get_side_effect(drafts)
+            mock_client.delete.side_effect = delete_side_effect
+            mock_client_cls.return_value = mock_client
+
+            await delete_all_drafts(session, confirm=True, on_progress=on_progress)
+
+        assert [call.args for call in on_progress.await_args_list] == [(1, 3), (2, 3), (3, 3)]
+
+    @pytest.mark.asyncio
+    async def test_invalid_max_concurrency_raises(self) -> None:
+        """max_concurrency must be at least 1."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await delete_all_drafts(create_mock_session(), confirm=True, max_concurrency=0)
+
+
+class TestDeleteProgressReporter:
+    """Unit tests for the note_delete_all_drafts progress callback."""
+
+    def test_no_reporter_outside_mcp_request(self) -> None:
+        """Without an active MCP context no callback is built."""
+        from note_mcp.server import _delete_progress_reporter
+
+        assert _delete_progress_reporter() is None
+
+    @pytest.mark.asyncio
+    async def test_reporter_sends_progress_notifications(self) -> None:
+        """The callback forwards progress to the active MCP context."""
+        from note_mcp.server import _delete_progress_reporter
+
+        ctx = AsyncMock()
+        with patch("note_mcp.server.get_context", return_value=ctx):
+            report = _delete_progress_reporter()
+
+        assert report is not None
+        await report(2, 5)
+        ctx.report_progress.assert_awaited_once_with(2, 5, "2/5件の下書きを処理しました")
@@ -0,0 +1,65 @@
+"""Unit tests for note.com element ID generation."""
+
+from __future__ import annotations
+
+import uuid
+
+from note_mcp.api.articles import generate_image_html
+from note_mcp.api.element_ids import new_element_id, stable_element_ids
+from note_mcp.api.embeds import generate_embed_html
+
+
+class TestNewElementId:
+    """Tests for new_element_id and stable_element_ids."""
+
+    def test_random_by_default(self) -> None:
+        """Outside stable_element_ids, IDs are random UUID4s."""
+        first = new_element_id()
+
+        assert uuid.UUID(first).version == 4
+        assert new_element_id() != first
+
+    def test_seeded_ids_repeat(self) -> None:
+        """The n-th ID of a seed is always the same UUID."""
+        with stable_element_ids("seed"):
+            first = [new_element_id(), new_element_id()]
+        with stable_element_ids("seed"):
+            second = [new_element_id(), new_element_id()]
+        with stable_element_ids("other"):
+            other = new_element_id()
+
+        assert first == second
+        assert first[0] != first[1]
+        assert other not in first
+        assert uuid.UUID(first[0]).version == 5
+
+    def test_block_yields_generated_ids(self) -> None:
+        """stable_element_ids yields the IDs generated inside it, in order."""
+        with stable_element_ids("seed") as generated:
+            ids = [new_element_id(), new_element_id()]
+
+        assert generated == ids
+
+    def test_nested_seed_is_restored(self) -> None:
+        """Leaving a nested block resumes the outer seed's sequence."""
+        with stable_element_ids("outer"):
+            first = new_element_id()
+            with stable_element_ids("inner"):
+                new_element_id()
+            second = new_element_id()
+        with stable_element_ids("outer"):
+            expected = [new_element_id(), new_element_id()]
+
+        assert [first, second] == expected
+        assert uuid.UUID(new_element_id()).version == 4
+
+    def test_image_and_embed_html_are_stable(self) -> None:
+        """generate_image_html and embed figures use the seeded IDs."""
+        url = "https://www.youtube.com/watch?v=abc123"
+        with stable_element_ids("seed"):
+            first = (generate_image_html("https://example.com/a.png"), generate_embed_html(url))
+        with stable_element_ids("seed"):
+            second = (generate_image_html("https://example.com/a.png"), generate_embed_html(url))
+
+        assert first == second
+        assert generate_embed_html(url) != generate_embed_html(url)
@@ -0,0 +1,224 @@
+"""Unit tests for the server-registered embed key cache."""
+
+from __future__ import annotations
+
+import re
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from note_mcp.api.embed_cache import EmbedKeyCache, get_embed_key_cache
+from note_mcp.api.embeds import (
+    fetch_embed_key,
+    generate_embed_html,
+    prefetch_embed_keys,
+    resolve_embed_keys,
+    seed_embed_key_cache,
+)
+from note_mcp.models import Session
+
+YOUTUBE_URL = "https://www.youtube.com/watch?v=video1"
+TWITTER_URL = "https://twitter.com/user/status/123"
+
+
+def create_mock_session() -> Session:
+    """Create a mock session for testing."""
+    return Session(
+        cookies={"note_gql_auth_token": "token123", "_note_session_v5": "session456"},
+        user_id="user123",
+        username="testuser",
+        expires_at=int(time.time()) + 3600,
+        created_at=int(time.time()),
+    )
+
+
+def figure(url: str, key: str) -> str:
+    """Build an embed figure element."""
+    return (
+        f'<figure name="f" id="f" data-src="{url}" embedded-service="youtube" '
+        f'embedded-content-key="{key}" contenteditable="false"></figure>'
+    )
+
+
+class TestEmbedKeyCache:
+    """Tests for EmbedKeyCache."""
+
+    def test_entries_are_scoped_by_article(self) -> None:
+        """The same URL in another article is a separate entry."""
+        cache = EmbedKeyCache()
+        cache.put(YOUTUBE_URL, "narticle1", "embserver1", "<iframe></iframe>")
+
+        assert cache.get(YOUTUBE_URL, "narticle1") == ("embserver1", "<iframe></iframe>")
+        assert cache.get(YOUTUBE_URL, "narticle2") is None
+        assert len(cache) == 1
+
+    def test_seed_keeps_existing_entries(self) -> None:
+        """Seeded pairs do not overwrite keys recorded from API responses."""
+        cache = EmbedKeyCache()
+        cache.put(YOUTUBE_URL, "narticle1", "embserver1", "<iframe></iframe>")
+
+        cache.seed("narticle1", [(YOUTUBE_URL, "embstale"), (TWITTER_URL, "embserver2")])
+
+        assert cache.get(YOUTUBE_URL, "narticle1") == ("embserver1", "<iframe></iframe>")
+        assert cache.get(TWITTER_URL, "narticle1") == ("embserver2", None)
+
+    def test_persists_to_disk(self, tmp_path: Path) -> None:
+        """Entries written by one instance are loaded by the next."""
+        path = tmp_path / "embed_keys.json"
+        EmbedKeyCache(path).put(YOUTUBE_URL, "narticle1", "embserver1", "<iframe></iframe>")
+
+        reloaded = EmbedKeyCache(path)
+
+        assert reloaded.get(YOUTUBE_URL, "narticle1") == ("embserver1", "<iframe></iframe>")
+
+    def test_corrupted_store_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable store file starts an empty cache."""
+        path = tmp_path / "embed_keys.json"
+        path.write_text("[broken", encoding="utf-8")
+
+        assert len(EmbedKeyCache(path)) == 0
+
+
+class TestSeedEmbedKeyCache:
+    """Tests for seed_embed_key_cache."""
+
+    def test_records_stored_keys(self) -> None:
+        """Figures in stored HTML are recorded for the article."""
+        html_body = figure(YOUTUBE_URL, "emb0076d44f4f7f") + "<p>text</p>"
+
+        seed_embed_key_cache("narticle1", html_body)
+
+        assert get_embed_key_cache().get(YOUTUBE_URL, "narticle1") == ("emb0076d44f4f7f", None)
+
+    def test_ignores_placeholder_keys(self) -> None:
+        """Unresolved placeholder keys are not treated as registered."""
+        placeholder = re.search(r'embedded-content-key="([^"]+)"', generate_embed_html(YOUTUBE_URL))
+        assert placeholder is not None
+        html_body = figure(YOUTUBE_URL, placeholder.group(1))
+
+        seed_embed_key_cache("narticle1", html_body)
+
+        assert get_embed_key_cache().get(YOUTUBE_URL, "narticle1") is None
+
+    def test_ignores_legacy_placeholder_keys(self) -> None:
+        """Placeholders of the old "emb" + 13 hex format left in stored articles are ignored."""
+        html_body = figure(YOUTUBE_URL, "emb9a11f73f9fa04") + figure(TWITTER_URL, "emb0076d44f4f7f")
+
+        seed_embed_key_cache("narticle1", html_body)
+
+        assert get_embed_key_cache().get(YOUTUBE_URL, "narticle1") is None
+        assert get_embed_key_cache().get(TWITTER_URL, "narticle1") == ("emb0076d44f4f7f", None)
+
+    def test_records_server_keys_of_any_length(self) -> None:
+        """Server keys are recorded whatever their length."""
+        html_body = figure(YOUTUBE_URL, "emb0123456789abcdef")
+
+        seed_embed_key_cache("narticle1", html_body)
+
+        assert get_embed_key_cache().get(YOUTUBE_URL, "narticle1") == ("emb0123456789abcdef", None)
+
+
+class TestEmbedKeyCacheUsage:
+    """Tests for cache use in fetch_embed_key and resolve_embed_keys."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_embed_key_records_response(self) -> None:
+        """fetch_embed_key stores the registered key and HTML."""
+        with patch("note_mcp.api.embeds.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(return_value={"data": {"key": "embserver1", "html_for_embed": "<iframe>"}})
+
+            await fetch_embed_key(create_mock_session(), YOUTUBE_URL, "narticle1")
+
+        assert get_embed_key_cache().get(YOUTUBE_URL, "narticle1") == ("embserver1", "<iframe>")
+
+    @pytest.mark.asyncio
+    async def test_resolve_only_fetches_new_urls(self) -> None:
+        """Cached URLs reuse their key; only new URLs hit the API."""
+        get_embed_key_cache().put(YOUTUBE_URL, "narticle1", "embcached1", None)
+        html_body = figure(YOUTUBE_URL, "embrandom1") + figure(TWITTER_URL, "embrandom2")
+        session = create_mock_session()
+
+        with patch("note_mcp.api.embeds.fetch_embed_key") as mock_fetch:
+            mock_fetch.return_value = ("embserver2", "<blockquote>")
+
+            result = await resolve_embed_keys(session, html_body, "narticle1")
+
+        mock_fetch.assert_called_once_with(session, TWITTER_URL, "narticle1")
+        assert 'embedded-content-key="embcached1"' in result
+        assert 'embedded-content-key="embserver2"' in result
+
+    @pytest.mark.asyncio
+    async def test_cached_placeholder_key_is_registered_again(self) -> None:
+        """A legacy placeholder key left in the cache is not reused."""
+        get_embed_key_cache().put(YOUTUBE_URL, "narticle1", "emb9a11f73f9fa04", None)
+
+        with patch("note_mcp.api.embeds.fetch_embed_key") as mock_fetch:
+            mock_fetch.return_value = ("embserver1", "<iframe>")
+
+            result = await resolve_embed_keys(create_mock_session(), figure(YOUTUBE_URL, "embrandom1"), "narticle1")
+
+        mock_fetch.assert_called_once()
+        assert 'embedded-content-key="embserver1"' in result
+
+    @pytest.mark.asyncio
+    async def test_cache_is_per_article(self) -> None:
+        """A key registered for another article is not reused."""
+        get_embed_key_cache().put(YOUTUBE_URL, "nother", "embother", None)
+
+        with patch("note_mcp.api.embeds.fetch_embed_key") as mock_fetch:
+            mock_fetch.return_value = ("embserver1", "<iframe>")
+
+            result = await resolve_embed_keys(create_mock_session(), figure(YOUTUBE_URL, "embrandom1"), "narticle1")
+
+        mock_fetch.assert_called_once()
+        assert 'embedded-content-key="embserver1"' in result
+
+    @pytest.mark.asyncio
+    async def test_get_article_seeds_cache(self) -> None:
+        """Fetching an article records the embed keys in its stored HTML."""
+        from note_mcp.api.articles import get_article_via_api
+
+        response = {
+            "data": {
+                "id": 12345,
+                "key": "narticle1",
+                "name": "Title",
+                "status": "draft",
+                "body": figure(YOUTUBE_URL, "emb0076d44f4f7f"),
+            }
+        }
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(return_value=response)
+
+            await get_article_via_api(create_mock_session(), "narticle1")
+
+        assert get_embed_key_cache().get(YOUTUBE_URL, "narticle1") == ("emb0076d44f4f7f", None)
+
+    @pytest.mark.asyncio
+    async def test_prefetch_makes_resolve_request_free(self) -> None:
+        """Prefetched URLs are resolved from the cache."""
+        session = create_mock_session()
+
+        async def fake_fetch(_session: Session, url: str, article_key: str) -> tuple[str, str]:
+            get_embed_key_cache().put(url, article_key, "embserver1", "<iframe>")
+            return "embserver1", "<iframe>"
+
+        with patch("note_mcp.api.embeds.fetch_embed_key", side_effect=fake_fetch) as mock_fetch:
+            await prefetch_embed_keys(session, [YOUTUBE_URL, YOUTUBE_URL, "https://example.com/"], "narticle1")
+            assert mock_fetch.call_count == 1
+
+            result = await resolve_embed_keys(session, figure(YOUTUBE_URL, "embrandom1"), "narticle1")
+
+        assert mock_fetch.call_count == 1
+        assert 'embedded-content-key="embserver1"' in result
@@ -161,17 +161,16 @@ class TestGenerateEmbedHtml:
         assert "</figure>" in html
 
     def test_embed_key_format(self) -> None:
-        """Test that embed content key has correct format (emb + 13 hex chars)."""
+        """Test that placeholder keys have correct format (embtmp + 12 hex chars)."""
         from note_mcp.api.embeds import generate_embed_html
 
         html = generate_embed_html("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
 
         # Extract embedded-content-key value
-        match = re.search(r'embedded-content-key="(emb[a-f0-9]+)"', html)
+        match = re.search(r'embedded-content-key="(embtmp[a-f0-9]+)"', html)
         assert match is not None
         key = match.group(1)
-        assert key.startswith("emb")
-        assert len(key) == 16  # "emb" + 13 chars
+        assert len(key) == 18  # "embtmp" + 12 chars
 
     def test_uuid_attributes(self) -> None:
         """Test that name and id attributes are valid UUIDs."""
@@ -315,6 +314,118 @@ class TestEmbedPatterns:
         assert GIST_PATTERN.match("https://gist.github.com/user/abc123/#file-test-js")
 
 
+def _scan_embed_patterns(url: str) -> str | None:
+    """Reference classifier: linear scan over EMBED_PATTERNS."""
+    from note_mcp.api.embeds import EMBED_PATTERNS
+
+    for pattern, service in EMBED_PATTERNS:
+        if pattern.match(url):
+            return service
+    return None
+
+
+class TestGetEmbedServiceHostDispatch:
+    """Differential tests: host dispatch must agree with the EMBED_PATTERNS scan."""
+
+    HOSTS = [
+        "youtube.com",
+        "www.youtube.com",
+        "youtu.be",
+        "www.youtu.be",
+        "m.youtube.com",
+        "YouTube.com",
+        "twitter.com",
+        "www.twitter.com",
+        "x.com",
+        "www.x.com",
+        "mobile.twitter.com",
+        "note.com",
+        "www.note.com",
+        "money.note.com",
+        "gist.github.com",
+        "github.com",
+        "www.github.com",
+        "api.github.com",
+        "docs.google.com",
+        "drive.google.com",
+        "speakerdeck.com",
+        "zenn.dev",
+        "www.zenn.dev",
+        "qiita.com",
+        "fin-py.connpass.com",
+        "www.connpass.com",
+        "connpass.com",
+        "a.b.connpass.com",
+        "note.com:443",
+        "user@note.com",
+        "example.com",
+        "",
+    ]
+
+    PATHS = [
+        "/watch?v=dQw4w9WgXcQ",
+        "/dQw4w9WgXcQ",
+        "/user/status/1234567890",
+        "/username/n/n1234567890ab",
+        "/companies/7203",
+        "/investments/abc-def/",
+        "/user/abc123def456",
+        "/user/abc123def456/#file-a-py",
+        "/anthropics/claude-code",
+        "/anthropics/claude-code/issues",
+        "/presentation/d/1W543BSd-hHANrJOzCPyNf-r3x0s5s7ljc9xA7a7x960/edit#slide=id.p",
+        "/tomohisa/introducing-decider",
+        "/zenn/articles/markdown-guide",
+        "/driller/items/31c1ff4d0bf5813f624f",
+        "/event/381982/",
+        "/event/381982",
+        "",
+        "/",
+        "?q=1",
+        "#frag",
+    ]
+
+    def test_matches_linear_scan(self) -> None:
+        """Every scheme/host/path combination classifies identically."""
+        from note_mcp.api.embeds import EMBED_PATTERNS, get_embed_service
+
+        urls = [
+            f"{scheme}{host}{path}{suffix}"
+            for scheme in ("https://", "http://", "ftp://", "HTTPS://", "")
+            for host in self.HOSTS
+            for path in self.PATHS
+            for suffix in ("", "\n", "/extra")
+        ]
+
+        mismatches = [url for url in urls if get_embed_service(url) != _scan_embed_patterns(url)]
+
+        assert mismatches == []
+        # Sanity check: the corpus covers every service
+        assert {_scan_embed_patterns(url) for url in urls} >= {service for _, service in EMBED_PATTERNS}
+
+    def test_every_pattern_has_registered_hosts(self) -> None:
+        """New services should register their hosts to benefit from dispatch."""
+        from note_mcp.api.embeds import EMBED_PATTERN_HOSTS, EMBED_PATTERNS
+
+        assert [p for p, _ in EMBED_PATTERNS if p not in EMBED_PATTERN_HOSTS] == []
+
+    def test_unregistered_pattern_is_tried_for_every_host(self) -> None:
+        """A pattern without registered hosts still classifies URLs."""
+        from unittest.mock import patch
+
+        from note_mcp.api import embeds
+
+        extra = re.compile(r"^https?://(?:www\.)?example\.com/embed/\d+$")
+        patterns = [*embeds.EMBED_PATTERNS, (extra, "example")]
+
+        with patch.object(embeds, "EMBED_PATTERNS", patterns):
+            exact, wildcard, unregistered = embeds._build_host_dispatch()
+
+        assert unregistered == [(extra, "example")]
+        assert all(candidates[-1] == (extra, "example") for candidates in exact.values())
+        assert all(candidates[-1] == (extra, "example") for candidates in wildcard.values())
+
+
 class TestFetchNoteEmbedKey:
     """Tests for _fetch_note_embed_key function (Issue #121).
 
@@ -959,6 +1070,107 @@ class TestResolveEmbedKeys:
             assert 'embedded-content-key="embntserver"' in result
             assert mock_fetch.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_duplicate_urls_fetched_once(self) -> None:
+        """Test that a URL embedded several times is registered only once."""
+        import time
+        from unittest.mock import patch
+
+        from note_mcp.api.embeds import resolve_embed_keys
+        from note_mcp.models import Session
+
+        session = Session(
+            cookies={"note_gql_session_id": "test", "XSRF-TOKEN": "test"},
+            user_id="123456",
+            username="testuser",
+            created_at=int(time.time()),
+        )
+
+        html_body = (
+            '<figure name="fig1" id="fig1" '
+            'data-src="https://www.youtube.com/watch?v=same" '
+            'embedded-service="youtube" '
+            'embedded-content-key="embrandom1" '
+            'contenteditable="false"></figure>'
+            '<figure name="fig2" id="fig2" '
+            'data-src="https://www.youtube.com/watch?v=same" '
+            'embedded-service="youtube" '
+            'embedded-content-key="embrandom2" '
+            'contenteditable="false"></figure>'
+        )
+
+        with patch("note_mcp.api.embeds.fetch_embed_key") as mock_fetch:
+            mock_fetch.return_value = ("embserver", "<iframe>yt</iframe>")
+
+            result = await resolve_embed_keys(session, html_body, "n1234567890ab")
+
+            mock_fetch.assert_called_once()
+            assert result.count('embedded-content-key="embserver"') == 2
+            assert "embrandom" not in result
+
+    @pytest.mark.asyncio
+    async def test_fetches_run_concurrently_within_limit(self) -> None:
+        """Test that key lookups overlap but never exceed max_concurrency."""
+        import asyncio
+        import time
+        from unittest.mock import patch
+
+        from note_mcp.api.embeds import resolve_embed_keys
+        from note_mcp.models import Session
+
+        session = Session(
+            cookies={"note_gql_session_id": "test", "XSRF-TOKEN": "test"},
+            user_id="123456",
+            username="testuser",
+            created_at=int(time.time()),
+        )
+
+        html_body = "".join(
+            f'<figure name="fig{i}" id="fig{i}" '
+            f'data-src="https://www.youtube.com/watch?v=video{i}" '
+            f'embedded-service="youtube" '
+            f'embedded-content-key="embrandom{i}x" '
+            f'contenteditable="false"></figure>'
+            for i in range(10)
+        )
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_fetch(_session: Session, url: str, _article_key: str) -> tuple[str, str]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"embserver{url.rsplit('video', 1)[1]}x", "<iframe></iframe>"
+
+        with patch("note_mcp.api.embeds.fetch_embed_key", side_effect=fake_fetch):
+            result = await resolve_embed_keys(session, html_body, "n1234567890ab", max_concurrency=3)
+
+        assert max_in_flight == 3
+        for i in range(10):
+            assert f'embedded-content-key="embserver{i}x"' in result
+        assert "embrandom" not in result
+
+    @pytest.mark.asyncio
+    async def test_invalid_max_concurrency_raises(self) -> None:
+        """Test that max_concurrency below 1 is rejected."""
+        import time
+
+        from note_mcp.api.embeds import resolve_embed_keys
+        from note_mcp.models import Session
+
+        session = Session(
+            cookies={"note_gql_session_id": "test", "XSRF-TOKEN": "test"},
+            user_id="123456",
+            username="testuser",
+            created_at=int(time.time()),
+        )
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await resolve_embed_keys(session, "<p>text</p>", "n1234567890ab", max_concurrency=0)
+
 
 class TestGenerateEmbedHtmlWithKey:
     """Tests for generate_embed_html_with_key function."""
@@ -577,3 +577,50 @@ Body content.
         )
 
         assert article.eyecatch == eyecatch_path
+
+
+class TestReplaceLocalImagePaths:
+    """Tests for replace_local_image_paths."""
+
+    def test_replaces_all_paths_in_one_call(self) -> None:
+        """Every occurrence of every path should be replaced."""
+        from note_mcp.utils.file_parser import replace_local_image_paths
+
+        body = "![a](./a.png)\n\n![b](./images/b.png)\n\n![again](./a.png)"
+
+        result = replace_local_image_paths(
+            body,
+            {"./a.png": "https://assets.st-note.com/a.png", "./images/b.png": "https://assets.st-note.com/b.png"},
+        )
+
+        assert result == (
+            "![a](https://assets.st-note.com/a.png)\n\n"
+            "![b](https://assets.st-note.com/b.png)\n\n"
+            "![again](https://assets.st-note.com/a.png)"
+        )
+
+    def test_only_parenthesized_paths_are_replaced(self) -> None:
+        """Paths mentioned in plain text should be left alone."""
+        from note_mcp.utils.file_parser import replace_local_image_paths
+
+        body = "See ./a.png below.\n\n![a](./a.png)"
+
+        result = replace_local_image_paths(body, {"./a.png": "https://assets.st-note.com/a.png"})
+
+        assert result == "See ./a.png below.\n\n![a](https://assets.st-note.com/a.png)"
+
+    def test_special_characters_in_path(self) -> None:
+        """Regex metacharacters in paths should be matched literally."""
+        from note_mcp.utils.file_parser import replace_local_image_paths
+
+        body = "![a](./img[1]+.png) ![b](./img11+.png)"
+
+        result = replace_local_image_paths(body, {"./img[1]+.png": "https://example.com/x.png"})
+
+        assert result == "![a](https://example.com/x.png) ![b](./img11+.png)"
+
+    def test_empty_mapping_returns_body(self) -> None:
+        """No mapping should return the body unchanged."""
+        from note_mcp.utils.file_parser import replace_local_image_paths
+
+        assert replace_local_image_paths("![a](./a.png)", {}) == "![a](./a.png)"
@@ -102,6 +102,40 @@ line3</code></pre>"""
         for line in sub_items:
             assert line.startswith("  ") or line.startswith("    ")
 
+    def test_many_lists_conversion(self) -> None:
+        """Test that every list is converted, however many there are."""
+        html = "".join(f"<h2>Step {i}</h2><ul><li><p>item {i}</p></li></ul>" for i in range(250))
+        result = html_to_markdown(html)
+        assert "<ul" not in result and "<li" not in result
+        assert result.count("- item ") == 250
+        assert "- item 249" in result
+
+    def test_deeply_nested_list_conversion(self) -> None:
+        """Test nesting depth and document order of mixed nested lists."""
+        html = "<ul><li><p>level 0</p>"
+        for depth in range(1, 6):
+            html += f"<ol><li><p>level {depth}</p>"
+        html += "</li></ol>" * 5 + "<ul><li><p>sibling</p></li></ul></li></ul>"
+        result = html_to_markdown(html)
+        lines = result.split("\n")
+        assert lines[0] == "- level 0"
+        for depth in range(1, 6):
+            assert lines[depth] == f"{'  ' * depth}1. level {depth}"
+        assert lines[6] == "  - sibling"
+
+    def test_list_item_without_paragraph(self) -> None:
+        """Test list items whose text is not wrapped in <p>."""
+        html = "<ol><li>First <ul><li><p>nested</p></li></ul></li><li></li><li>Second</li></ol>"
+        result = html_to_markdown(html)
+        assert result == "1. First\n  - nested\n2. Second"
+
+    def test_unclosed_list_is_left_unchanged(self) -> None:
+        """Test that a list without closing tag does not swallow the document."""
+        html = "<p>before</p><ul><li><p>open</p></li>"
+        result = html_to_markdown(html)
+        assert result.startswith("before")
+        assert "open" in result
+
     # === Blockquote Tests ===
 
     def test_blockquote_conversion(self) -> None:
@@ -421,3 +455,56 @@ y = 2
         assert "->" not in result
         assert "<-" not in result
         assert "通常のテキスト" in result
+
+    # === Element Tree Tests ===
+
+    def test_code_block_content_is_verbatim(self) -> None:
+        """Test that markup-like text and entities in code blocks are kept as code."""
+        html = '<pre class="codeBlock"><code>if a &lt;b&gt; c:\n    print(&quot;&amp;lt;&quot;)</code></pre>'
+        result = html_to_markdown(html)
+        assert result == '```\nif a <b> c:\n    print("&lt;")\n```'
+
+    def test_code_block_language(self) -> None:
+        """Test that a language class on <code> becomes the fence info string."""
+        html = '<pre><code class="language-python">x = 1</code></pre>'
+        assert html_to_markdown(html) == "```python\nx = 1\n```"
+
+    def test_inline_elements_with_attributes(self) -> None:
+        """Test inline elements carrying note.com name/id attributes."""
+        html = (
+            '<p name="abc" id="abc">Use <code name="def" id="def">x &lt; y</code> and <strong id="s">bold</strong>.</p>'
+        )
+        assert html_to_markdown(html) == "Use `x < y` and **bold**."
+
+    def test_list_items_keep_inline_formatting(self) -> None:
+        """Test that list item text keeps bold, code and links."""
+        html = '<ul><li><p><strong>太字</strong>と<a href="https://example.com">リンク</a></p></li></ul>'
+        assert html_to_markdown(html) == "- **太字**と[リンク](https://example.com)"
+
+    def test_ordered_list_start(self) -> None:
+        """Test that the start attribute of an ordered list is kept."""
+        html = '<ol start="3"><li><p>three</p></li><li><p>four</p></li></ol><p>after</p>'
+        assert html_to_markdown(html) == "3. three\n4. four\n\nafter"
+
+    def test_blockquote_paragraphs_become_lines(self) -> None:
+        """Test that each paragraph of a quote becomes its own quote line."""
+        html = "<figure><blockquote><p>first</p><p>second</p></blockquote><figcaption></figcaption></figure>"
+        assert html_to_markdown(html) == "> first\n> second"
+
+    def test_embed_figure_to_url(self) -> None:
+        """Test that an embed figure becomes its URL alone on a line."""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        html = f'<p>before</p><figure data-src="{url}" embedded-service="youtube" embedded-content-key="emb1"></figure>'
+        result = html_to_markdown(html)
+        assert result == f"before\n\n{url}"
+        assert 'embedded-service="youtube"' in markdown_to_html(result)
+
+    def test_table_of_contents_element(self) -> None:
+        """Test the <table-of-contents> element written by markdown_to_html."""
+        html = markdown_to_html("[TOC]\n\n## Section")
+        assert html_to_markdown(html) == "[TOC]\n\n## Section"
+
+    def test_unclosed_elements_are_converted(self) -> None:
+        """Test that elements left open at the end of the body are still written."""
+        html = "<h2>Title</h2><p>text <strong>bold"
+        assert html_to_markdown(html) == "## Title\n\ntext **bold**"
@@ -0,0 +1,201 @@
+"""Unit tests for the article key <-> numeric ID cache."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from note_mcp.api.articles import _parse_article_response
+from note_mcp.api.id_cache import NoteIdCache, get_note_id_cache, remember_note_id
+from note_mcp.api.images import _resolve_numeric_note_id
+from note_mcp.models import Session, from_api_response
+
+
+def create_mock_session() -> Session:
+    """Create a mock session for testing."""
+    return Session(
+        cookies={"note_gql_auth_token": "token123", "_note_session_v5": "session456"},
+        user_id="user123",
+        username="testuser",
+        expires_at=int(time.time()) + 3600,
+        created_at=int(time.time()),
+    )
+
+
+class TestNoteIdCache:
+    """Tests for NoteIdCache."""
+
+    def test_put_and_lookup_both_directions(self) -> None:
+        """Pairs are retrievable by key and by numeric ID."""
+        cache = NoteIdCache()
+        cache.put("n1234567890ab", "12345")
+
+        assert cache.get_id("n1234567890ab") == "12345"
+        assert cache.get_key("12345") == "n1234567890ab"
+        assert cache.get_id("nunknown") is None
+        assert cache.get_key("999") is None
+        assert len(cache) == 1
+
+    def test_persists_to_disk(self, tmp_path: Path) -> None:
+        """Pairs written by one instance are loaded by the next."""
+        path = tmp_path / "note_ids.json"
+        NoteIdCache(path).put("n1234567890ab", "12345")
+
+        reloaded = NoteIdCache(path)
+
+        assert reloaded.get_id("n1234567890ab") == "12345"
+        assert reloaded.get_key("12345") == "n1234567890ab"
+
+    def test_corrupted_store_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable store file starts an empty cache."""
+        path = tmp_path / "note_ids.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        cache = NoteIdCache(path)
+
+        assert len(cache) == 0
+
+    def test_clear_empties_store(self, tmp_path: Path) -> None:
+        """clear() removes pairs from memory and disk."""
+        path = tmp_path / "note_ids.json"
+        cache = NoteIdCache(path)
+        cache.put("n1234567890ab", "12345")
+
+        cache.clear()
+
+        assert cache.get_id("n1234567890ab") is None
+        assert json.loads(path.read_text(encoding="utf-8")) == {}
+
+    def test_batch_writes_store_once(self, tmp_path: Path) -> None:
+        """Pairs recorded inside batch() are written in one save when it ends."""
+        path = tmp_path / "note_ids.json"
+        cache = NoteIdCache(path)
+
+        with patch("note_mcp.storage.save_json") as save_json, cache.batch():
+            for index in range(5):
+                cache.put(f"n{index}", str(index))
+            with cache.batch():
+                cache.put("nnested", "99")
+            save_json.assert_not_called()
+
+        save_json.assert_called_once()
+        assert len(save_json.call_args.args[1]) == 6
+
+
+class TestRememberNoteId:
+    """Tests for remember_note_id and cache population side effects."""
+
+    def test_ignores_incomplete_pairs(self) -> None:
+        """Missing or non-numeric values are not recorded."""
+        remember_note_id(None, "12345")
+        remember_note_id("n1234567890ab", None)
+        remember_note_id("n1234567890ab", "not-numeric")
+
+        assert len(get_note_id_cache()) == 0
+
+    def test_accepts_integer_ids(self) -> None:
+        """Integer IDs from JSON responses are stored as strings."""
+        remember_note_id("n1234567890ab", 12345)
+
+        assert get_note_id_cache().get_id("n1234567890ab") == "12345"
+
+    def test_parsed_article_response_populates_cache(self) -> None:
+        """Parsing an article response in the API layer records its key/ID pair."""
+        _parse_article_response({"data": {"id": 12345, "key": "n1234567890ab", "status": "draft"}})
+
+        assert get_note_id_cache().get_id("n1234567890ab") == "12345"
+
+    def test_model_constructor_has_no_side_effects(self) -> None:
+        """from_api_response only builds the model."""
+        from_api_response({"id": 12345, "key": "n1234567890ab", "status": "draft"})
+
+        assert len(get_note_id_cache()) == 0
+
+    @pytest.mark.asyncio
+    async def test_list_articles_populates_cache(self) -> None:
+        """Every article in a list response is recorded."""
+        from note_mcp.api.articles import list_articles
+
+        response: dict[str, Any] = {
+            "data": {
+                "notes": [
+                    {"id": 1, "key": "naaa", "name": "A", "status": "draft"},
+                    {"id": 2, "key": "nbbb", "name": "B", "status": "published"},
+                ],
+                "totalCount": 2,
+                "isLastPage": True,
+            }
+        }
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(return_value=response)
+
+            await list_articles(create_mock_session())
+
+        cache = get_note_id_cache()
+        assert cache.get_id("naaa") == "1"
+        assert cache.get_id("nbbb") == "2"
+
+    @pytest.mark.asyncio
+    async def test_list_articles_writes_store_once(self, tmp_path: Path) -> None:
+        """A persisted cache is written once per list response, not once per article."""
+        from note_mcp.api.articles import list_articles
+
+        notes = [{"id": index, "key": f"n{index}", "name": "A", "status": "draft"} for index in range(1, 11)]
+        response: dict[str, Any] = {"data": {"notes": notes, "totalCount": 10, "isLastPage": True}}
+
+        with (
+            patch("note_mcp.api.id_cache._note_id_cache", NoteIdCache(tmp_path / "note_ids.json")),
+            patch("note_mcp.storage.save_json") as save_json,
+            patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class,
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(return_value=response)
+
+            await list_articles(create_mock_session())
+
+        save_json.assert_called_once()
+
+
+class TestResolveNumericNoteIdCache:
+    """Tests for _resolve_numeric_note_id cache usage."""
+
+    @pytest.mark.asyncio
+    async def test_cached_key_skips_request(self) -> None:
+        """A cached key resolves without any API call."""
+        get_note_id_cache().put("n1234567890ab", "12345")
+
+        with patch("note_mcp.api.images.NoteAPIClient") as mock_client_class:
+            result = await _resolve_numeric_note_id(create_mock_session(), "n1234567890ab")
+
+        assert result == "12345"
+        mock_client_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resolution_is_cached(self) -> None:
+        """The first resolution fetches once; later ones hit the cache."""
+        with patch("note_mcp.api.images.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(return_value={"data": {"id": 12345, "key": "n1234567890ab"}})
+
+            first = await _resolve_numeric_note_id(create_mock_session(), "n1234567890ab")
+            second = await _resolve_numeric_note_id(create_mock_session(), "n1234567890ab")
+
+        assert first == second == "12345"
+        assert mock_client.get.call_count == 1
+        assert get_note_id_cache().get_key("12345") == "n1234567890ab"
@@ -0,0 +1,145 @@
+"""Unit tests for caching and skipping HTML to Markdown conversion of fetched articles."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from note_mcp.api.articles import get_article_via_api, publish_article
+from note_mcp.api.markdown_cache import ConvertedMarkdownCache
+from note_mcp.api.search_index import ArticleSearchIndex
+from note_mcp.models import ArticleStatus, Session
+from note_mcp.utils.html_to_markdown import html_to_markdown
+
+
+def create_mock_session() -> Session:
+    """Create a mock session for testing."""
+    return Session(
+        cookies={"note_gql_auth_token": "token123", "_note_session_v5": "session456"},
+        user_id="user123",
+        username="testuser",
+        expires_at=int(time.time()) + 3600,
+        created_at=int(time.time()),
+    )
+
+
+def note_response(
+    updated_at: str = "2025-01-01T00:00:00+09:00", body: str = "<h2>見出し</h2><p>本文</p>"
+) -> dict[str, Any]:
+    """Build a /v3/notes response."""
+    return {
+        "data": {
+            "id": 123,
+            "key": "n1234567890ab",
+            "name": "タイトル",
+            "status": "draft",
+            "body": body,
+            "updated_at": updated_at,
+        }
+    }
+
+
+def patch_client(responses: list[dict[str, Any]]) -> Any:
+    """Patch NoteAPIClient in api.articles to return the GET responses in order."""
+    patcher = patch("note_mcp.api.articles.NoteAPIClient")
+    mock_client_class = patcher.start()
+    mock_client = AsyncMock()
+    mock_client_class.return_value = mock_client
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    mock_client.get = AsyncMock(side_effect=responses)
+    mock_client.put = AsyncMock(return_value={"data": {"result": True}})
+    return patcher
+
+
+class TestConvertedMarkdownCache:
+    """Tests for ConvertedMarkdownCache."""
+
+    def test_hit_requires_same_version_and_body(self) -> None:
+        """Entries match only the recorded updated_at and HTML."""
+        cache = ConvertedMarkdownCache()
+        cache.put("naaa", "t1", "<p>a</p>", "a")
+
+        assert cache.get("naaa", "t1", "<p>a</p>") == "a"
+        assert cache.get("naaa", "t2", "<p>a</p>") is None
+        assert cache.get("naaa", "t1", "<p>b</p>") is None
+        assert cache.get("nbbb", "t1", "<p>a</p>") is None
+
+    def test_new_version_replaces_old(self) -> None:
+        """Only the latest version of an article is kept."""
+        cache = ConvertedMarkdownCache()
+        cache.put("naaa", "t1", "<p>a</p>", "a")
+        cache.put("naaa", "t2", "<p>b</p>", "b")
+
+        assert len(cache) == 1
+        assert cache.get("naaa", "t1", "<p>a</p>") is None
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """The cache keeps at most max_entries articles."""
+        cache = ConvertedMarkdownCache(max_entries=2)
+        cache.put("naaa", "t", "a", "a")
+        cache.put("nbbb", "t", "b", "b")
+        cache.get("naaa", "t", "a")
+        cache.put("nccc", "t", "c", "c")
+
+        assert cache.get("naaa", "t", "a") == "a"
+        assert cache.get("nbbb", "t", "b") is None
+
+    def test_invalid_size(self) -> None:
+        """max_entries must be positive."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ConvertedMarkdownCache(max_entries=0)
+
+
+class TestGetArticleViaApiConversion:
+    """Tests for conversion caching and metadata-only fetches."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_article_is_converted_once(self, isolated_markdown_cache: ConvertedMarkdownCache) -> None:
+        """A second read of the same version reuses the Markdown."""
+        patcher = patch_client([note_response(), note_response(), note_response(updated_at="t2")])
+        try:
+            with patch("note_mcp.api.articles.html_to_markdown", wraps=html_to_markdown) as convert:
+                first = await get_article_via_api(create_mock_session(), "n1234567890ab")
+                second = await get_article_via_api(create_mock_session(), "n1234567890ab")
+                assert convert.call_count == 1
+                await get_article_via_api(create_mock_session(), "n1234567890ab")
+                assert convert.call_count == 2
+        finally:
+            patcher.stop()
+
+        assert first.body == second.body == "## 見出し\n\n本文"
+        assert len(isolated_markdown_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_metadata_only_skips_conversion(self, isolated_markdown_cache: ConvertedMarkdownCache) -> None:
+        """include_body=False returns metadata without converting the body."""
+        patcher = patch_client([note_response()])
+        try:
+            with patch("note_mcp.api.articles.html_to_markdown") as convert:
+                article = await get_article_via_api(create_mock_session(), "n1234567890ab", include_body=False)
+        finally:
+            patcher.stop()
+
+        convert.assert_not_called()
+        assert (article.id, article.key, article.title) == ("123", "n1234567890ab", "タイトル")
+        assert article.body == ""
+        assert len(isolated_markdown_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_publish_result_skips_conversion(self, isolated_search_index: ArticleSearchIndex) -> None:
+        """publish_article returns metadata and updates the indexed status without converting."""
+        isolated_search_index.add("n1234567890ab", "タイトル", [], "本文", ArticleStatus.DRAFT)
+        patcher = patch_client([note_response()])
+        try:
+            with patch("note_mcp.api.articles.html_to_markdown") as convert:
+                article = await publish_article(create_mock_session(), article_id="n1234567890ab")
+        finally:
+            patcher.stop()
+
+        convert.assert_not_called()
+        assert article.status == ArticleStatus.PUBLISHED
+        assert isolated_search_index.search("本文")[0].status == ArticleStatus.PUBLISHED
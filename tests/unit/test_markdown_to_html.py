@@ -1,6 +1,87 @@
 """Unit tests for Markdown conversion utility."""
 
-from note_mcp.utils.markdown_to_html import has_embed_url, markdown_to_html
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from note_mcp.utils.markdown_to_html import (
+    CachedBlock,
+    HtmlBlockCache,
+    _preprocess_markdown,
+    _render_note_html,
+    find_embed_urls,
+    markdown_to_html,
+)
+
+# Element UUIDs and placeholder embed keys, which differ between conversions
+_GENERATED_ID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|emb(?:tmp)?[0-9a-f]+")
+
+# Document exercising every conversion step
+_FULL_FEATURE_MARKDOWN = """[TOC]
+
+# 見出し1
+
+Setext見出し
+------------
+
+段落 **太字** ~~取り消し~~ `code ^5243`
+二行目
+
+->中央寄せ<-
+
+->右寄せ
+
+<-左寄せ
+
+^5243
+
+$GOOG
+
+https://www.youtube.com/watch?v=abc123
+
+![画像](https://example.com/a.png "キャプション")
+
+- 項目1
+- 項目2
+  - ネスト
+    1. 番号
+
+1. ゆるい
+
+2. リスト
+
+> 引用1
+> 引用2
+> — 出典 (https://example.com)
+
+> - 引用内リスト
+
+```python
+def f():
+    return "`x`"
+```
+
+    インデントされたコード
+
+---
+
+[TOC]
+
+最後の段落
+"""
+
+
+# Markdown inputs with the HTML produced by the regex-based converter (IDs replaced)
+_GOLDEN_DIR = Path(__file__).parent / "golden" / "markdown_to_html"
+_GOLDEN_UUID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+_GOLDEN_EMBED_KEY_PATTERN = re.compile(r'embedded-content-key="emb(?:tmp)?[0-9a-f]+"')
+
+
+def _strip_generated_ids(html: str) -> str:
+    """Replace generated IDs so that two conversions can be compared."""
+    return _GENERATED_ID_PATTERN.sub("ID", html)
 
 
 class TestMarkdownToHtml:
@@ -777,85 +858,47 @@ https://twitter.com/user/status/123"""
         assert "https://vimeo.com/123456" in result
 
 
-class TestHasEmbedUrl:
-    """has_embed_url関数のテスト"""
+class TestFindEmbedUrls:
+    """find_embed_urls関数のテスト"""
 
-    def test_youtube_url_detected(self) -> None:
-        """YouTubeのURLが検出される"""
-        assert has_embed_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ") is True
-        assert has_embed_url("https://youtu.be/dQw4w9WgXcQ") is True
+    def test_standalone_embed_urls_in_order(self) -> None:
+        """単独行の埋め込みURLが出現順に重複なく返される"""
+        content = (
+            "https://www.youtube.com/watch?v=abc\n\n"
+            "text https://x.com/user/status/1 inline\n\n"
+            "https://twitter.com/user/status/123\n\n"
+            "https://www.youtube.com/watch?v=abc\n\n"
+            "https://example.com/not-embed"
+        )
 
-    def test_twitter_url_detected(self) -> None:
-        """Twitter/XのURLが検出される"""
-        assert has_embed_url("https://twitter.com/user/status/123") is True
-        assert has_embed_url("https://x.com/user/status/123") is True
+        assert find_embed_urls(content) == [
+            "https://www.youtube.com/watch?v=abc",
+            "https://twitter.com/user/status/123",
+        ]
 
-    def test_note_url_detected(self) -> None:
-        """note.comのURLが検出される"""
-        assert has_embed_url("https://note.com/user/n/n123") is True
+    def test_code_blocks_are_ignored(self) -> None:
+        """コードブロック内のURLは返されない"""
+        content = "```\nhttps://www.youtube.com/watch?v=abc\n```"
 
-    def test_gist_url_detected(self) -> None:
-        """GitHub GistのURLが検出される"""
-        assert has_embed_url("https://gist.github.com/defunkt/2059") is True
-        assert has_embed_url("https://gist.github.com/user-name/abc123") is True
+        assert find_embed_urls(content) == []
 
-    def test_unsupported_url_not_detected(self) -> None:
-        """サポートされていないURLは検出されない"""
-        assert has_embed_url("https://vimeo.com/123456") is False
-        assert has_embed_url("https://example.com") is False
+    def test_stock_notation_included(self) -> None:
+        """株価記法はnoteマネーのURLとして返される"""
+        assert find_embed_urls("^5243\n\n$GOOG") == [
+            "https://money.note.com/companies/5243",
+            "https://money.note.com/us-companies/GOOG",
+        ]
 
-    def test_url_in_text_detected(self) -> None:
-        """テキスト内の埋め込みURLも検出される"""
-        content = """テスト文章です。
+    def test_matches_markdown_to_html_embeds(self) -> None:
+        """markdown_to_htmlが生成する埋め込みと一致する"""
+        import html
+        import re
 
-https://gist.github.com/defunkt/2059
+        content = "# Title\n\nhttps://zenn.dev/zenn/articles/markdown-guide\n\n^7203\n\n`https://youtu.be/abc`"
 
-テスト続きです。"""
-        assert has_embed_url(content) is True
-
-    def test_no_url_returns_false(self) -> None:
-        """URLがない場合はFalseを返す"""
-        assert has_embed_url("単なるテキスト") is False
-
-    def test_money_url_detected(self) -> None:
-        """noteマネーのURLが検出される"""
-        assert has_embed_url("https://money.note.com/companies/5243") is True
-        assert has_embed_url("https://money.note.com/us-companies/GOOG") is True
-        assert has_embed_url("https://money.note.com/indices/NKY") is True
-        assert has_embed_url("https://money.note.com/investments/0331418A") is True
-
-    def test_zenn_url_detected(self) -> None:
-        """Zenn.devのURLが検出される (Issue #222)"""
-        assert has_embed_url("https://zenn.dev/zenn/articles/markdown-guide") is True
-        assert has_embed_url("https://zenn.dev/user/articles/abc123") is True
-
-    def test_google_slides_url_detected(self) -> None:
-        """Google SlidesのURLが検出される (Issue #224)."""
-        # /edit suffix
-        assert (
-            has_embed_url("https://docs.google.com/presentation/d/1W543BSd_0cL-Y3p7eRn-JWvr2_Dfo7wZGKJp6RbP4Qw/edit")
-            is True
-        )
-        # /pub suffix
-        assert (
-            has_embed_url("https://docs.google.com/presentation/d/1W543BSd_0cL-Y3p7eRn-JWvr2_Dfo7wZGKJp6RbP4Qw/pub")
-            is True
-        )
-        # /view suffix
-        assert (
-            has_embed_url("https://docs.google.com/presentation/d/1W543BSd_0cL-Y3p7eRn-JWvr2_Dfo7wZGKJp6RbP4Qw/view")
-            is True
-        )
-        # /embed suffix
-        assert (
-            has_embed_url("https://docs.google.com/presentation/d/1W543BSd_0cL-Y3p7eRn-JWvr2_Dfo7wZGKJp6RbP4Qw/embed")
-            is True
-        )
+        converted = re.findall(r'data-src="([^"]+)"', markdown_to_html(content))
 
-    def test_speakerdeck_url_detected(self) -> None:
-        """SpeakerDeckのURLが検出される (Issue #223)."""
-        assert has_embed_url("https://speakerdeck.com/user/slide-name") is True
-        assert has_embed_url("https://speakerdeck.com/tomohisa/introducing-decider-pattern-with-event-sourcing") is True
+        assert find_embed_urls(content) == [html.unescape(url) for url in converted]
 
 
 class TestZennEmbedUrlConversion:
@@ -992,6 +1035,37 @@ $GOOG
         assert 'embedded-service="oembed"' not in result
 
 
+class TestPreprocessMarkdown:
+    """Tests for pre-processing TOC, stock and alignment notation with code protected once."""
+
+    def test_notation_in_code_is_preserved(self) -> None:
+        """コードブロック・インラインコード内の記法は変換されない."""
+        markdown = "[TOC]\n\n^5243\n\n->中央<-\n\n```\n[TOC]\n^5243\n->中央<-\n```\n\n`$GOOG` と `<-左`\n"
+
+        result = _preprocess_markdown(markdown)
+
+        assert result.count("[TOC]") == 1
+        assert result.count("^5243") == 1
+        assert "https://money.note.com/companies/5243" in result
+        assert "§§ALIGN_CENTER§§中央§§/ALIGN§§" in result
+        assert "```\n[TOC]\n^5243\n->中央<-\n```" in result
+        assert "`$GOOG` と `<-左`" in result
+
+    def test_placeholder_like_text_is_kept(self) -> None:
+        """プレースホルダーに似た本文はそのまま残る."""
+        markdown = "__PRE_99__ と __INIT__`code`\n"
+
+        assert _preprocess_markdown(markdown) == markdown
+
+    def test_inline_code_enclosing_fence_is_restored(self) -> None:
+        """フェンスを含むインラインコードも元に戻る."""
+        markdown = "`a ```b``` c`\n\n->右寄せ\n"
+
+        result = _preprocess_markdown(markdown)
+
+        assert result == "`a ```b``` c`\n\n§§ALIGN_RIGHT§§右寄せ§§/ALIGN§§\n"
+
+
 class TestGoogleSlidesEmbedUrlConversion:
     """Google Slidesプレゼンテーション埋め込みURL変換のテスト (Issue #224)."""
 
@@ -1059,3 +1133,225 @@ https://speakerdeck.com/tomohisa/introducing-decider-pattern-with-event-sourcing
         # 前後のテキストも保持される
         assert "テスト文章です" in result
         assert "テスト続きです" in result
+
+
+class TestIncrementalConversion:
+    """Tests for block-level conversion with the HTML block cache."""
+
+    @pytest.mark.parametrize(
+        "markdown",
+        [
+            _FULL_FEATURE_MARKDOWN,
+            "段落\n\n```py\nx = 1\ny = 2\n",
+            "```\nx\n",
+            "```\nx\n\n\n",
+            "段落\n\n```\nx\n```\n",
+            "```\nx\n```\ntail",
+            "~~~\nx\n~~~\n***",
+            "```\n[TOC]\n```\n[TOC]",
+            "```\ncode\n```\n  - c",
+        ],
+    )
+    def test_output_matches_full_conversion(self, markdown: str) -> None:
+        """Block-wise conversion produces the same HTML as converting the whole document."""
+        incremental = markdown_to_html(markdown)
+        full = markdown_to_html(markdown, incremental=False)
+
+        assert _strip_generated_ids(incremental) == _strip_generated_ids(full)
+
+    def test_cached_output_matches_full_conversion(self, isolated_html_block_cache: HtmlBlockCache) -> None:
+        """A conversion served from the cache still matches a full conversion."""
+        markdown_to_html(_FULL_FEATURE_MARKDOWN)
+        edited = _FULL_FEATURE_MARKDOWN.replace("最後の段落", "最後の段落（編集）")
+
+        incremental = markdown_to_html(edited)
+        full = markdown_to_html(edited, incremental=False)
+
+        assert len(isolated_html_block_cache) > 0
+        assert _strip_generated_ids(incremental) == _strip_generated_ids(full)
+
+    def test_only_changed_blocks_are_rendered(self) -> None:
+        """Unchanged blocks are reused from the cache."""
+        markdown_to_html("# 見出し\n\n段落1\n\n段落2")
+
+        with patch("note_mcp.utils.markdown_to_html._render_note_html", wraps=_render_note_html) as render:
+            markdown_to_html("# 見出し\n\n段落1（編集）\n\n段落2")
+
+        assert [call.args[0] for call in render.call_args_list] == ["段落1（編集）"]
+
+    def test_cached_blocks_get_new_ids_in_every_document(self) -> None:
+        """Blocks served from the cache never share element IDs or embed keys with other documents."""
+        markdown = "段落\n\nhttps://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        first = markdown_to_html(markdown)
+        second = markdown_to_html(markdown)
+
+        first_ids = re.findall(r'id="([^"]+)"', first)
+        second_ids = re.findall(r'id="([^"]+)"', second)
+        first_keys = re.findall(r'embedded-content-key="([^"]+)"', first)
+        second_keys = re.findall(r'embedded-content-key="([^"]+)"', second)
+        assert len(first_ids) == len(second_ids) == 2
+        assert not set(first_ids) & set(second_ids)
+        assert len(first_keys) == len(second_keys) == 1
+        assert first_keys != second_keys
+        assert _strip_generated_ids(first) == _strip_generated_ids(second)
+
+    def test_repeated_blocks_get_distinct_ids(self) -> None:
+        """A block occurring twice in a document is not shared from the cache."""
+        result = markdown_to_html("同じ段落\n\n同じ段落")
+
+        ids = re.findall(r'id="([^"]+)"', result)
+        assert len(ids) == 2
+        assert ids[0] != ids[1]
+
+    @pytest.mark.parametrize(
+        "markdown",
+        [
+            "[リンク][ref]\n\n段落\n\n[ref]: https://example.com",
+            "<div>\n\n段落\n\n</div>",
+        ],
+    )
+    def test_document_level_constructs_use_full_conversion(self, markdown: str) -> None:
+        """Reference definitions and raw HTML blocks disable block-wise conversion."""
+        with patch("note_mcp.utils.markdown_to_html._render_note_html", wraps=_render_note_html) as render:
+            result = markdown_to_html(markdown)
+
+        render.assert_called_once()
+        assert _strip_generated_ids(result) == _strip_generated_ids(markdown_to_html(markdown, incremental=False))
+
+    def test_reference_links_resolve(self) -> None:
+        """Links to reference definitions in other blocks are converted."""
+        result = markdown_to_html("[リンク][ref]\n\n[ref]: https://example.com")
+
+        assert '<a href="https://example.com">リンク</a>' in result
+
+
+class TestHtmlBlockCache:
+    """Tests for HtmlBlockCache."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """The cache keeps at most max_entries blocks."""
+        cache = HtmlBlockCache(max_entries=2)
+        cache.put("a", CachedBlock("<p>a</p>"))
+        cache.put("b", CachedBlock("<p>b</p>"))
+        assert cache.get("a") == CachedBlock("<p>a</p>")
+
+        cache.put("c", CachedBlock("<p>c</p>"))
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == CachedBlock("<p>a</p>")
+        assert cache.get("c") == CachedBlock("<p>c</p>")
+
+    def test_rejects_invalid_size(self) -> None:
+        """max_entries must be at least 1."""
+        with pytest.raises(ValueError, match="max_entries"):
+            HtmlBlockCache(max_entries=0)
+
+
+class TestStableIds:
+    """Tests for content-derived element IDs (stable_ids=True)."""
+
+    def test_same_markdown_gives_identical_html(self, isolated_html_block_cache: HtmlBlockCache) -> None:
+        """Two conversions of the same Markdown match byte for byte, without the cache."""
+        first = markdown_to_html(_FULL_FEATURE_MARKDOWN, stable_ids=True)
+        isolated_html_block_cache.clear()
+
+        second = markdown_to_html(_FULL_FEATURE_MARKDOWN, stable_ids=True)
+
+        assert second == first
+        assert _strip_generated_ids(first) == _strip_generated_ids(markdown_to_html(_FULL_FEATURE_MARKDOWN))
+
+    def test_unchanged_blocks_keep_ids_after_edit(self, isolated_html_block_cache: HtmlBlockCache) -> None:
+        """Editing or inserting a block leaves the IDs of the other blocks unchanged."""
+        first = markdown_to_html("# 見出し\n\n段落1\n\n段落2", stable_ids=True)
+        isolated_html_block_cache.clear()
+
+        second = markdown_to_html("新しい段落\n\n# 見出し\n\n段落1（編集）\n\n段落2", stable_ids=True)
+
+        first_ids = re.findall(r'id="([^"]+)"', first)
+        second_ids = re.findall(r'id="([^"]+)"', second)
+        assert second_ids[1] == first_ids[0]
+        assert second_ids[2] != first_ids[1]
+        assert second_ids[3] == first_ids[2]
+
+    def test_repeated_blocks_get_distinct_ids(self) -> None:
+        """Identical blocks are seeded with their occurrence number."""
+        result = markdown_to_html("同じ段落\n\n同じ段落", stable_ids=True)
+
+        ids = re.findall(r'id="([^"]+)"', result)
+        assert len(set(ids)) == 2
+
+    def test_full_conversion_is_deterministic(self) -> None:
+        """Documents converted as a whole are seeded with the document."""
+        markdown = "[リンク][ref]\n\n段落\n\n[ref]: https://example.com"
+
+        assert markdown_to_html(markdown, stable_ids=True) == markdown_to_html(markdown, stable_ids=True)
+        assert markdown_to_html(_FULL_FEATURE_MARKDOWN, incremental=False, stable_ids=True) == markdown_to_html(
+            _FULL_FEATURE_MARKDOWN, incremental=False, stable_ids=True
+        )
+
+
+class TestGoldenFiles:
+    """The token renderer reproduces the output of the former regex-based converter."""
+
+    @pytest.mark.parametrize("incremental", [True, False], ids=["incremental", "full"])
+    @pytest.mark.parametrize("markdown_file", sorted(_GOLDEN_DIR.glob("*.md")), ids=lambda path: path.stem)
+    def test_matches_golden_html(self, markdown_file: Path, incremental: bool) -> None:
+        """Output is byte-identical to the golden HTML apart from IDs and embed keys."""
+        expected = markdown_file.with_suffix(".html").read_text(encoding="utf-8")
+
+        result = markdown_to_html(markdown_file.read_text(encoding="utf-8"), incremental=incremental)
+
+        normalized = _GOLDEN_UUID_PATTERN.sub("{id}", result)
+        normalized = _GOLDEN_EMBED_KEY_PATTERN.sub('embedded-content-key="{key}"', normalized)
+        assert normalized + "\n" == expected
+
+
+class TestProseMirrorStructure:
+    """Nested block structures are rendered as well-formed note.com HTML."""
+
+    def test_nested_list_inside_list_item(self) -> None:
+        """A nested list follows the item's paragraph inside the same <li>."""
+        result = _strip_generated_ids(markdown_to_html("- a\n  - b\n- c"))
+
+        assert result == (
+            '<ul name="ID" id="ID"><li><p name="ID" id="ID">a</p>'
+            '<ul name="ID" id="ID"><li><p name="ID" id="ID">b</p></li></ul></li>'
+            '<li><p name="ID" id="ID">c</p></li></ul>'
+        )
+
+    def test_loose_list_items_are_not_double_wrapped(self) -> None:
+        """Paragraphs of loose list items are not wrapped in another <p>."""
+        result = _strip_generated_ids(markdown_to_html("1. a\n\n   b\n2. c"))
+
+        assert result == (
+            '<ol name="ID" id="ID"><li><p name="ID" id="ID">a</p><p name="ID" id="ID">b</p></li>'
+            '<li><p name="ID" id="ID">c</p></li></ol>'
+        )
+
+    def test_code_block_inside_blockquote_keeps_newlines(self) -> None:
+        """Line breaks inside a quoted code block are not turned into <br>."""
+        result = markdown_to_html("> ```\n> line1\n> line2\n> ```\n\n段落")
+
+        assert "line1\nline2\n</code></pre></blockquote>" in result
+        assert "<br>" not in result
+
+    def test_every_quoted_paragraph_keeps_line_breaks(self) -> None:
+        """Line breaks in later blockquote paragraphs become <br>, and the citation is found there."""
+        result = _strip_generated_ids(markdown_to_html("> 一段落目\n>\n> 二段落目\n> 続き\n> — 出典"))
+
+        assert result == (
+            '<figure name="ID" id="ID"><blockquote><p name="ID" id="ID">一段落目</p>'
+            '<p name="ID" id="ID">二段落目<br>続き</p></blockquote>'
+            "<figcaption>出典</figcaption></figure>"
+        )
+
+    def test_nested_blockquote(self) -> None:
+        """A blockquote inside a blockquote becomes a nested figure."""
+        result = _strip_generated_ids(markdown_to_html("> > 内側"))
+
+        assert result == (
+            '<figure name="ID" id="ID"><blockquote><figure name="ID" id="ID"><blockquote>'
+            '<p name="ID" id="ID">内側</p></blockquote><figcaption></figcaption></figure>'
+            "</blockquote><figcaption></figcaption></figure>"
+        )
@@ -0,0 +1,191 @@
+"""Unit tests for skipping unchanged update_article saves."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from note_mcp.api.articles import update_article, update_article_raw_html
+from note_mcp.api.save_cache import SavedContentCache, content_digest
+from note_mcp.models import Article, ArticleInput, ArticleStatus, ErrorCode, NoteAPIError, Session
+
+
+def create_mock_session() -> Session:
+    """Create a mock session for testing."""
+    return Session(
+        cookies={"note_gql_auth_token": "token123", "_note_session_v5": "session456"},
+        user_id="user123",
+        username="testuser",
+        expires_at=int(time.time()) + 3600,
+        created_at=int(time.time()),
+    )
+
+
+def saved_article() -> Article:
+    """Article returned by a draft_save."""
+    return Article(id="123", key="n1234567890ab", title="Title", body="<p>Body</p>", status=ArticleStatus.DRAFT)
+
+
+class TestContentDigest:
+    """Tests for content_digest."""
+
+    def test_tag_prefix_is_ignored(self) -> None:
+        """Tags with and without # hash the same."""
+        a = ArticleInput(title="T", body="B", tags=["#python"])
+        b = ArticleInput(title="T", body="B", tags=["python"])
+
+        assert content_digest(a) == content_digest(b)
+
+    def test_any_field_change_changes_digest(self) -> None:
+        """Title, tags and body all contribute to the digest."""
+        base = ArticleInput(title="T", body="B", tags=["x"])
+
+        assert content_digest(base) != content_digest(base.model_copy(update={"title": "T2"}))
+        assert content_digest(base) != content_digest(base.model_copy(update={"body": "B2"}))
+        assert content_digest(base) != content_digest(base.model_copy(update={"tags": ["y"]}))
+
+
+class TestSavedContentCache:
+    """Tests for SavedContentCache."""
+
+    def test_entry_is_reachable_by_key_and_id(self) -> None:
+        """A save recorded under the key also matches the numeric ID."""
+        cache = SavedContentCache()
+        cache.put("n1234567890ab", "digest", saved_article())
+
+        assert cache.get("n1234567890ab", "digest") == saved_article()
+        assert cache.get("123", "digest") == saved_article()
+        assert cache.get("123", "other") is None
+        assert len(cache) == 1
+
+    def test_forget_removes_all_aliases(self) -> None:
+        """Forgetting by ID also drops the key entry."""
+        cache = SavedContentCache()
+        cache.put("n1234567890ab", "digest", saved_article())
+
+        cache.forget("123")
+
+        assert cache.get("n1234567890ab", "digest") is None
+        assert len(cache) == 0
+
+
+class TestUpdateArticleSkip:
+    """Tests for the unchanged-content skip in update_article."""
+
+    @pytest.mark.asyncio
+    async def test_identical_update_makes_no_requests(self) -> None:
+        """A second identical update returns without resolving or saving."""
+        article_input = ArticleInput(title="Title", body="Body", tags=["tag"])
+        resolve = AsyncMock(return_value="123")
+        post = AsyncMock(return_value=saved_article())
+
+        with (
+            patch("note_mcp.api.articles._resolve_numeric_note_id", resolve),
+            patch("note_mcp.api.articles._execute_post", post),
+        ):
+            first = await update_article(create_mock_session(), "n1234567890ab", article_input)
+            second = await update_article(create_mock_session(), "n1234567890ab", article_input)
+            by_id = await update_article(create_mock_session(), "123", article_input)
+
+        assert not first.unchanged
+        assert second.unchanged and by_id.unchanged
+        assert second.model_copy(update={"unchanged": False}) == first
+        assert by_id == second
+        assert resolve.await_count == 1
+        assert post.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_content_is_saved(self) -> None:
+        """A different body is saved again."""
+        resolve = AsyncMock(return_value="123")
+        post = AsyncMock(return_value=saved_article())
+
+        with (
+            patch("note_mcp.api.articles._resolve_numeric_note_id", resolve),
+            patch("note_mcp.api.articles._execute_post", post),
+        ):
+            await update_article(create_mock_session(), "n1234567890ab", ArticleInput(title="Title", body="Body"))
+            await update_article(create_mock_session(), "n1234567890ab", ArticleInput(title="Title", body="Body 2"))
+
+        assert post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_force_saves_unchanged_content(self) -> None:
+        """force=True bypasses the skip."""
+        article_input = ArticleInput(title="Title", body="Body")
+        post = AsyncMock(return_value=saved_article())
+
+        with (
+            patch("note_mcp.api.articles._resolve_numeric_note_id", AsyncMock(return_value="123")),
+            patch("note_mcp.api.articles._execute_post", post),
+        ):
+            await update_article(create_mock_session(), "n1234567890ab", article_input)
+            await update_article(create_mock_session(), "n1234567890ab", article_input, force=True)
+
+        assert post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_embed_registration_is_retried(self) -> None:
+        """An update whose embed kept its placeholder key is saved again, retrying the registration."""
+        article_input = ArticleInput(title="Title", body="https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        post = AsyncMock(return_value=saved_article())
+        fetch = AsyncMock(
+            side_effect=[NoteAPIError(code=ErrorCode.API_ERROR, message="Embed failed"), ("embserver1", "<iframe>")]
+        )
+
+        with (
+            patch("note_mcp.api.articles._resolve_numeric_note_id", AsyncMock(return_value="123")),
+            patch("note_mcp.api.articles._execute_post", post),
+            patch("note_mcp.api.embeds.fetch_embed_key", fetch),
+        ):
+            await update_article(create_mock_session(), "n1234567890ab", article_input)
+            retried = await update_article(create_mock_session(), "n1234567890ab", article_input)
+            skipped = await update_article(create_mock_session(), "n1234567890ab", article_input)
+
+        assert fetch.await_count == 2
+        assert post.await_count == 2
+        assert 'embedded-content-key="embtmp' in post.await_args_list[0].kwargs["payload"]["body"]
+        assert 'embedded-content-key="embserver1"' in post.await_args_list[1].kwargs["payload"]["body"]
+        assert not retried.unchanged
+        assert skipped.unchanged
+
+    @pytest.mark.asyncio
+    async def test_raw_html_update_invalidates(self) -> None:
+        """Saving raw HTML (e.g. image insertion) makes the next update save again."""
+        article_input = ArticleInput(title="Title", body="Body")
+        post = AsyncMock(return_value=saved_article())
+
+        with (
+            patch("note_mcp.api.articles._resolve_numeric_note_id", AsyncMock(return_value="123")),
+            patch("note_mcp.api.articles._execute_post", post),
+        ):
+            await update_article(create_mock_session(), "n1234567890ab", article_input)
+            await update_article_raw_html(create_mock_session(), "n1234567890ab", "Title", "<p>Body</p><img>")
+            await update_article(create_mock_session(), "n1234567890ab", article_input)
+
+        assert post.await_count == 3
+
+
+class TestNoteUpdateArticleTool:
+    """Tests for the note_update_article skip message."""
+
+    @pytest.mark.asyncio
+    async def test_reports_skipped_update(self, mock_session: Session) -> None:
+        """An unchanged update says it was skipped."""
+        from note_mcp.server import note_update_article
+
+        with (
+            patch("note_mcp.server._session_manager") as mock_manager,
+            patch("note_mcp.api.articles._resolve_numeric_note_id", AsyncMock(return_value="123")),
+            patch("note_mcp.api.articles._execute_post", AsyncMock(return_value=saved_article())),
+        ):
+            mock_manager.load.return_value = mock_session
+            first = await note_update_article.fn("n1234567890ab", "Title", "Body")
+            second = await note_update_article.fn("n1234567890ab", "Title", "Body")
+            forced = await note_update_article.fn("n1234567890ab", "Title", "Body", force=True)
+
+        assert "記事を更新しました" in first
+        assert "スキップ" in second
+        assert "記事を更新しました" in forced
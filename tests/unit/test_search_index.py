@@ -0,0 +1,290 @@
+"""Unit tests for the local full-text search index."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from note_mcp.api.articles import (
+    create_draft,
+    delete_draft,
+    get_article_via_api,
+    update_article,
+    update_article_raw_html,
+)
+from note_mcp.api.mirror import MIRROR_ENV_VAR
+from note_mcp.api.search_index import (
+    ArticleSearchIndex,
+    _excerpt,
+    close_article_search_index,
+    get_article_search_index,
+    index_article,
+)
+from note_mcp.models import Article, ArticleInput, ArticleStatus, Session
+from note_mcp.storage import DATA_DIR_ENV_VAR
+
+
+def create_mock_session() -> Session:
+    """Create a mock session for testing."""
+    return Session(
+        cookies={"note_gql_auth_token": "token123", "_note_session_v5": "session456"},
+        user_id="user123",
+        username="testuser",
+        expires_at=int(time.time()) + 3600,
+        created_at=int(time.time()),
+    )
+
+
+class TestArticleSearchIndex:
+    """Tests for ArticleSearchIndex."""
+
+    def test_ranks_title_matches_first(self) -> None:
+        """A term in the title outranks the same term in the body."""
+        index = ArticleSearchIndex()
+        index.add("nbody", "日記", [], "今日はasyncioの話を書きました。", ArticleStatus.DRAFT)
+        index.add("ntitle", "asyncio入門", ["python"], "イベントループについて。", ArticleStatus.PUBLISHED)
+        index.add("nother", "料理", [], "カレーの作り方", ArticleStatus.DRAFT)
+
+        hits = index.search("asyncio")
+
+        assert [hit.key for hit in hits] == ["ntitle", "nbody"]
+        assert hits[0].status == ArticleStatus.PUBLISHED
+        assert hits[0].score > hits[1].score
+        assert "[asyncio]" in hits[1].snippet
+
+    def test_japanese_substring_and_all_terms(self) -> None:
+        """Japanese substrings match and every term must occur."""
+        index = ArticleSearchIndex()
+        index.add("na", "メモ", ["非同期"], "Pythonで非同期処理を書く方法", ArticleStatus.DRAFT)
+        index.add("nb", "メモ", [], "Rustで非同期処理を書く方法", ArticleStatus.DRAFT)
+
+        assert {hit.key for hit in index.search("非同期処理")} == {"na", "nb"}
+        assert [hit.key for hit in index.search("非同期処理 python")] == ["na"]
+
+    def test_short_terms(self) -> None:
+        """Terms shorter than a trigram are matched by substring scan."""
+        index = ArticleSearchIndex()
+        index.add("na", "Go言語", [], "並行処理", ArticleStatus.DRAFT)
+        index.add("nb", "Python", [], "並行処理", ArticleStatus.DRAFT)
+
+        assert [hit.key for hit in index.search("go")] == ["na"]
+        assert [hit.key for hit in index.search("並行 go")] == ["na"]
+
+    def test_reindex_replaces_entry(self) -> None:
+        """Indexing a key again replaces its content."""
+        index = ArticleSearchIndex()
+        index.add("na", "旧タイトル", [], "古い本文", ArticleStatus.PUBLISHED)
+
+        index.add("na", "新タイトル", [], "新しい本文")
+
+        assert len(index) == 1
+        assert index.search("旧タイトル") == []
+        hits = index.search("新タイトル")
+        assert [hit.key for hit in hits] == ["na"]
+        assert hits[0].status == ArticleStatus.PUBLISHED
+
+    def test_query_syntax_is_literal(self) -> None:
+        """FTS5 operators and quotes in queries are treated as text."""
+        index = ArticleSearchIndex()
+        index.add("na", 'He said "hello" OR NOT', [], "", ArticleStatus.DRAFT)
+
+        assert [hit.key for hit in index.search('"hello"')] == ["na"]
+        assert index.search("") == []
+
+    def test_excerpt_marks_first_match(self) -> None:
+        """Excerpts are single-line and bracket the match."""
+        body = "前置き" * 20 + "\n\n本題のキーワードがここにあります\n" + "後書き" * 20
+
+        excerpt = _excerpt(body, ["キーワード"])
+
+        assert "[キーワード]" in excerpt
+        assert "\n" not in excerpt
+        assert excerpt.startswith("…") and excerpt.endswith("…")
+
+
+class TestAccountBinding:
+    """Tests for per-account search indexes."""
+
+    def test_discards_index_of_another_account(self, tmp_path: Path) -> None:
+        """Reopening a stored index for a different account starts empty."""
+        path = tmp_path / "search_index.db"
+        first = ArticleSearchIndex(path, "user123")
+        first.add("naaa", "型ヒント入門", [], "", ArticleStatus.DRAFT)
+        first.close()
+
+        other = ArticleSearchIndex(path, "user456")
+        assert len(other) == 0
+        other.close()
+
+    def test_one_file_per_account(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With the mirror enabled, each account's index is stored separately."""
+        monkeypatch.setenv(MIRROR_ENV_VAR, "1")
+        monkeypatch.setenv(DATA_DIR_ENV_VAR, str(tmp_path))
+
+        index_article("user456", "naaa", "型ヒント入門", [], "本文")
+        index = get_article_search_index("user789")
+
+        assert index is not None
+        assert index.path == tmp_path / "search_index-user789.db"
+        assert index.search("型ヒント") == []
+        reopened = get_article_search_index("user456")
+        assert reopened is not None
+        assert [hit.key for hit in reopened.search("型ヒント")] == ["naaa"]
+        close_article_search_index()
+
+
+class TestIncrementalIndexing:
+    """Tests for index updates from article operations."""
+
+    @pytest.mark.asyncio
+    async def test_fetched_article_is_indexed(self, isolated_search_index: ArticleSearchIndex) -> None:
+        """get_article_via_api indexes the Markdown body."""
+        response = {
+            "data": {
+                "id": 1,
+                "key": "naaa",
+                "name": "検索テスト",
+                "status": "draft",
+                "body": "<p>全文検索の本文</p>",
+            }
+        }
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(return_value=response)
+
+            await get_article_via_api(create_mock_session(), "naaa")
+
+        assert [hit.key for hit in isolated_search_index.search("全文検索")] == ["naaa"]
+
+    @pytest.mark.asyncio
+    async def test_created_and_updated_articles_are_indexed(self, isolated_search_index: ArticleSearchIndex) -> None:
+        """create_draft and update_article index the submitted Markdown."""
+        create_response = {"data": {"id": 123, "key": "naaa"}}
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.post = AsyncMock(side_effect=[create_response, {"data": {"result": True}}])
+
+            await create_draft(create_mock_session(), ArticleInput(title="最初の題", body="最初の本文", tags=["tag1"]))
+
+        assert [hit.key for hit in isolated_search_index.search("最初の本文")] == ["naaa"]
+
+        with (
+            patch("note_mcp.api.articles._resolve_numeric_note_id", AsyncMock(return_value="123")),
+            patch(
+                "note_mcp.api.articles._execute_post",
+                AsyncMock(
+                    return_value=Article(id="123", key="naaa", title="次の題", body="", status=ArticleStatus.DRAFT)
+                ),
+            ),
+        ):
+            await update_article(create_mock_session(), "naaa", ArticleInput(title="次の題", body="更新後の本文"))
+
+        assert isolated_search_index.search("最初の本文") == []
+        assert [hit.key for hit in isolated_search_index.search("更新後の本文")] == ["naaa"]
+
+    @pytest.mark.asyncio
+    async def test_raw_html_update_keeps_indexed_body(self, isolated_search_index: ArticleSearchIndex) -> None:
+        """update_article_raw_html refreshes title and tags without converting the HTML."""
+        isolated_search_index.add("naaa", "元の題", [], "画像を挿入する本文", ArticleStatus.DRAFT)
+
+        with (
+            patch("note_mcp.api.articles._resolve_numeric_note_id", AsyncMock(return_value="123")),
+            patch(
+                "note_mcp.api.articles._execute_post",
+                AsyncMock(
+                    return_value=Article(id="123", key="naaa", title="新しい題", body="", status=ArticleStatus.DRAFT)
+                ),
+            ),
+            patch("note_mcp.api.articles.html_to_markdown") as convert,
+        ):
+            await update_article_raw_html(
+                create_mock_session(), "naaa", "新しい題", "<p>画像を挿入する本文</p><figure></figure>", ["tag1"]
+            )
+
+        convert.assert_not_called()
+        hits = isolated_search_index.search("画像を挿入")
+        assert [(hit.key, hit.title) for hit in hits] == [("naaa", "新しい題")]
+        assert [hit.key for hit in isolated_search_index.search("tag1")] == ["naaa"]
+
+    @pytest.mark.asyncio
+    async def test_deleted_article_is_removed(self, isolated_search_index: ArticleSearchIndex) -> None:
+        """delete_draft removes the article from the index."""
+        isolated_search_index.add("naaa", "削除予定", [], "", ArticleStatus.DRAFT)
+        response = {"data": {"id": 1, "key": "naaa", "name": "削除予定", "status": "draft"}}
+
+        with patch("note_mcp.api.articles.NoteAPIClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.get = AsyncMock(return_value=response)
+            mock_client.delete = AsyncMock(return_value={})
+
+            await delete_draft(create_mock_session(), "naaa", confirm=True)
+
+        assert len(isolated_search_index) == 0
+
+
+class TestNoteSearchArticlesTool:
+    """Tests for the note_search_articles MCP tool."""
+
+    @pytest.mark.asyncio
+    async def test_returns_ranked_keys_and_snippets(self, isolated_search_index: ArticleSearchIndex) -> None:
+        """Hits are listed with key, status and snippet."""
+        from note_mcp.server import note_search_articles
+
+        isolated_search_index.add("naaa", "型ヒント入門", [], "Pythonの型ヒントを解説します", ArticleStatus.DRAFT)
+
+        with patch("note_mcp.server._session_manager.load", return_value=create_mock_session()):
+            result = await note_search_articles.fn("型ヒント")
+
+        assert "[下書き] 型ヒント入門 (キー: naaa)" in result
+        assert "[型ヒント]" in result
+
+    @pytest.mark.asyncio
+    async def test_no_hits(self) -> None:
+        """An unmatched query says so."""
+        from note_mcp.server import note_search_articles
+
+        with patch("note_mcp.server._session_manager.load", return_value=create_mock_session()):
+            result = await note_search_articles.fn("存在しない語句")
+
+        assert "見つかりませんでした" in result
+
+    @pytest.mark.asyncio
+    async def test_requires_session(self, isolated_search_index: ArticleSearchIndex) -> None:
+        """Without a valid session nothing is searched."""
+        from note_mcp.server import note_search_articles
+
+        isolated_search_index.add("naaa", "型ヒント入門", [], "", ArticleStatus.DRAFT)
+
+        with patch("note_mcp.server._session_manager.load", return_value=None):
+            result = await note_search_articles.fn("型ヒント")
+
+        assert "セッションが無効です" in result
+        assert "naaa" not in result
+
+    @pytest.mark.asyncio
+    async def test_other_account_does_not_see_articles(self, isolated_search_index: ArticleSearchIndex) -> None:
+        """Another account searches its own index, and logout closes the index."""
+        from note_mcp.server import note_logout, note_search_articles
+
+        isolated_search_index.add("naaa", "型ヒント入門", [], "", ArticleStatus.DRAFT)
+        other = create_mock_session().model_copy(update={"user_id": "user456"})
+
+        with patch("note_mcp.server._session_manager.load", return_value=other):
+            result = await note_search_articles.fn("型ヒント")
+        with patch("note_mcp.server._session_manager.clear"):
+            await note_logout.fn()
+
+        assert "見つかりませんでした" in result
+        assert get_article_search_index("user123") is not isolated_search_index
@@ -127,7 +127,7 @@ class TestNoteCreateFromFile:
         with (
             patch("note_mcp.server._session_manager") as mock_session_manager,
             patch("note_mcp.server.parse_markdown_file") as mock_parse,
-            patch("note_mcp.server.create_draft", new_callable=AsyncMock) as mock_create,
+            patch("note_mcp.server.create_article_entry", new_callable=AsyncMock) as mock_create,
             patch("note_mcp.server.upload_body_image", new_callable=AsyncMock) as mock_upload,
             patch("note_mcp.server.update_article", new_callable=AsyncMock) as mock_update,
         ):
@@ -164,11 +164,11 @@ class TestNoteCreateFromFile:
             assert "アップロードした画像: 1件" in result
 
     @pytest.mark.asyncio
-    async def test_no_update_when_no_images_uploaded(
+    async def test_body_saved_once_when_no_images_uploaded(
         self,
         tmp_path: Path,
     ) -> None:
-        """update_article should not be called when no images are uploaded."""
+        """Without images, the body is still saved exactly once, unchanged."""
         # Create a test markdown file without images
         md_file = tmp_path / "test.md"
         md_file.write_text("# Test\n\nNo images here.")
@@ -191,7 +191,7 @@ class TestNoteCreateFromFile:
         with (
             patch("note_mcp.server._session_manager") as mock_session_manager,
             patch("note_mcp.server.parse_markdown_file") as mock_parse,
-            patch("note_mcp.server.create_draft", new_callable=AsyncMock) as mock_create,
+            patch("note_mcp.server.create_article_entry", new_callable=AsyncMock) as mock_create,
             patch("note_mcp.server.update_article", new_callable=AsyncMock) as mock_update,
         ):
             mock_session_manager.load.return_value = mock_session
@@ -204,8 +204,9 @@ class TestNoteCreateFromFile:
             fn = note_create_from_file.fn
             result = await fn(str(md_file), upload_images=True)
 
-            # update_article should NOT be called when no images uploaded
-            mock_update.assert_not_called()
+            # The body is saved by a single update_article call
+            mock_update.assert_called_once()
+            assert mock_update.call_args[0][2].body == "No images here."
 
             # Verify the result indicates success without image info
             assert "✅" in result
@@ -251,8 +252,9 @@ class TestNoteCreateFromFile:
         with (
             patch("note_mcp.server._session_manager") as mock_session_manager,
             patch("note_mcp.server.parse_markdown_file") as mock_parse,
-            patch("note_mcp.server.create_draft", new_callable=AsyncMock) as mock_create,
+            patch("note_mcp.server.create_article_entry", new_callable=AsyncMock) as mock_create,
             patch("note_mcp.server.upload_eyecatch_image", new_callable=AsyncMock) as mock_upload_eyecatch,
+            patch("note_mcp.server.update_article", new_callable=AsyncMock),
         ):
             mock_session_manager.load.return_value = mock_session
             mock_parse.return_value = mock_parsed
@@ -305,8 +307,9 @@ class TestNoteCreateFromFile:
         with (
             patch("note_mcp.server._session_manager") as mock_session_manager,
             patch("note_mcp.server.parse_markdown_file") as mock_parse,
-            patch("note_mcp.server.create_draft", new_callable=AsyncMock) as mock_create,
+            patch("note_mcp.server.create_article_entry", new_callable=AsyncMock) as mock_create,
             patch("note_mcp.server.upload_eyecatch_image", new_callable=AsyncMock) as mock_upload_eyecatch,
+            patch("note_mcp.server.update_article", new_callable=AsyncMock),
         ):
             mock_session_manager.load.return_value = mock_session
             mock_parse.return_value = mock_parsed
@@ -355,8 +358,9 @@ class TestNoteCreateFromFile:
         with (
             patch("note_mcp.server._session_manager") as mock_session_manager,
             patch("note_mcp.server.parse_markdown_file") as mock_parse,
-            patch("note_mcp.server.create_draft", new_callable=AsyncMock) as mock_create,
+            patch("note_mcp.server.create_article_entry", new_callable=AsyncMock) as mock_create,
             patch("note_mcp.server.upload_eyecatch_image", new_callable=AsyncMock) as mock_upload_eyecatch,
+            patch("note_mcp.server.update_article", new_callable=AsyncMock),
         ):
             mock_session_manager.load.return_value = mock_session
             mock_parse.return_value = mock_parsed
@@ -406,8 +410,9 @@ class TestNoteCreateFromFile:
         with (
             patch("note_mcp.server._session_manager") as mock_session_manager,
             patch("note_mcp.server.parse_markdown_file") as mock_parse,
-            patch("note_mcp.server.create_draft", new_callable=AsyncMock) as mock_create,
+            patch("note_mcp.server.create_article_entry", new_callable=AsyncMock) as mock_create,
             patch("note_mcp.server.upload_eyecatch_image", new_callable=AsyncMock) as mock_upload_eyecatch,
+            patch("note_mcp.server.update_article", new_callable=AsyncMock),
         ):
             mock_session_manager.load.return_value = mock_session
             mock_parse.return_value = mock_parsed
@@ -428,6 +433,225 @@ class TestNoteCreateFromFile:
             assert "Server error" in result
 
 
+class TestNoteCreateFromFileParallelUploads:
+    """Tests for concurrent image uploads in note_create_from_file."""
+
+    @staticmethod
+    def _make_images(tmp_path: Path, count: int) -> list[LocalImage]:
+        images = []
+        for i in range(count):
+            image_file = tmp_path / f"img{i}.png"
+            image_file.write_bytes(b"fake png data")
+            images.append(LocalImage(markdown_path=f"./img{i}.png", absolute_path=image_file))
+        return images
+
+    @pytest.mark.asyncio
+    async def test_uploads_run_concurrently_within_limit(self, tmp_path: Path) -> None:
+        """Body images and the eyecatch overlap, up to IMAGE_UPLOAD_CONCURRENCY at once."""
+        import asyncio
+
+        from note_mcp.server import IMAGE_UPLOAD_CONCURRENCY, note_create_from_file
+
+        images = self._make_images(tmp_path, 8)
+        eyecatch = tmp_path / "header.png"
+        eyecatch.write_bytes(b"fake png data")
+        body = "\n".join(f"![img]({img.markdown_path})" for img in images)
+
+        in_flight: set[str] = set()
+        max_in_flight = 0
+        eyecatch_overlapped = False
+
+        async def fake_upload(_session: object, file_path: str, _article_id: str) -> Image:
+            nonlocal max_in_flight, eyecatch_overlapped
+            in_flight.add(file_path)
+            max_in_flight = max(max_in_flight, len(in_flight))
+            await asyncio.sleep(0.01)
+            if str(eyecatch) in in_flight and len(in_flight) > 1:
+                eyecatch_overlapped = True
+            in_flight.discard(file_path)
+            return Image(
+                key="k",
+                url=f"https://assets.st-note.com/{Path(file_path).name}",
+                original_path=file_path,
+                uploaded_at=1234567890,
+                image_type=ImageType.BODY,
+            )
+
+        with (
+            patch("note_mcp.server._session_manager") as mock_session_manager,
+            patch("note_mcp.server.parse_markdown_file") as mock_parse,
+            patch("note_mcp.server.create_article_entry", new_callable=AsyncMock) as mock_create,
+            patch("note_mcp.server.upload_body_image", side_effect=fake_upload),
+            patch("note_mcp.server.upload_eyecatch_image", side_effect=fake_upload),
+            patch("note_mcp.server.update_article", new_callable=AsyncMock) as mock_update,
+        ):
+            mock_session_manager.load.return_value = MagicMock()
+            mock_parse.return_value = ParsedArticle(
+                title="Test", body=body, tags=[], local_images=images, eyecatch=eyecatch
+            )
+            mock_create.return_value = Article(
+                id="123456789", key="n1234567890ab", title="Test", status=ArticleStatus.DRAFT, body=""
+            )
+
+            result = await note_create_from_file.fn(str(tmp_path / "test.md"), upload_images=True)
+
+        assert max_in_flight == IMAGE_UPLOAD_CONCURRENCY
+        assert eyecatch_overlapped
+        assert "アップロードした画像: 8件" in result
+        assert "アイキャッチ画像: アップロード完了" in result
+
+        updated_body = mock_update.call_args[0][2].body
+        for i in range(8):
+            assert f"(https://assets.st-note.com/img{i}.png)" in updated_body
+        assert "./img" not in updated_body
+
+    @pytest.mark.asyncio
+    async def test_failures_reported_per_image(self, tmp_path: Path) -> None:
+        """A failed upload is reported without affecting the others."""
+        from note_mcp.server import note_create_from_file
+
+        images = self._make_images(tmp_path, 3)
+        images.append(LocalImage(markdown_path="./missing.png", absolute_path=tmp_path / "missing.png"))
+        body = "\n".join(f"![img]({img.markdown_path})" for img in images)
+
+        async def fake_upload(_session: object, file_path: str, _article_id: str) -> Image:
+            if file_path.endswith("img1.png"):
+                raise NoteAPIError(ErrorCode.API_ERROR, "Upload rejected")
+            return Image(
+                key="k",
+                url=f"https://assets.st-note.com/{Path(file_path).name}",
+                original_path=file_path,
+                uploaded_at=1234567890,
+                image_type=ImageType.BODY,
+            )
+
+        with (
+            patch("note_mcp.server._session_manager") as mock_session_manager,
+            patch("note_mcp.server.parse_markdown_file") as mock_parse,
+            patch("note_mcp.server.create_article_entry", new_callable=AsyncMock) as mock_create,
+            patch("note_mcp.server.upload_body_image", side_effect=fake_upload),
+            patch("note_mcp.server.update_article", new_callable=AsyncMock) as mock_update,
+        ):
+            mock_session_manager.load.return_value = MagicMock()
+            mock_parse.return_value = ParsedArticle(title="Test", body=body, tags=[], local_images=images)
+            mock_create.return_value = Article(
+                id="123456789", key="n1234567890ab", title="Test", status=ArticleStatus.DRAFT, body=""
+            )
+
+            result = await note_create_from_file.fn(str(tmp_path / "test.md"), upload_images=True)
+
+        assert "アップロードした画像: 2件" in result
+        assert "⚠️ 画像アップロード失敗: 2件" in result
+        assert "./img1.png: Upload rejected" in result
+        assert "./missing.png: ファイルが見つかりません" in result
+
+        updated_body = mock_update.call_args[0][2].body
+        assert "(./img1.png)" in updated_body
+        assert "(https://assets.st-note.com/img2.png)" in updated_body
+
+    @pytest.mark.asyncio
+    async def test_duplicate_paths_uploaded_once(self, tmp_path: Path) -> None:
+        """An image referenced twice is uploaded once and both references are rewritten."""
+        from note_mcp.server import note_create_from_file
+
+        images = self._make_images(tmp_path, 1) * 2
+        body = "![a](./img0.png)\n\n![b](./img0.png)"
+
+        with (
+            patch("note_mcp.server._session_manager") as mock_session_manager,
+            patch("note_mcp.server.parse_markdown_file") as mock_parse,
+            patch("note_mcp.server.create_article_entry", new_callable=AsyncMock) as mock_create,
+            patch("note_mcp.server.upload_body_image", new_callable=AsyncMock) as mock_upload,
+            patch("note_mcp.server.update_article", new_callable=AsyncMock) as mock_update,
+        ):
+            mock_session_manager.load.return_value = MagicMock()
+            mock_parse.return_value = ParsedArticle(title="Test", body=body, tags=[], local_images=images)
+            mock_create.return_value = Article(
+                id="123456789", key="n1234567890ab", title="Test", status=ArticleStatus.DRAFT, body=""
+            )
+            mock_upload.return_value = Image(
+                key="k",
+                url="https://assets.st-note.com/img0.png",
+                original_path=str(images[0].absolute_path),
+                uploaded_at=1234567890,
+                image_type=ImageType.BODY,
+            )
+
+            await note_create_from_file.fn(str(tmp_path / "test.md"), upload_images=True)
+
+        mock_upload.assert_called_once()
+        updated_body = mock_update.call_args[0][2].body
+        assert updated_body.count("(https://assets.st-note.com/img0.png)") == 2
+
+
+class TestNoteCreateFromFileSingleSave:
+    """Tests for the single draft_save pipeline in note_create_from_file."""
+
+    @pytest.mark.asyncio
+    async def test_entry_created_then_body_saved_once(self, tmp_path: Path) -> None:
+        """The entry is created without body, and the final body is saved once."""
+        from note_mcp.server import note_create_from_file
+
+        image_file = tmp_path / "a.png"
+        image_file.write_bytes(b"fake png data")
+        body = "![a](./a.png)\n\nhttps://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        call_order: list[str] = []
+
+        async def fake_create(_session: object, _input: object) -> Article:
+            call_order.append("create")
+            return Article(id="123456789", key="n1234567890ab", title="Test", status=ArticleStatus.DRAFT, body="")
+
+        async def fake_upload(_session: object, file_path: str, _article_id: str) -> Image:
+            call_order.append("upload")
+            return Image(
+                key="k",
+                url="https://assets.st-note.com/a.png",
+                original_path=file_path,
+                uploaded_at=1234567890,
+                image_type=ImageType.BODY,
+            )
+
+        async def fake_prefetch(_session: object, urls: list[str], article_key: str) -> None:
+            call_order.append("prefetch")
+            assert urls == ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"]
+            assert article_key == "n1234567890ab"
+
+        async def fake_update(_session: object, _article_id: str, _input: object) -> Article:
+            call_order.append("update")
+            return Article(id="123456789", key="n1234567890ab", title="Test", status=ArticleStatus.DRAFT, body="")
+
+        with (
+            patch("note_mcp.server._session_manager") as mock_session_manager,
+            patch("note_mcp.server.parse_markdown_file") as mock_parse,
+            patch("note_mcp.server.create_draft", new_callable=AsyncMock) as mock_create_draft,
+            patch("note_mcp.server.create_article_entry", side_effect=fake_create),
+            patch("note_mcp.server.upload_body_image", side_effect=fake_upload),
+            patch("note_mcp.server.prefetch_embed_keys", side_effect=fake_prefetch),
+            patch("note_mcp.server.update_article", side_effect=fake_update) as mock_update,
+        ):
+            mock_session_manager.load.return_value = MagicMock()
+            mock_parse.return_value = ParsedArticle(
+                title="Test",
+                body=body,
+                tags=["tag"],
+                local_images=[LocalImage(markdown_path="./a.png", absolute_path=image_file)],
+            )
+
+            result = await note_create_from_file.fn(str(tmp_path / "test.md"), upload_images=True)
+
+        assert "✅" in result
+        mock_create_draft.assert_not_called()
+        assert call_order[0] == "create"
+        assert sorted(call_order[1:3]) == ["prefetch", "upload"]
+        assert call_order[3:] == ["update"]
+
+        saved_input = mock_update.call_args[0][2]
+        assert (
+            saved_input.body == "![a](https://assets.st-note.com/a.png)\n\nhttps://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        )
+        assert saved_input.tags == ["tag"]
+
+
 class TestNotePublishArticle:
     """Tests for note_publish_article function."""
 
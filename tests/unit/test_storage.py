@@ -0,0 +1,63 @@
+"""Unit tests for the data directory and JSON file helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from note_mcp.storage import DATA_DIR_ENV_VAR, account_data_file, data_file, get_data_dir, load_json_object, save_json
+
+
+class TestDataDir:
+    """Tests for get_data_dir and data_file."""
+
+    def test_env_var_overrides_data_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """NOTE_MCP_DATA_DIR selects the data directory."""
+        monkeypatch.setenv(DATA_DIR_ENV_VAR, str(tmp_path))
+
+        assert get_data_dir() == tmp_path
+
+    def test_data_file_requires_enable_flag(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Optional stores are only located when their variable is "1"."""
+        monkeypatch.setenv(DATA_DIR_ENV_VAR, str(tmp_path))
+        monkeypatch.delenv("NOTE_MCP_TEST_STORE", raising=False)
+
+        assert data_file("NOTE_MCP_TEST_STORE", "store.json") is None
+
+        monkeypatch.setenv("NOTE_MCP_TEST_STORE", "1")
+        assert data_file("NOTE_MCP_TEST_STORE", "store.json") == tmp_path / "store.json"
+
+    def test_account_data_file_names_the_account(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Account stores get one file per account, with unsafe characters replaced."""
+        monkeypatch.setenv(DATA_DIR_ENV_VAR, str(tmp_path))
+        monkeypatch.setenv("NOTE_MCP_TEST_STORE", "1")
+
+        assert account_data_file("NOTE_MCP_TEST_STORE", "store.db", "12345") == tmp_path / "store-12345.db"
+        assert account_data_file("NOTE_MCP_TEST_STORE", "store.db", "../x") == tmp_path / "store-___x.db"
+
+        monkeypatch.delenv("NOTE_MCP_TEST_STORE")
+        assert account_data_file("NOTE_MCP_TEST_STORE", "store.db", "12345") is None
+
+
+class TestJsonStore:
+    """Tests for load_json_object and save_json."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Saved objects load back unchanged, creating parent directories."""
+        path = tmp_path / "nested" / "store.json"
+
+        save_json(path, {"key": ["value", None]}, "test store")
+
+        assert load_json_object(path, "test store") == {"key": ["value", None]}
+
+    def test_missing_or_invalid_files_are_ignored(self, tmp_path: Path) -> None:
+        """Missing files, broken JSON and non-objects load as None."""
+        broken = tmp_path / "broken.json"
+        broken.write_text("{not json", encoding="utf-8")
+        array = tmp_path / "array.json"
+        array.write_text("[1, 2]", encoding="utf-8")
+
+        assert load_json_object(tmp_path / "missing.json", "test store") is None
+        assert load_json_object(broken, "test store") is None
+        assert load_json_object(array, "test store") is None
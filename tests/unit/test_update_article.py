@@ -75,6 +75,8 @@ class TestUpdateArticleIdResolution:
             post_call = mock_client.post.call_args
             assert "/v1/text_notes/draft_save" in post_call[0][0]
             assert "id=12345" in post_call[0][0]
+            # draft_save opts in to retries (POST is not retried by default)
+            assert post_call[1]["retry"] is True
 
             # Should NOT call /v3/notes/ (GET) to fetch article key
             # because there are no embeds to resolve
@@ -189,7 +191,7 @@ class TestUpdateArticleIdResolution:
             result = await update_article(session, "12345", article_input)
 
             # Should call get_article_via_api to fetch article key
-            mock_get_article.assert_called_once_with(session, "12345")
+            mock_get_article.assert_called_once_with(session, "12345", include_body=False)
 
             # Should call POST once (with resolved embeds)
             assert mock_client.post.call_count == 1